@@ -177,10 +177,11 @@ class AiTextModel(AiModel):
         if not self.is_loaded():
             raise RuntimeError("Model not loaded. Call load() first.")
         
-        # Perform prediction
+        # Perform prediction. A single text needs no padding: the pooling is masked, so padding to max_length
+        # only adds attention work over pad tokens without changing the result.
         encoded = self.tokenizer(
             text,
-            padding='max_length',
+            padding=False,
             truncation=True,
             max_length=self.max_length,
             return_tensors='pt'
@@ -0,0 +1,71 @@
+from django.apps import AppConfig
+from threading import Thread
+import logging
+import os
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def _is_serving() -> bool:
+    """
+    Check whether this process serves requests: a gunicorn worker, or runserver's serving process (the autoreloader's
+    child, or the only process with --noreload). Management commands such as migrate and the test suite are not.
+
+    :return: True if this process serves requests
+    """
+    if 'gunicorn' in os.path.basename(sys.argv[0]):
+        return True
+    if len(sys.argv) > 1 and sys.argv[1] == 'runserver':
+        return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in sys.argv
+    return False
+
+
+class CoreAppConfig(AppConfig):
+    """
+    Application configuration for the Detective AI backend.
+
+    :author: Siyabonga Madondo, Ethan Ngwetjana, Lindokuhle Mdlalose
+    :version: 16/10/2026
+    """
+    name = 'app'
+
+    def ready(self):
+        """
+        Warm up process-wide state once the app registry is ready so the first request doesn't pay for it,
+        and connect the signal handlers that keep cached submission statistics fresh.
+        """
+        from app import signals  # noqa: F401
+        from app.services.report_service import ReportService
+        ReportService.warm_up()
+
+        # Loading the detection models takes a while, so server processes do it in the background while they start
+        # accepting requests.
+        if _is_serving():
+            Thread(target=self.warm_up_analysis, name='analysis-warm-up', daemon=True).start()
+
+    @staticmethod
+    def warm_up_analysis() -> None:
+        """
+        Load the shared analysers and their models, and fill the cached admin statistics. Each step is attempted
+        even if an earlier one fails, since any of them is otherwise done by the first request that needs it.
+        """
+        from django.db import connections
+        from app.services.admin_service import AdminService
+        from app.views.analysis_views import _get_image_analyser, _get_text_analyser
+
+        def load_text_models():
+            analyser = _get_text_analyser()
+            for model in (analyser.long_text_model, analyser.short_text_model):
+                if not model.is_loaded():
+                    model.load()
+
+        try:
+            for step in (load_text_models, _get_image_analyser, AdminService.get_system_statistics):
+                try:
+                    step()
+                except Exception as e:
+                    logger.warning("Warm-up step %s failed: %s", step.__name__, e)
+        finally:
+            # Database connections belong to the thread that opened them, so close this thread's before it exits.
+            connections.close_all()
@@ -0,0 +1,46 @@
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+# Cache timeout (in seconds) for token lookups, so an authenticated request usually skips the token/user query.
+TOKEN_CACHE_TIMEOUT = 300
+
+
+def token_cache_key(key: str) -> str:
+    """
+    Build the cache key holding the (user, token) pair authenticated by a token key.
+
+    :param key: Token key sent in the Authorization header
+    :return: Cache key for that token
+    """
+    return f'auth_token:{key}'
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that caches successful token lookups.
+
+    Cached entries are dropped by the signal handlers in app.signals when the token is deleted (logout,
+    password change, refresh) or its user is saved, so revoked tokens and stale users are not served. That only
+    holds for every server process with a shared cache, so settings use this class only when REDIS_URL is set.
+
+    :author: Siyabonga Madondo, Ethan Ngwetjana, Lindokuhle Mdlalose
+    :version: 16/10/2026
+    """
+
+    def authenticate_credentials(self, key: str):
+        """
+        Authenticate a token key, using the cached (user, token) pair when available.
+
+        :param key: Token key sent in the Authorization header
+        :return: Tuple of (User instance, Token instance)
+        :raises AuthenticationFailed: If the token is invalid or its user is inactive
+        """
+        cache_key = token_cache_key(key)
+        credentials = cache.get(cache_key)
+        if credentials is not None:
+            return credentials
+
+        # Only successful lookups are cached; invalid tokens and inactive users raise before this point.
+        credentials = super().authenticate_credentials(key)
+        cache.set(cache_key, credentials, TOKEN_CACHE_TIMEOUT)
+        return credentials
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.24 on 2026-10-16 18:19
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_remove_feedback_unique_feedback_per_user_submission_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='textsubmission',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='text_sub_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='textsubmission',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('content'), name='gin_trgm_ops'), name='text_sub_content_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.24 on 2026-10-16 18:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_textsubmission_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='imagesubmission',
+            index=models.Index(fields=['user', 'id'], name='image_submi_user_id_395b47_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='textsubmission',
+            index=models.Index(fields=['user', 'id'], name='text_submis_user_id_44f841_idx'),
+        ),
+    ]
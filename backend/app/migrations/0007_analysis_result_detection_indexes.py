@@ -0,0 +1,29 @@
+# Generated by Django 4.2.24 on 2026-10-16 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_submission_user_id_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='imageanalysisresult',
+            name='image_analy_content_2ef2ee_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='textanalysisresult',
+            name='text_analys_content_d37c8e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='imageanalysisresult',
+            index=models.Index(fields=['content_type', 'object_id', 'detection_result'], name='iar_ct_obj_det_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='textanalysisresult',
+            index=models.Index(fields=['content_type', 'object_id', 'detection_result'], name='tar_ct_obj_det_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.24 on 2026-10-16 18:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_analysis_result_detection_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_usernam_baeb4b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_email_4b85f2_idx',
+        ),
+    ]
@@ -2,9 +2,13 @@ from django.db import models
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.db.models.functions import Substr
 from django.utils import timezone
 import uuid
 
+# Number of characters of submission content shown in the text sample of a report.
+REPORT_CONTENT_PREVIEW_LENGTH = 500
+
 class AnalysisResult(models.Model):
     """
     Class which represents the result of an detection analysis on a user’s submission.
@@ -96,6 +100,28 @@ class AnalysisResult(models.Model):
         """
         return f"Analysis {self.id} | {self.status} | {self.detection_result}"
     
+    @classmethod
+    def for_report(cls, pk):
+        """
+        Fetch an analysis result with its submission preloaded for report generation.
+        """
+        analysis = cls.objects.get(pk=pk)
+        analysis.load_submission_for_report()
+        return analysis
+
+    def load_submission_for_report(self) -> None:
+        """
+        Load the submission into the relation cache, fetching only a preview of any text content.
+        The preview is one character longer than the report shows so truncation can still be detected.
+        """
+        submission_model = ContentType.objects.get_for_id(self.content_type_id).model_class()
+        submissions = submission_model.objects.filter(pk=self.object_id)
+        if any(field.name == 'content' for field in submission_model._meta.concrete_fields):
+            submissions = submissions.defer('content').annotate(
+                content_preview=Substr('content', 1, REPORT_CONTENT_PREVIEW_LENGTH + 1)
+            )
+        self._meta.get_field('submission').set_cached_value(self, submissions.first())
+
     @property
     def is_completed(self) -> bool:
         """
@@ -1,6 +1,9 @@
 from django.db import models
 from django.utils import timezone
 from .analysis_result import AnalysisResult
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ImageAnalysisResult(AnalysisResult):
     """
@@ -27,7 +30,8 @@ class ImageAnalysisResult(AnalysisResult):
         db_table = "image_analysis_results"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["content_type", "object_id"]),
+            # Generic relation lookups plus the AI/human verdict counts, which filter on all three columns.
+            models.Index(fields=["content_type", "object_id", "detection_result"], name="iar_ct_obj_det_idx"),
             models.Index(fields=["status"]),
             models.Index(fields=["detection_result"]),
             models.Index(fields=["created_at"]),
@@ -95,5 +99,5 @@ class ImageAnalysisResult(AnalysisResult):
             # If something goes wrong, mark as failed
             self.status = self.Status.FAILED
             self.completed_at = timezone.now()
-            print(f"Error saving image analysis result: {e}")
+            logger.exception("Error saving image analysis result: %s", e)
             raise
\ No newline at end of file
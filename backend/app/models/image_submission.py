@@ -8,6 +8,9 @@ from PIL import Image
 from .submission import Submission
 from django.utils import timezone
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
@@ -82,36 +85,53 @@ class ImageSubmission(Submission):
         db_table = "image_submissions"
         indexes = [
             models.Index(fields=["user", "created_at"]),
+            models.Index(fields=["user", "id"]),
             models.Index(fields=["image_format"]),
         ]
 
     def save(self, *args, **kwargs):
         """
-        Auto-calculate and save the metadata.
+        Auto-calculate and save the metadata. It is read from a newly assigned image before it is stored, so saving
+        an existing submission does not read its image back from storage.
         """
-        if self.image:
-            try:
-                # Get file size
-                self.file_size = self.image.size
-                
-                # Extract image format
-                self.image_format = self.image.name.split('.')[-1].lower()
-
-                # Get image dimensions
-                with Image.open(self.image) as img:
-                    self.width, self.height = img.size
-
-            except Exception as e:
-                print(f"Error processing image metadata: {e}")
-                # Handle corrupted files
-                self.file_size = None
-                self.width = None
-                self.height = None
-                self.image_format = None
+        if self.image and not self.image._committed:
+            self._read_image_metadata()
         
         # Save the image submission
         super().save(*args, **kwargs)
 
+    def store_image(self) -> None:
+        """
+        Read the metadata of a newly assigned image and store it without saving the submission, so a later save only
+        writes the database row.
+        """
+        if self.image and not self.image._committed:
+            self._read_image_metadata()
+            self.image.save(self.image.name, self.image.file, save=False)
+
+    def _read_image_metadata(self) -> None:
+        """
+        Read the size, format and dimensions of a newly assigned image, leaving them empty if it is corrupt.
+        """
+        try:
+            # Get file size
+            self.file_size = self.image.size
+            
+            # Extract image format
+            self.image_format = self.image.name.split('.')[-1].lower()
+
+            # Get image dimensions
+            with Image.open(self.image) as img:
+                self.width, self.height = img.size
+
+        except Exception as e:
+            logger.warning("Error processing image metadata: %s", e)
+            # Handle corrupted files
+            self.file_size = None
+            self.width = None
+            self.height = None
+            self.image_format = None
+
     def delete(self, *args, **kwargs) -> tuple[int, dict[str, int]]:
         """
         Delete the ImageSubmission database entry.
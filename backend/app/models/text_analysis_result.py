@@ -40,7 +40,8 @@ class TextAnalysisResult(AnalysisResult):
         db_table = "text_analysis_results" 
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["content_type", "object_id"]),
+            # Generic relation lookups plus the AI/human verdict counts, which filter on all three columns.
+            models.Index(fields=["content_type", "object_id", "detection_result"], name="tar_ct_obj_det_idx"),
             models.Index(fields=["status"]),
             models.Index(fields=["detection_result"]),
             models.Index(fields=["probability"]),
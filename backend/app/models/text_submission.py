@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from .submission import Submission
 
 User = get_user_model()
@@ -32,6 +34,11 @@ class TextSubmission(Submission):
         db_table = "text_submissions"
         indexes = [
             models.Index(fields=['user', 'created_at']),
+            # Covers the per-user id subqueries used for analysis statistics, allowing an index-only semi-join.
+            models.Index(fields=['user', 'id']),
+            # Trigram indexes on UPPER(column), the expression Postgres compares for name/content__icontains searches.
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='text_sub_name_trgm_idx'),
+            GinIndex(OpClass(Upper('content'), name='gin_trgm_ops'), name='text_sub_content_trgm_idx'),
         ]
 
     def save(self, *args, **kwargs) -> None:
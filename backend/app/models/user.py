@@ -1,9 +1,13 @@
 from django.contrib.auth.models import AbstractUser
-from django.contrib.auth.hashers import make_password, check_password
+from django.contrib.auth.hashers import check_password
 from django.db import models
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
 import uuid
 
+# Key salt for the verification code HMAC, so the derived key is distinct from other SECRET_KEY uses.
+VERIFICATION_CODE_KEY_SALT = 'app.models.user.User.verification_code'
+
 class User(AbstractUser):
     """
     Model which represents a general user of the application.
@@ -65,9 +69,8 @@ class User(AbstractUser):
     # Defining metadata for the user table.
     class Meta:
         db_table = 'users'
+        # Email and username lookups use the indexes behind their unique constraints.
         indexes = [
-            models.Index(fields=["username"]),
-            models.Index(fields=["email"]),
             models.Index(fields=["first_name", "last_name"]),
             models.Index(fields=["is_staff"]),
             models.Index(fields=["is_active"]),
@@ -130,11 +133,21 @@ class User(AbstractUser):
         self.is_active = False
         self.save(update_fields=['is_active'])
      
+    @staticmethod
+    def hash_verification_code(code: str) -> str:
+        """
+        Hash a verification code for storage, so it can be set before the user row is inserted.
+
+        Codes are short-lived and attempts are rate limited, so a keyed HMAC-SHA256 is used rather than a slow
+        password hasher.
+        """
+        return salted_hmac(VERIFICATION_CODE_KEY_SALT, code, algorithm='sha256').hexdigest()
+
     def set_verification_code(self, code:str) -> None:
         """
         Set and hash the verification code.
         """
-        self.email_verification_code_hash = make_password(code)
+        self.email_verification_code_hash = User.hash_verification_code(code)
 
     def check_verification_code(self, code: str) -> bool:
         """
@@ -142,7 +155,12 @@ class User(AbstractUser):
         """
         if not self.email_verification_code_hash:
             return False
-        return check_password(code, self.email_verification_code_hash)
+        
+        # Codes issued before the switch to HMAC were stored in password hasher format ("algorithm$...").
+        if '$' in self.email_verification_code_hash:
+            return check_password(code, self.email_verification_code_hash)
+        
+        return constant_time_compare(User.hash_verification_code(code), self.email_verification_code_hash)
     
     def clear_verification_code(self) -> None:
         """
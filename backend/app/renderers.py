@@ -0,0 +1,39 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+import orjson
+
+# DRF's encoder handles the types orjson leaves to a default hook (Decimal, lazy strings, querysets, dates and times).
+_ENCODER = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes responses with orjson, producing the same JSON as DRF's JSONRenderer.
+
+    :author: Siyabonga Madondo, Ethan Ngwetjana, Lindokuhle Mdlalose
+    :version: 16/10/2026
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON bytes, falling back to DRF's renderer when indented output is requested.
+
+        :param data: Response data to render
+        :param accepted_media_type: Media type accepted by the client, which may request an indent
+        :param renderer_context: Context passed by the view
+        :return: Rendered JSON as bytes
+        """
+        if data is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Dates and times go through DRF's encoder so their format matches DRF's (millisecond precision, 'Z' for UTC).
+        ret = orjson.dumps(
+            data,
+            default=_ENCODER.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        )
+
+        # Escape the line and paragraph separators as DRF does, since they are not valid in JavaScript strings.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
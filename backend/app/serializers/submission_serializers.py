@@ -22,6 +22,10 @@ class TextSubmissionListSerializer(serializers.ModelSerializer):
         """
         Get the latest completed analysis ID for this submission.
         """
+        # Submission history annotates the ID in the list query, so no per-row lookup is needed.
+        if hasattr(obj, 'latest_analysis_id'):
+            return str(obj.latest_analysis_id) if obj.latest_analysis_id else None
+
         try:
             content_type = ContentType.objects.get_for_model(obj)
             analysis = TextAnalysisResult.objects.filter(
@@ -103,6 +107,10 @@ class ImageSubmissionListSerializer(serializers.ModelSerializer):
 
     def get_analysis_id(self, obj):
         """Get the latest completed analysis ID for this submission."""
+        # Submission history annotates the ID in the list query, so no per-row lookup is needed.
+        if hasattr(obj, 'latest_analysis_id'):
+            return str(obj.latest_analysis_id) if obj.latest_analysis_id else None
+
         try:
             content_type = ContentType.objects.get_for_model(obj)
             analysis = ImageAnalysisResult.objects.filter(
@@ -1,4 +1,5 @@
 # type: ignore
+from django.core.cache import cache
 from django.db.models import Avg
 from django.utils import timezone
 from datetime import timedelta
@@ -8,6 +9,14 @@ from app.models.text_submission import TextSubmission
 from app.models.text_analysis_result import TextAnalysisResult
 from app.models.feedback import Feedback
 from app.models.analysis_result import AnalysisResult
+import time
+import uuid
+
+# How long dashboard statistics and performance metrics are kept; changes to the underlying data invalidate them sooner.
+ADMIN_STATISTICS_CACHE_TIMEOUT = 60
+
+# How long recent activity is kept, shorter than the statistics since the feed is expected to look live.
+ADMIN_ACTIVITY_CACHE_TIMEOUT = 15
 
 class AdminService:
     """
@@ -17,10 +26,75 @@ class AdminService:
     :version: 12/09/2025
     """
 
+    @staticmethod
+    def _cache_version() -> str:
+        """
+        Get the version token that every cached dashboard value is keyed on.
+
+        :return: Version token that changes whenever invalidate_cache is called
+        """
+        version = cache.get('admin_cache_version')
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.set('admin_cache_version', version, timeout=None)
+        return version
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """
+        Invalidate the cached dashboard statistics, performance metrics and recent activity by moving them to a new
+        cache version.
+        """
+        cache.set('admin_cache_version', uuid.uuid4().hex, timeout=None)
+
+    @staticmethod
+    def get_data_etag(max_age: int) -> str:
+        """
+        Get an entity tag for the dashboard data. It changes whenever the cache is invalidated, and at least every
+        max_age seconds so data that depends on the current time is not treated as unchanged for longer than it is
+        cached.
+
+        :param max_age: Number of seconds the data may be reused for
+        :return: Quoted entity tag
+        """
+        return f'"{AdminService._cache_version()}-{int(time.time() // max_age)}"'
+
+    @staticmethod
+    def _get_cached(name: str, timeout: int, compute, *args) -> Dict[str, Any]:
+        """
+        Get a dashboard result from the cache, computing and caching it on a miss.
+
+        :param name: Cache key name, including any parameters the result depends on
+        :param timeout: Number of seconds to keep the result
+        :param compute: Callable returning the result dictionary
+        :return: Result dictionary
+        """
+        cache_key = f"admin_{name}:{AdminService._cache_version()}"
+        result = cache.get(cache_key)
+        if result is None:
+            result = compute(*args)
+
+            # Failures are not cached, so the next request retries the queries.
+            if result['success']:
+                cache.set(cache_key, result, timeout=timeout)
+        return result
+
     @staticmethod
     def get_system_statistics() -> Dict[str, Any]:
         """
         Get system-wide statistics for admin dash.
+        Results are cached briefly, or until the underlying data changes.
+
+        :return: Dictionary containinig various system statistics.
+        """
+        return AdminService._get_cached(
+            'statistics', ADMIN_STATISTICS_CACHE_TIMEOUT, AdminService._compute_system_statistics
+        )
+
+    @staticmethod
+    def _compute_system_statistics() -> Dict[str, Any]:
+        """
+        Compute system-wide statistics for admin dash.
 
         :return: Dictionary containinig various system statistics.
         """
@@ -159,6 +233,19 @@ class AdminService:
     def get_recent_activity(limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Get recent activity across the system for admin dashboard.
+        Results are cached briefly, or until the underlying data changes.
+        
+        :param limit: Number of recent activities to return (optional - if None, returns all activities)
+        :return: Dictionary containing recent activities
+        """
+        return AdminService._get_cached(
+            f"activity:{limit}", ADMIN_ACTIVITY_CACHE_TIMEOUT, AdminService._compute_recent_activity, limit
+        )
+
+    @staticmethod
+    def _compute_recent_activity(limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Compute recent activity across the system for admin dashboard.
         
         :param limit: Number of recent activities to return (optional - if None, returns all activities)
         :return: Dictionary containing recent activities
@@ -272,6 +359,19 @@ class AdminService:
     def get_performance_metrics(days: int = 7) -> Dict[str, Any]:
         """
         Get performance metrics over a specified time period.
+        Results are cached briefly, or until the underlying data changes.
+        
+        :param days: Number of days to analyse
+        :return: Performance metrics data
+        """
+        return AdminService._get_cached(
+            f"performance:{days}", ADMIN_STATISTICS_CACHE_TIMEOUT, AdminService._compute_performance_metrics, days
+        )
+
+    @staticmethod
+    def _compute_performance_metrics(days: int = 7) -> Dict[str, Any]:
+        """
+        Compute performance metrics over a specified time period.
         
         :param days: Number of days to analyse
         :return: Performance metrics data
@@ -1,6 +1,8 @@
 from typing import Any, Dict, Optional
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
 from django.core.files import File
 from django.utils import timezone
 from app.models.image_submission import ImageSubmission
@@ -8,9 +10,19 @@ from app.models.image_analysis_result import ImageAnalysisResult
 from app.ai.ai_image_model import AiImageModel
 from app.services.claude_service import ClaudeService
 from .ai_analyser import AiAnalyser
+import hashlib
 import os
 import time
 from PIL import Image
+import logging
+
+logger = logging.getLogger(__name__)
+
+# How long the analysis of a given image is reused, so resubmitting the same file skips the model and Claude.
+ANALYSIS_CACHE_TIMEOUT = 86400
+
+# Size of the chunks an image file is read in while hashing it.
+HASH_CHUNK_SIZE = 1024 * 1024
 
 class AiImageAnalyser(AiAnalyser):
     """
@@ -37,7 +49,7 @@ class AiImageAnalyser(AiAnalyser):
             try:
                 self.claude_service = ClaudeService()
             except ValueError:
-                print("Warning: Claude API key not found. Enhanced analysis disabled.")
+                logger.warning("Claude API key not found. Enhanced analysis disabled.")
                 self.use_claude = False
 
         if not ai_model.is_loaded():
@@ -64,21 +76,15 @@ class AiImageAnalyser(AiAnalyser):
             # Preprocess input.
             processed_path = self.preprocess(image_path=input_data)  # Fixed: was "input"
 
-            # Perform AI detection.
-            base_prediction = self.ai_model.predict(processed_path)
-
-            # Enhanced analysis with Claude if available
-            enhanced_analysis = None
-            if self.use_claude and self.claude_service:
-                try:
-                    enhanced_analysis = self.claude_service.analyse_image_patterns(
-                        processed_path, base_prediction
-                    )
-                except Exception as e:
-                    print(f"Claude image analysis failed: {e}")
+            # Reuse the analysis of an identical image when it is cached.
+            cache_key = self._analysis_cache_key(processed_path)
+            final_result = cache.get(cache_key)
+            if final_result is None:
+                final_result = self._analyse_image(processed_path)
 
-            # Post-process results.
-            final_result = self.postprocess(base_prediction, enhanced_analysis)
+                # A result missing Claude's analysis because the call failed is not cached, so it is retried.
+                if final_result['metadata']['enhanced_analysis_used'] or not (self.use_claude and self.claude_service):
+                    cache.set(cache_key, final_result, ANALYSIS_CACHE_TIMEOUT)
 
             # Calculate and add processing time.
             end_time = time.time()
@@ -87,7 +93,7 @@ class AiImageAnalyser(AiAnalyser):
 
             # Save analysis result for registered users.
             if user and user.is_authenticated:
-                print("User is authenticated so we are saving their result!")
+                logger.debug("User is authenticated so we are saving their result")
                 analysis_result = self._save_analysis_result(final_result, user, submission, processed_path, processing_time_ms)
 
             # Add analysis info to result if saved successfully
@@ -98,7 +104,7 @@ class AiImageAnalyser(AiAnalyser):
         
         except Exception as e:
             # Handle analysis failure
-            print(f"Image analysis failed: {e}")
+            logger.exception("Image analysis failed: %s", e)
             
             # If we have a user and started creating an analysis, mark it as failed
             if user and user.is_authenticated and analysis_result:
@@ -107,11 +113,64 @@ class AiImageAnalyser(AiAnalyser):
                     analysis_result.completed_at = timezone.now()
                     analysis_result.save()
                 except Exception as save_error:
-                    print(f"Failed to mark analysis as failed: {save_error}")
+                    logger.error("Failed to mark analysis as failed: %s", save_error)
             
             # Re-raise the exception so the view can handle it
             raise
 
+    def save_result(self, result: Dict[str, Any], user, submission, image_path: str) -> Optional[ImageAnalysisResult]:
+        """
+        Save a result returned by analyse() for a registered user's submission, and add its analysis ID to it. This
+        lets a caller run the analysis first and then save the submission and its result in a short transaction.
+
+        :param result: Analysis result from analyse()
+        :param user: User instance
+        :param submission: Related submission object
+        :param image_path: Path to the analysed image
+        :return: Created ImageAnalysisResult instance or None
+        """
+        analysis_result = self._save_analysis_result(result, user, submission, image_path, result['metadata']['processing_time_ms'])
+        if analysis_result:
+            result['analysis_id'] = str(analysis_result.id)
+        return analysis_result
+
+    @staticmethod
+    def _analysis_cache_key(image_path: str) -> str:
+        """
+        Build the cache key for the analysis of an image from a BLAKE2b digest of its file contents.
+
+        :param image_path: Path to image file
+        :return: Cache key for the image's analysis
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return f"ai:img:{digest.hexdigest()}"
+
+    def _analyse_image(self, processed_path: str) -> Dict[str, Any]:
+        """
+        Run the model and Claude on an image and combine their results.
+
+        :param processed_path: Path to preprocessed image file
+        :return: Analysis results without per-request fields (processing time, analysis ID)
+        """
+        # Perform AI detection.
+        base_prediction = self.ai_model.predict(processed_path)
+
+        # Enhanced analysis with Claude if available
+        enhanced_analysis = None
+        if self.use_claude and self.claude_service:
+            try:
+                enhanced_analysis = self.claude_service.analyse_image_patterns(
+                    processed_path, base_prediction
+                )
+            except Exception as e:
+                logger.warning("Claude image analysis failed: %s", e)
+
+        # Post-process results.
+        return self.postprocess(base_prediction, enhanced_analysis)
+
     def _save_analysis_result(self, result: Dict[str, Any], user, submission, image_path: str, processing_time_ms: float):
         """
         Save analysis result to database for registered users.
@@ -135,38 +194,39 @@ class AiImageAnalyser(AiAnalyser):
                     filename = os.path.basename(image_path)
                     submission_name = f"Image Analysis - {filename}"
 
-                # Create a new ImageSubmission for this analysis
-                submission = ImageSubmission.objects.create(
-                    name=submission_name,
-                    user=user
-                )
-
-                # Save the image file to Supabase storage.
+                # Create a new ImageSubmission for this analysis. Saving reads the image metadata from the file and
+                # then stores it in Supabase storage.
                 with open(image_path, 'rb') as f:
-                    filename = os.path.basename(image_path)
-                    submission.image.save(filename, File(f), save=True)
+                    submission = ImageSubmission(
+                        name=submission_name,
+                        user=user,
+                        image=File(f, name=os.path.basename(image_path))
+                    )
+                    submission.save()
 
             # Get content type for the submission
             content_type = ContentType.objects.get_for_model(submission)
             
-            # Create initial ImageAnalysisResult instance
-            analysis = ImageAnalysisResult(
-                content_type=content_type,
-                object_id=submission.id,
-                status=ImageAnalysisResult.Status.PENDING
-            )
-            analysis.save()
+            # Save the result in a savepoint, so a failed write does not break a transaction the caller has open.
+            with transaction.atomic():
+                # Create initial ImageAnalysisResult instance
+                analysis = ImageAnalysisResult(
+                    content_type=content_type,
+                    object_id=submission.id,
+                    status=ImageAnalysisResult.Status.PENDING
+                )
+                analysis.save()
             
-            # Save the analysis result
-            analysis.save_analysis_result(result)
-            analysis.save()
+                # Save the analysis result
+                analysis.save_analysis_result(result)
+                analysis.save()
             
-            print(f"Saved image analysis result {analysis.id} for user {user.email} (processed in {processing_time_ms:.2f}ms)")
-            print(f"Image stored at: {submission.image.url}")
+            logger.info("Saved image analysis result %s for user %s (processed in %.2fms)", analysis.id, user.email, processing_time_ms)
+            logger.debug("Image stored at: %s", submission.image.name)
             return analysis
         
         except Exception as e:
-            print(f"Failed to save image analysis result: {e}")
+            logger.exception("Failed to save image analysis result: %s", e)
 
             # If we created an analysis object, mark it as failed
             if analysis is not None:
@@ -175,7 +235,7 @@ class AiImageAnalyser(AiAnalyser):
                     analysis.completed_at = timezone.now()
                     analysis.save()
                 except Exception as save_error:
-                    print(f"Failed to mark analysis as failed: {save_error}")
+                    logger.error("Failed to mark analysis as failed: %s", save_error)
 
             return None
     
@@ -194,7 +254,7 @@ class AiImageAnalyser(AiAnalyser):
         try:
             with Image.open(image_path) as img:
                 # Ensure image is in supported format
-                if img is not None and img.format and img.format.lower() not in ['jpeg', 'jpg', 'png']:
+                if img is not None and img.format and img.format.lower() not in ['jpeg', 'jpg', 'mpo', 'png']:
                     raise ValueError(f"Unsupported image format: {img.format}")
                 
         except Exception as e:
@@ -6,10 +6,19 @@ from app.services.claude_service import ClaudeService
 from app.models.text_analysis_result import TextAnalysisResult
 from app.models.text_submission import TextSubmission
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.core.cache import cache
 from django.utils import timezone
 from typing import Any, Dict, Optional
+import hashlib
 import time
 import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# How long the analysis of a given text is reused, so resubmitting the same text skips the models and Claude.
+ANALYSIS_CACHE_TIMEOUT = 86400
 
 class AiTextAnalyser(AiAnalyser):
     """
@@ -42,7 +51,7 @@ class AiTextAnalyser(AiAnalyser):
             try:
                 self.claude_service = ClaudeService()
             except ValueError:
-                print("Warning: Claude API key not found. Enhanced analysis disabled.")
+                logger.warning("Claude API key not found. Enhanced analysis disabled.")
                 self.use_claude = False
 
     def analyse(self, input_data: Any, user=None, submission=None) -> Dict[str, Any]:
@@ -62,36 +71,15 @@ class AiTextAnalyser(AiAnalyser):
             # Preprocess input.
             processed_text = self.preprocess(input_data)
 
-            # Select appropriate model based on text length.
-            selected_model, model_type = self._select_model(processed_text)
-
-            # Ensure selected model is loaded.
-            if not selected_model.is_loaded():
-                selected_model.load()
-
-            # Get base model prediction from selected model
-            base_prediction = selected_model.predict(processed_text)
-
-            # Enhanced analysis with Claude if available.
-            enhanced_analysis = None
-            if self.use_claude and self.claude_service:
-                try:
-                    enhanced_analysis = self.claude_service.analyse_text_patterns(
-                        processed_text, base_prediction
-                    )
-                except Exception as e:
-                    print(f"Claude analysis failed: {e}")
-
-            # Combine results.
-            final_result = self.postprocess(base_prediction, enhanced_analysis)
-
-            # Add statistics to result.
-            final_result['statistics'] = self.calculate_statistics(processed_text, enhanced_analysis)
+            # Reuse the analysis of identical text when it is cached.
+            cache_key = self._analysis_cache_key(processed_text)
+            final_result = cache.get(cache_key)
+            if final_result is None:
+                final_result = self._analyse_text(processed_text)
 
-            # Add model selection metadata
-            final_result['metadata']['model_used'] = model_type
-            final_result['metadata']['text_length'] = len(processed_text.strip())
-            final_result['metadata']['threshold'] = self.short_text_threshold
+                # A result missing Claude's analysis because the call failed is not cached, so it is retried.
+                if final_result['metadata']['enhanced_analysis_used'] or not (self.use_claude and self.claude_service):
+                    cache.set(cache_key, final_result, ANALYSIS_CACHE_TIMEOUT)
 
             # Calculate and add processing time to results.
             end_time = time.time()
@@ -100,7 +88,7 @@ class AiTextAnalyser(AiAnalyser):
 
             # Save analysis result for registered users.
             if user and user.is_authenticated:
-                print("User is authenticated so we are saving their result!")
+                logger.debug("User is authenticated so we are saving their result")
                 analysis_result = self._save_analysis_result(final_result, user, submission, processed_text, processing_time_ms)
 
             # Add analysis info to result if saved successfully.
@@ -111,7 +99,7 @@ class AiTextAnalyser(AiAnalyser):
 
         except Exception as e:
             # Handle analysis failure.
-            print(f"Analysis failed: {e}")
+            logger.exception("Analysis failed: %s", e)
 
             # If we have a user and started creating an analysis, mark it as failed.
             if user and user.is_authenticated and analysis_result:
@@ -121,11 +109,76 @@ class AiTextAnalyser(AiAnalyser):
                     analysis_result.calculate_processing_time()
                     analysis_result.save()
                 except Exception as save_error:
-                    print(f"Failed to mark analysis as failed: {save_error}")
+                    logger.error("Failed to mark analysis as failed: %s", save_error)
 
             # Re-raise the exception so the view can handle it.
             raise
     
+    def save_result(self, result: Dict[str, Any], user, submission, text: str) -> Optional[TextAnalysisResult]:
+        """
+        Save a result returned by analyse() for a registered user's submission, and add its analysis ID to it. This
+        lets a caller run the analysis first and then save the submission and its result in a short transaction.
+
+        :param result: Analysis result from analyse()
+        :param user: User instance
+        :param submission: Related submission object
+        :param text: Submitted text
+        :return: Created TextAnalysisResult instance or None
+        """
+        analysis_result = self._save_analysis_result(result, user, submission, text, result['metadata']['processing_time_ms'])
+        if analysis_result:
+            result['analysis_id'] = str(analysis_result.id)
+        return analysis_result
+
+    @staticmethod
+    def _analysis_cache_key(text: str) -> str:
+        """
+        Build the cache key for the analysis of a text from a BLAKE2b digest of it.
+
+        :param text: Preprocessed text
+        :return: Cache key for the text's analysis
+        """
+        return f"ai:txt:{hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()}"
+
+    def _analyse_text(self, processed_text: str) -> Dict[str, Any]:
+        """
+        Run the selected model and Claude on a text and combine their results.
+
+        :param processed_text: Preprocessed text
+        :return: Analysis results without per-request fields (processing time, analysis ID)
+        """
+        # Select appropriate model based on text length.
+        selected_model, model_type = self._select_model(processed_text)
+
+        # Ensure selected model is loaded.
+        if not selected_model.is_loaded():
+            selected_model.load()
+
+        # Get base model prediction from selected model
+        base_prediction = selected_model.predict(processed_text)
+
+        # Enhanced analysis with Claude if available.
+        enhanced_analysis = None
+        if self.use_claude and self.claude_service:
+            try:
+                enhanced_analysis = self.claude_service.analyse_text_patterns(
+                    processed_text, base_prediction
+                )
+            except Exception as e:
+                logger.warning("Claude analysis failed: %s", e)
+
+        # Combine results.
+        final_result = self.postprocess(base_prediction, enhanced_analysis)
+
+        # Add statistics to result.
+        final_result['statistics'] = self.calculate_statistics(processed_text, enhanced_analysis)
+
+        # Add model selection metadata
+        final_result['metadata']['model_used'] = model_type
+        final_result['metadata']['text_length'] = len(processed_text.strip())
+        final_result['metadata']['threshold'] = self.short_text_threshold
+        return final_result
+
     def _select_model(self, text: str):
         """
         Select appropriate model based on text length.
@@ -171,24 +224,26 @@ class AiTextAnalyser(AiAnalyser):
             # Get content type for the submission.
             content_type = ContentType.objects.get_for_model(submission)
             
-            # Create initial TextAnalysisResult instance with PENDING status initially.
-            analysis = TextAnalysisResult(
-                content_type=content_type,
-                object_id=submission.id,
-                status=TextAnalysisResult.Status.PENDING
-            )
-            analysis.save()
+            # Save the result in a savepoint, so a failed write does not break a transaction the caller has open.
+            with transaction.atomic():
+                # Create initial TextAnalysisResult instance with PENDING status initially.
+                analysis = TextAnalysisResult(
+                    content_type=content_type,
+                    object_id=submission.id,
+                    status=TextAnalysisResult.Status.PENDING
+                )
+                analysis.save()
             
-            # Save the analysis result with a COMPLETED status.
-            analysis.save_analysis_result(result)
-            analysis.save()
+                # Save the analysis result with a COMPLETED status.
+                analysis.save_analysis_result(result)
+                analysis.save()
             
-            print(f"Saved analysis result {analysis.id} for user {user.email} (processed in {processing_time_ms:.2f}ms)")
+            logger.info("Saved analysis result %s for user %s (processed in %.2fms)", analysis.id, user.email, processing_time_ms)
             return analysis
         
         except Exception as e:
             # Log error but don't fail the analysis
-            print(f"Failed to save analysis result: {e}")
+            logger.exception("Failed to save analysis result: %s", e)
 
             # If we created an analysis object, mark it as failed.
             if analysis is not None:
@@ -198,7 +253,7 @@ class AiTextAnalyser(AiAnalyser):
                     analysis.calculate_processing_time()
                     analysis.save()
                 except Exception as save_error:
-                    print(f"Failed to mark analysis as failed: {save_error}")
+                    logger.error("Failed to mark analysis as failed: %s", save_error)
 
             return None
 
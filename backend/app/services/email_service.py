@@ -98,7 +98,7 @@ class EmailService:
             # Send email
             email.send()
 
-            logger.info(f"{analysis_type} analysis report sent successfully to {recipient_email}")
+            logger.info("%s analysis report sent successfully to %s", analysis_type, recipient_email)
             
             return {
                 'success': True,
@@ -108,7 +108,7 @@ class EmailService:
             
         except Exception as e:
             analysis_type = "Image" if isinstance(analysis_result, ImageAnalysisResult) else "Text"
-            logger.error(f"Failed to send {analysis_type.lower()} analysis report to {recipient_email}: {str(e)}")
+            logger.error("Failed to send %s analysis report to %s: %s", analysis_type.lower(), recipient_email, e)
             return {
                 'success': False,
                 'error': f'Failed to send {analysis_type.lower()} analysis report: {str(e)}'
@@ -155,7 +155,7 @@ class EmailService:
             # Send email.
             email.send()
 
-            logger.info(f"Welcome email sent successfully to {user_email}")
+            logger.info("Welcome email sent successfully to %s", user_email)
 
             return {
                 'success': True,
@@ -164,7 +164,7 @@ class EmailService:
             }
         
         except Exception as e:
-            logger.error(f"Failed to send welcome email to {user_email}: {str(e)}")
+            logger.error("Failed to send welcome email to %s: %s", user_email, e)
             return {
                 'success': False,
                 'error': f'Failed to send welcome email: {str(e)}'
@@ -217,7 +217,7 @@ class EmailService:
             # Send email.
             email.send()
 
-            logger.info(f"Password reset email sent successfully to {user_email}")
+            logger.info("Password reset email sent successfully to %s", user_email)
             
             return {
                 'success': True,
@@ -226,7 +226,7 @@ class EmailService:
             }
         
         except Exception as e:
-            logger.error(f"Failed to send password reset email to {user_email}: {str(e)}")
+            logger.error("Failed to send password reset email to %s: %s", user_email, e)
             return {
                 'success': False,
                 'error': f'Failed to send password reset email: {str(e)}'
@@ -277,7 +277,7 @@ class EmailService:
             # Send email.
             email.send()
 
-            logger.info(f"Verification code email sent successfully to {user_email}")
+            logger.info("Verification code email sent successfully to %s", user_email)
 
             return {
                 'success': True,
@@ -286,7 +286,7 @@ class EmailService:
             }
 
         except Exception as e:
-            logger.error(f"Failed to send verification code to {user_email}: {str(e)}")
+            logger.error("Failed to send verification code to %s: %s", user_email, e)
             return {
                 'success': False,
                 'error': f'Failed to send verification code: {str(e)}'
@@ -305,8 +305,8 @@ class FeedbackService:
             try:
                 analysis = TextAnalysisResult.objects.get(id=analysis_id)
                 
-                # Check if user has ownership over the analysis
-                if analysis.submission is not None and analysis.submission.user != user:
+                # Check if user has ownership over the analysis, by ID so the user row is not loaded
+                if analysis.submission is not None and analysis.submission.user_id != user.id:
                     return {
                         'success': False,
                         'error': 'You can only access feedback for your own analyses'
@@ -324,8 +324,8 @@ class FeedbackService:
             try:
                 analysis = ImageAnalysisResult.objects.get(id=analysis_id)
                 
-                # Check if user has ownership over the analysis
-                if analysis.submission is not None and analysis.submission.user != user:
+                # Check if user has ownership over the analysis, by ID so the user row is not loaded
+                if analysis.submission is not None and analysis.submission.user_id != user.id:
                     return {
                         'success': False,
                         'error': 'You can only access feedback for your own analyses'
@@ -1,6 +1,10 @@
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models.base import ModelState
+from app.models.analysis_result import REPORT_CONTENT_PREVIEW_LENGTH
 from app.models.text_analysis_result import TextAnalysisResult
 from app.models.image_analysis_result import ImageAnalysisResult
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -9,13 +13,147 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 from io import BytesIO
 from datetime import datetime
+from dataclasses import dataclass
 import logging
+import hashlib
 import html
 import requests
-from typing import Union
+from typing import Any, Union
 
 logger = logging.getLogger(__name__)
 
+# Skip attribute validation on graphics shapes; the report only sets known-good values.
+rl_config.shapeChecking = 0
+
+# Characters that must be escaped before text is handed to the ReportLab paragraph parser.
+_MARKUP_CHARS = ('&', '<', '>', '"', "'")
+
+# How long a rendered report is served from the cache before it is regenerated.
+REPORT_CACHE_TIMEOUT = 3600
+
+# Name of the form XObject holding the page watermark, drawn once and reused on every page.
+_WATERMARK_FORM = 'DetectiveAIWatermark'
+
+# Font colour for each detection reason type in the detection details section.
+_TYPE_COLORS = {
+    'critical': 'red',
+    'warning': 'orange',
+    'info': 'blue',
+    'success': 'green'
+}
+
+# Label and statistics key for each row of the text statistics table.
+_STAT_ROWS = (
+    ('Total Words:', 'total_words'),
+    ('Sentences:', 'sentences'),
+    ('Avg Sentence Length:', 'avg_sentence_length'),
+    ('AI Keywords Found:', 'ai_keywords_count'),
+    ('Transition Words:', 'transition_words_count'),
+    ('Corporate Jargon:', 'corporate_jargon_count'),
+    ('Buzzwords:', 'buzzwords_count'),
+    ('Human Indicators:', 'human_indicators_count'),
+)
+
+def _escape(text: str) -> str:
+    """
+    Escape text for ReportLab markup, skipping the escape entirely for plain text.
+    """
+    # Substring checks are a C-level memchr scan each, far cheaper than a regex search or str.translate.
+    for char in _MARKUP_CHARS:
+        if char in text:
+            return html.escape(text)
+    return text
+
+@dataclass(slots=True)
+class _ReportContext:
+    """
+    Report fields read once from an analysis result and shared by every report section.
+    """
+    analysis_id: str
+    analysis_type: str
+    is_image_analysis: bool
+    created_at_str: str
+    processing_time_str: str
+    is_ai_generated: bool
+    probability_text: str
+    confidence_text: str
+    enhanced_analysis_used: bool
+    detection_reasons: Any
+    statistics: Any
+    submission: Any
+    # Set when a section could not be rendered fully, so the report is not cached and the next request retries it.
+    degraded: bool = False
+
+def _build_report_context(analysis_result: Union[TextAnalysisResult, ImageAnalysisResult]) -> _ReportContext:
+    """
+    Read and format every field the report needs from the analysis result in a single pass.
+
+    :param analysis_result: TextAnalysisResult or ImageAnalysisResult instance.
+    :return: Report context with pre-formatted values.
+    """
+    def read(name: str, default: Any = None) -> Any:
+        try:
+            return getattr(analysis_result, name, default)
+        except Exception:
+            return default
+
+    def format_percent(value: Any) -> str:
+        try:
+            return f"{value:.1%}" if value is not None else "N/A"
+        except (TypeError, ValueError):
+            return "N/A"
+
+    is_image_analysis = isinstance(analysis_result, ImageAnalysisResult)
+
+    created_at = read('created_at')
+    try:
+        created_at_str = created_at.strftime('%Y-%m-%d %H:%M:%S UTC') if created_at else 'N/A'
+    except Exception:
+        created_at_str = 'N/A'
+
+    processing_time = read('processing_time_ms')
+    processing_time_str = f"{processing_time / 1000:.2f}s" if isinstance(processing_time, (int, float)) else 'N/A'
+
+    return _ReportContext(
+        analysis_id=str(read('id', 'N/A')),
+        analysis_type="Image Analysis" if is_image_analysis else "Text Analysis",
+        is_image_analysis=is_image_analysis,
+        created_at_str=created_at_str,
+        processing_time_str=processing_time_str,
+        is_ai_generated=read('detection_result', '') == 'AI_GENERATED',
+        probability_text=format_percent(read('probability')),
+        confidence_text=format_percent(read('confidence')),
+        enhanced_analysis_used=bool(read('enhanced_analysis_used', False)),
+        detection_reasons=read('detection_reasons'),
+        statistics=read('statistics'),
+        submission=read('submission'),
+    )
+
+def _text_sample(submission: Any) -> Union[str, None]:
+    """
+    Get the truncated text shown in the report's text sample section.
+
+    :param submission: Submission of the analysis result, or None.
+    :return: Text sample, or None if the submission has no text content.
+    """
+    if not submission:
+        return None
+
+    # Prefer the preview annotated by load_submission_for_report(); even hasattr() would load deferred content.
+    preview = getattr(submission, 'content_preview', None)
+    if isinstance(preview, str):
+        content = preview
+    elif hasattr(submission, 'content'):
+        content = getattr(submission, 'content', '')
+    else:
+        return None
+
+    if not content:
+        return "No content available"
+    if len(content) > REPORT_CONTENT_PREVIEW_LENGTH:
+        return content[:REPORT_CONTENT_PREVIEW_LENGTH] + "... [truncated]"
+    return content
+
 class ReportService:
     """
     Service for generating PDF reports from analysis results (text and image).
@@ -24,56 +162,87 @@ class ReportService:
     :version: 23/09/2025
     """
 
+    # Paragraph and table styles are read-only once built, so every instance shares one copy.
+    _STYLES = None
+    _TABLE_STYLE = None
+
     def __init__(self):
         """
         Initialise the Report Service.
         """
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        if ReportService._STYLES is None:
+            styles = getSampleStyleSheet()
+            self._setup_custom_styles(styles)
+            ReportService._STYLES = styles
+        self.styles = ReportService._STYLES
 
-    def _setup_custom_styles(self):
+    @staticmethod
+    def _setup_custom_styles(styles):
         """
         Setup custom paragraph styles for the report.
+
+        :param styles: Stylesheet to add the custom styles to.
         """
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
             spaceAfter=30,
             alignment=TA_CENTER,
             textColor=colors.HexColor('#2c3e50')
         ))
 
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=16,
             spaceBefore=20,
             spaceAfter=12,
             textColor=colors.HexColor('#34495e')
         ))
 
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomBodyText',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=11,
             spaceAfter=12,
             alignment=TA_JUSTIFY
         ))
 
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CenteredText',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             spaceAfter=12,
             alignment=TA_CENTER,  # This should center the text
             textColor=colors.HexColor('#666666')
         ))
 
-    def _get_standard_table_style(self):
+    @classmethod
+    def warm_up(cls) -> None:
+        """
+        Build a throwaway document so font metrics and the paragraph parser are loaded at process start.
+        """
+        try:
+            service = cls()
+            SimpleDocTemplate(BytesIO(), pagesize=A4).build([Paragraph("warm", service.styles['Normal'])])
+        except Exception as e:
+            logger.warning("Report renderer warm-up failed: %s", e)
+
+    @classmethod
+    def _get_standard_table_style(cls):
         """
         Get standard table styling to maintain consistency.
         """
+        if cls._TABLE_STYLE is None:
+            cls._TABLE_STYLE = cls._build_standard_table_style()
+        return cls._TABLE_STYLE
+
+    @staticmethod
+    def _build_standard_table_style():
+        """
+        Build the table style shared by every key/value table in the report.
+        """
         return TableStyle([
             ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ecf0f1')),
             ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
@@ -87,12 +256,29 @@ class ReportService:
     def generate_analysis_report(self, analysis_result: Union[TextAnalysisResult, ImageAnalysisResult], user_email: str) -> BytesIO:
         """
         Generate a PDF report for a text or image analysis result.
+        Pass an instance loaded with `AnalysisResult.for_report()` so only a preview of the submission
+        content is fetched while the report is being built.
 
         :param analysis_result: TextAnalysisResult or ImageAnalysisResult instance.
         :param user_email: Email of the user requesting the report.
         :return: BytesIO buffer containing the PDF
         :raises: Exception if report generation fails
         """
+        buffer = BytesIO()
+        self.generate_analysis_report_to(buffer, analysis_result, user_email)
+        buffer.seek(0)
+        return buffer
+
+    def generate_analysis_report_to(self, stream, analysis_result: Union[TextAnalysisResult, ImageAnalysisResult], user_email: str) -> None:
+        """
+        Generate a PDF report for a text or image analysis result and write it straight to a file-like object,
+        such as an HttpResponse, without holding a separate copy in memory.
+
+        :param stream: Writable file-like object that receives the PDF bytes.
+        :param analysis_result: TextAnalysisResult or ImageAnalysisResult instance.
+        :param user_email: Email of the user requesting the report.
+        :raises: Exception if report generation fails
+        """
         try:
             # Validate inputs
             if not analysis_result:
@@ -100,27 +286,35 @@ class ReportService:
             if not user_email:
                 raise ValueError("User email cannot be empty")
 
-            # Determine analysis type
-            is_image_analysis = isinstance(analysis_result, ImageAnalysisResult)
+            # Serve a previously rendered report when the analysis and requester have not changed.
+            cache_key = self._report_cache_key(analysis_result, user_email)
+            if cache_key is not None:
+                cached_pdf = cache.get(cache_key)
+                if cached_pdf is not None:
+                    stream.write(cached_pdf)
+                    return
+
+            # Load the submission up front and read every field the report needs once.
+            self._ensure_submission_loaded(analysis_result)
+            ctx = _build_report_context(analysis_result)
 
-            buffer = BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*inch)
+            # ReportLab assembles the PDF in memory and writes it in a single call, so no preallocation is needed.
+            doc = SimpleDocTemplate(stream, pagesize=A4, topMargin=1*inch)
             story = []
 
             # Main Report Content
-            title = f"Detective AI {'Image' if is_image_analysis else 'Text'} Analysis Report"
-            story.append(Paragraph(title, self.styles['CustomTitle']))
-            story.append(Spacer(1, 20))
+            title = f"Detective AI {'Image' if ctx.is_image_analysis else 'Text'} Analysis Report"
+            story.extend((Paragraph(title, self.styles['CustomTitle']), Spacer(1, 20)))
 
-            self._add_report_metadata(story, analysis_result, user_email)     
-            self._add_analysis_summary(story, analysis_result)
-            self._add_detection_details(story, analysis_result)
+            self._add_report_metadata(story, ctx, user_email)     
+            self._add_analysis_summary(story, ctx)
+            self._add_detection_details(story, ctx)
             
-            if is_image_analysis:
-                self._add_image_section(story, analysis_result)
+            if ctx.is_image_analysis:
+                self._add_image_section(story, ctx)
             else:
-                self._add_statistics_section(story, analysis_result)
-                self._add_text_sample(story, analysis_result)
+                self._add_statistics_section(story, ctx)
+                self._add_text_sample(story, ctx)
             
             self._add_footer(story)
 
@@ -131,196 +325,175 @@ class ReportService:
                 onLaterPages=self._apply_canvas_elements
             )
 
-            buffer.seek(0)
-            return buffer
+            if not ctx.degraded:
+                self._cache_report(cache_key, stream)
             
         except Exception as e:
-            logger.error(f"Failed to generate PDF report: {str(e)}")
+            logger.error("Failed to generate PDF report: %s", e)
             raise Exception(f"Report generation failed: {str(e)}")
     
-    def _add_report_metadata(self, story, analysis_result: Union[TextAnalysisResult, ImageAnalysisResult], user_email: str):
+    @staticmethod
+    def _report_cache_key(analysis_result: Union[TextAnalysisResult, ImageAnalysisResult], user_email: str):
         """
-        Add report metadata section for both text and image analysis.
+        Build the cache key for a rendered report from the analysis identity, its last change and the requester.
+
+        :param analysis_result: TextAnalysisResult or ImageAnalysisResult instance.
+        :param user_email: Email of the user requesting the report.
+        :return: Cache key, or None if the analysis result is not a saved model instance.
         """
-        try:
-            story.append(Paragraph("Report Information", self.styles['SectionHeader']))
+        state = getattr(analysis_result, '_state', None)
+        if not isinstance(state, ModelState) or state.adding or analysis_result.pk is None:
+            return None
 
-            # Safely get analysis ID
-            analysis_id = getattr(analysis_result, 'id', 'N/A')
-            created_at = getattr(analysis_result, 'created_at', None)
-            created_at_str = created_at.strftime('%Y-%m-%d %H:%M:%S UTC') if created_at else 'N/A'
-            processing_time = getattr(analysis_result, 'processing_time_ms', 'N/A')
-            
-            # Determine analysis type
-            analysis_type = "Image Analysis" if isinstance(analysis_result, ImageAnalysisResult) else "Text Analysis"
-
-            metadata_data = [
-                ['Report Type:', analysis_type],
-                ['Report ID:', str(analysis_id)],
-                ['Generated For:', html.escape(user_email)],
-                ['Analysis Date:', created_at_str],
-                ['Report Generated:', datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')],
-                ['Processing Time:', f"{float(processing_time) / 1000:.2f}s" if processing_time != 'N/A' else 'N/A']
-            ]
-
-            table = Table(metadata_data, colWidths=[2*inch, 4*inch])
-            table.setStyle(self._get_standard_table_style())
-            
-            story.append(table)
-            story.append(Spacer(1, 20))
-            
-        except Exception as e:
-            logger.error(f"Failed to add report metadata: {str(e)}")
-            story.append(Paragraph("Report Information - Error Loading", self.styles['SectionHeader']))
-            story.append(Spacer(1, 20))
+        # Analysis results have no updated_at; completion is the last time their contents change.
+        changed_at = analysis_result.completed_at or analysis_result.created_at
+        version = changed_at.timestamp() if changed_at else 0
+        email_hash = hashlib.blake2b(user_email.encode('utf-8'), digest_size=8).hexdigest()
+        return f"report:{type(analysis_result).__name__}:{analysis_result.pk}:{version}:{email_hash}"
 
-    def _add_analysis_summary(self, story, analysis_result: Union[TextAnalysisResult, ImageAnalysisResult]):
+    @staticmethod
+    def _cache_report(cache_key, stream) -> None:
         """
-        Add analysis summary section for both text and image analysis.
+        Store the rendered PDF bytes under the given cache key, ignoring cache backend failures.
+        Streams that cannot be read back (anything without getvalue()) are not cached.
         """
+        getvalue = getattr(stream, 'getvalue', None)
+        if cache_key is None or getvalue is None:
+            return
         try:
-            story.append(Paragraph("Analysis Summary", self.styles['SectionHeader']))
-            
-            # Main result
-            detection_result = getattr(analysis_result, 'detection_result', '')
-            is_ai_generated = detection_result == 'AI_GENERATED'
-            result_color = 'red' if is_ai_generated else 'green'
-            result_text = "AI Generated" if is_ai_generated else "Human Created"
-            
-            # Format probability safely
-            probability = getattr(analysis_result, 'probability', None)
-            probability_text = f"{probability:.1%}" if probability is not None else "N/A"
-            
-            confidence = getattr(analysis_result, 'confidence', None)
-            confidence_text = f"{confidence:.1%}" if confidence is not None else "N/A"
-            
-            enhanced_analysis = getattr(analysis_result, 'enhanced_analysis_used', False)
-            
-            # Create Paragraph object for the colored result
-            colored_result = Paragraph(f'<font color="{result_color}"><b>{result_text}</b></font>', self.styles['CustomBodyText'])
-            
-            summary_data = [
-                ['Detection Result:', colored_result], 
-                ['Confidence Score:', probability_text],
-                ['Model Confidence:', confidence_text],
-                ['Enhanced Analysis:', "Yes" if enhanced_analysis else "No"]
-            ]
-            
-            table = Table(summary_data, colWidths=[2*inch, 4*inch])
-            table.setStyle(self._get_standard_table_style())
-            
-            story.append(table)
-            story.append(Spacer(1, 20))
-            
+            cache.set(cache_key, getvalue(), timeout=REPORT_CACHE_TIMEOUT)
         except Exception as e:
-            logger.error(f"Failed to add analysis summary: {str(e)}")
-            story.append(Paragraph("Analysis Summary - Error Loading", self.styles['SectionHeader']))
-            story.append(Spacer(1, 20))
+            logger.warning("Failed to cache PDF report: %s", e)
 
-    def _add_detection_details(self, story, analysis_result: Union[TextAnalysisResult, ImageAnalysisResult]):
+    @staticmethod
+    def _ensure_submission_loaded(analysis_result: Union[TextAnalysisResult, ImageAnalysisResult]) -> None:
         """
-        Add detection details section for both text and image analysis.
+        Load the analysis result's submission, with only a content preview, if the caller did not already load it.
         """
-        try:
-            detection_reasons = getattr(analysis_result, 'detection_reasons', None)
-            if not detection_reasons:
-                return
-                
-            story.append(Paragraph("Detection Details", self.styles['SectionHeader']))
-            
-            for reason in detection_reasons:
-                if not isinstance(reason, dict):
-                    continue
-                    
-                # Color code by type
-                type_colors = {
-                    'critical': 'red',
-                    'warning': 'orange', 
-                    'info': 'blue',
-                    'success': 'green'
-                }
-                
-                reason_type = reason.get('type', 'info')
-                color = type_colors.get(reason_type, 'black')
-                
-                # Safely get and escape title
-                title = reason.get("title", "Unknown")
-                title_escaped = html.escape(str(title))
-                title_text = f'<font color="{color}"><b>{title_escaped}</b></font>'
-                story.append(Paragraph(title_text, self.styles['CustomBodyText']))
-                
-                # Safely get and escape description and impact
-                description = html.escape(str(reason.get('description', 'No description available')))
-                impact = html.escape(str(reason.get('impact', 'No impact information')))
-                
-                story.append(Paragraph(f"Description: {description}", self.styles['CustomBodyText']))
-                story.append(Paragraph(f"Impact: {impact}", self.styles['CustomBodyText']))
-                story.append(Spacer(1, 10))
-                
-        except Exception as e:
-            logger.error(f"Failed to add detection details: {str(e)}")
+        state = getattr(analysis_result, '_state', None)
+        if isinstance(state, ModelState) and 'submission' not in state.fields_cache:
+            analysis_result.load_submission_for_report()
 
-    def _add_statistics_section(self, story, analysis_result: TextAnalysisResult):
+    def _append_kv_table(self, story, rows, col_widths=(2*inch, 4*inch)):
         """
-        Add statistics section.
+        Append a label/value table in the standard style followed by the section spacer.
+
+        :param story: Flowable list being built for the report.
+        :param rows: Table rows as [label, value] pairs.
+        :param col_widths: Widths of the label and value columns.
         """
-        try:
-            statistics = getattr(analysis_result, 'statistics', None)
-            if not statistics:
-                return
+        table = Table(rows, colWidths=list(col_widths))
+        table.setStyle(self._get_standard_table_style())
+        story.extend((table, Spacer(1, 20)))
+
+    def _add_report_metadata(self, story, ctx: _ReportContext, user_email: str):
+        """
+        Add report metadata section for both text and image analysis.
+        """
+        story.append(Paragraph("Report Information", self.styles['SectionHeader']))
+
+        metadata_data = [
+            ['Report Type:', ctx.analysis_type],
+            ['Report ID:', ctx.analysis_id],
+            ['Generated For:', _escape(user_email)],
+            ['Analysis Date:', ctx.created_at_str],
+            ['Report Generated:', datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')],
+            ['Processing Time:', ctx.processing_time_str]
+        ]
+        self._append_kv_table(story, metadata_data)
+
+    def _add_analysis_summary(self, story, ctx: _ReportContext):
+        """
+        Add analysis summary section for both text and image analysis.
+        """
+        story.append(Paragraph("Analysis Summary", self.styles['SectionHeader']))
+        
+        # Main result
+        result_color = 'red' if ctx.is_ai_generated else 'green'
+        result_text = "AI Generated" if ctx.is_ai_generated else "Human Created"
+        
+        # Create Paragraph object for the colored result
+        colored_result = Paragraph(f'<font color="{result_color}"><b>{result_text}</b></font>', self.styles['CustomBodyText'])
+        
+        summary_data = [
+            ['Detection Result:', colored_result], 
+            ['Confidence Score:', ctx.probability_text],
+            ['Model Confidence:', ctx.confidence_text],
+            ['Enhanced Analysis:', "Yes" if ctx.enhanced_analysis_used else "No"]
+        ]
+        self._append_kv_table(story, summary_data)
+
+    def _add_detection_details(self, story, ctx: _ReportContext):
+        """
+        Add detection details section for both text and image analysis.
+        """
+        detection_reasons = ctx.detection_reasons
+        if not detection_reasons:
+            return
+            
+        body_style = self.styles['CustomBodyText']
+        section = [Paragraph("Detection Details", self.styles['SectionHeader'])]
+        
+        for reason in detection_reasons:
+            if not isinstance(reason, dict):
+                continue
                 
-            story.append(Paragraph("Text Statistics", self.styles['SectionHeader']))
+            # Color code by type
+            color = _TYPE_COLORS.get(reason.get('type', 'info'), 'black')
             
-            stats_data = [
-                ['Total Words:', str(statistics.get('total_words', 'N/A'))],
-                ['Sentences:', str(statistics.get('sentences', 'N/A'))],
-                ['Avg Sentence Length:', str(statistics.get('avg_sentence_length', 'N/A'))],
-                ['AI Keywords Found:', str(statistics.get('ai_keywords_count', 'N/A'))],
-                ['Transition Words:', str(statistics.get('transition_words_count', 'N/A'))],
-                ['Corporate Jargon:', str(statistics.get('corporate_jargon_count', 'N/A'))],
-                ['Buzzwords:', str(statistics.get('buzzwords_count', 'N/A'))],
-                ['Human Indicators:', str(statistics.get('human_indicators_count', 'N/A'))]
-            ]
+            # Safely get and escape title
+            title = reason.get("title", "Unknown")
+            title_escaped = _escape(str(title))
+            title_text = f'<font color="{color}"><b>{title_escaped}</b></font>'
             
-            table = Table(stats_data, colWidths=[2.5*inch, 1.5*inch])
-            table.setStyle(self._get_standard_table_style())
+            # Safely get and escape description and impact
+            description = _escape(str(reason.get('description', 'No description available')))
+            impact = _escape(str(reason.get('impact', 'No impact information')))
             
-            story.append(table)
-            story.append(Spacer(1, 20))
+            section.extend((
+                Paragraph(title_text, body_style),
+                Paragraph(f"Description: {description}", body_style),
+                Paragraph(f"Impact: {impact}", body_style),
+                Spacer(1, 10)
+            ))
+
+        # Add the whole section to the story in one call.
+        story.extend(section)
+
+    def _add_statistics_section(self, story, ctx: _ReportContext):
+        """
+        Add statistics section.
+        """
+        statistics = ctx.statistics
+        if not statistics:
+            return
             
-        except Exception as e:
-            logger.error(f"Failed to add statistics section: {str(e)}")
+        story.append(Paragraph("Text Statistics", self.styles['SectionHeader']))
+        
+        # Bind the lookup once instead of resolving statistics.get on every row.
+        get = statistics.get
+        stats_data = [[label, str(get(key, 'N/A'))] for label, key in _STAT_ROWS]
+        self._append_kv_table(story, stats_data, col_widths=(2.5*inch, 1.5*inch))
 
-    def _add_text_sample(self, story, analysis_result: TextAnalysisResult):
+    def _add_text_sample(self, story, ctx: _ReportContext):
         """Add text sample section."""
-        try:
-            submission = getattr(analysis_result, 'submission', None)
-            if submission and hasattr(submission, 'content'):
-                story.append(Paragraph("Analysed Text Sample", self.styles['SectionHeader']))
-                
-                # Safely get content
-                content = getattr(submission, 'content', '')
-                if not content:
-                    content = "No content available"
-                else:
-                    # Truncate if too long
-                    if len(content) > 500:
-                        content = content[:500] + "... [truncated]"
-                
-                # Escape content for ReportLab
-                content_escaped = html.escape(content)
-                
-                story.append(Paragraph(f'"{content_escaped}"', self.styles['CustomBodyText']))
-                story.append(Spacer(1, 20))
-        except Exception as e:
-            logger.error(f"Could not add text sample: {str(e)}")
+        text_sample = _text_sample(ctx.submission)
+        if text_sample is not None:
+            # Escape content for ReportLab
+            content_escaped = _escape(text_sample)
+            
+            story.extend((
+                Paragraph("Analysed Text Sample", self.styles['SectionHeader']),
+                Paragraph(f'"{content_escaped}"', self.styles['CustomBodyText']),
+                Spacer(1, 20)
+            ))
 
-    def _add_image_section(self, story, analysis_result: ImageAnalysisResult):
+    def _add_image_section(self, story, ctx: _ReportContext):
         """
         Add the analysed image to the report with preserved aspect ratio.
         """
         try:
-            submission = getattr(analysis_result, 'submission', None)
+            submission = ctx.submission
             if not submission or not hasattr(submission, 'image_url'):
                 return
                 
@@ -374,8 +547,7 @@ class ReportService:
                     new_width = 4*inch
                     new_height = None
                 
-                story.append(img)
-                story.append(Spacer(1, 10))
+                story.extend((img, Spacer(1, 10)))
 
                 # Add image details
                 dimensions = getattr(submission, 'dimensions', None)
@@ -394,26 +566,26 @@ class ReportService:
                 story.append(Spacer(1, 20))
                 
             except Exception as img_error:
-                logger.error(f"Failed to add image to report: {str(img_error)}")
-                story.append(Paragraph(f"Image could not be loaded: {image_url}", self.styles['CustomBodyText']))
-                story.append(Spacer(1, 20))
+                logger.error("Failed to add image to report: %s", img_error)
+                ctx.degraded = True
+                story.extend((
+                    Paragraph(f"Image could not be loaded: {image_url}", self.styles['CustomBodyText']),
+                    Spacer(1, 20)
+                ))
                 
         except Exception as e:
-            logger.error(f"Failed to add image section: {str(e)}")
+            logger.error("Failed to add image section: %s", e)
+            ctx.degraded = True
 
     def _add_footer(self, story):
         """
         Add footer section.
         """
-        try:
-            story.append(Spacer(1, 30))
-            footer_text = """
-            <i>This report was generated by Detective AI - AI Content Detection System.<br/>
-            For questions about this analysis, please contact our support team.</i>
-            """
-            story.append(Paragraph(footer_text, self.styles['CustomBodyText']))
-        except Exception as e:
-            logger.error(f"Failed to add footer: {str(e)}")
+        footer_text = """
+        <i>This report was generated by Detective AI - AI Content Detection System.<br/>
+        For questions about this analysis, please contact our support team.</i>
+        """
+        story.extend((Spacer(1, 30), Paragraph(footer_text, self.styles['CustomBodyText'])))
 
     def _add_watermark(self, canvas, doc, text="Detective AI", font_size=40, alpha=0.1):
         """
@@ -421,19 +593,10 @@ class ReportService:
         """
         try:
             canvas.saveState()
-            canvas.setFont("Helvetica-Bold", font_size)
-            
-            # Set fill alpha and color separately
-            canvas.setFillAlpha(alpha)
-            canvas.setFillColorRGB(0.85, 0.85, 0.85)
-            
-            width, height = A4
-            canvas.translate(width / 2, height / 2)
-            canvas.rotate(45)
-            canvas.drawCentredString(0, 0, text)
+            self._draw_watermark(canvas, text, font_size, alpha)
             canvas.restoreState()
         except Exception as e:
-            logger.error(f"Failed to add watermark: {str(e)}")
+            logger.error("Failed to add watermark: %s", e)
 
     def _add_page_number(self, canvas, doc):
         """
@@ -441,18 +604,51 @@ class ReportService:
         """
         try:
             canvas.saveState()
-            width, _ = A4
-            page_num = canvas.getPageNumber()
-            canvas.setFont("Helvetica", 9)
-            canvas.setFillColorRGB(0, 0, 0)
-            canvas.drawRightString(width - 2*cm, 1*cm, f"Page {page_num}")
+            self._draw_page_number(canvas)
             canvas.restoreState()
         except Exception as e:
-            logger.error(f"Failed to add page number: {str(e)}")
+            logger.error("Failed to add page number: %s", e)
+
+    @staticmethod
+    def _draw_watermark(canvas, text="Detective AI", font_size=40, alpha=0.1):
+        """
+        Draw the diagonal watermark; the caller is responsible for saving and restoring canvas state.
+        """
+        canvas.setFont("Helvetica-Bold", font_size)
+        
+        # Set fill alpha and color separately
+        canvas.setFillAlpha(alpha)
+        canvas.setFillColorRGB(0.85, 0.85, 0.85)
+        
+        width, height = A4
+        canvas.translate(width / 2, height / 2)
+        canvas.rotate(45)
+        canvas.drawCentredString(0, 0, text)
+
+    @staticmethod
+    def _draw_page_number(canvas):
+        """
+        Draw the page number; the caller is responsible for saving and restoring canvas state.
+        """
+        width, _ = A4
+        canvas.setFont("Helvetica", 9)
+        canvas.setFillColorRGB(0, 0, 0)
+        canvas.drawRightString(width - 2*cm, 1*cm, f"Page {canvas.getPageNumber()}")
 
     def _apply_canvas_elements(self, canvas, doc):
         """
-        Apply all canvas-level elements like watermark and page numbers.
+        Apply all canvas-level elements like watermark and page numbers inside a single saved canvas state.
+        The watermark is recorded once per document as a form XObject and referenced from every page.
         """
-        self._add_watermark(canvas, doc)
-        self._add_page_number(canvas, doc)
\ No newline at end of file
+        canvas.saveState()
+        try:
+            self._draw_page_number(canvas)
+            if not canvas.hasForm(_WATERMARK_FORM):
+                canvas.beginForm(_WATERMARK_FORM)
+                self._draw_watermark(canvas)
+                canvas.endForm()
+            canvas.doForm(_WATERMARK_FORM)
+        except Exception as e:
+            logger.error("Failed to add canvas elements: %s", e)
+        finally:
+            canvas.restoreState()
\ No newline at end of file
@@ -1,18 +1,36 @@
 from django.contrib.contenttypes.models import ContentType
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import CharField, Count, Q, OuterRef, Subquery, Value
 from app.models.text_submission import TextSubmission
 from app.models.image_submission import ImageSubmission 
 from app.models.text_analysis_result import TextAnalysisResult
 from app.models.image_analysis_result import ImageAnalysisResult
 from app.serializers.submission_serializers import (
-    TextSubmissionListSerializer,
     TextSubmissionDetailSerializer,
     ImageSubmissionListSerializer,
     ImageSubmissionDetailSerializer,    
 )
+from rest_framework import serializers
 from typing import Dict, Any, Optional
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+# How long computed statistics are kept; changes to submissions or analyses invalidate them sooner. Without a shared
+# cache backend other server processes never see the invalidation, so statistics are then only kept briefly.
+STATISTICS_CACHE_TIMEOUT = 3600 if getattr(settings, 'SHARED_CACHE', False) else 30
+
+# How long an unfiltered history count is kept; changes to submissions invalidate it sooner. Without a shared cache
+# backend other server processes never see the invalidation, so the count is then only kept briefly.
+HISTORY_COUNT_CACHE_TIMEOUT = 3600 if getattr(settings, 'SHARED_CACHE', False) else 30
+
+# Formats created_at exactly as TextSubmissionListSerializer would for rows built from values().
+_DATETIME_FIELD = serializers.DateTimeField()
 
 class SubmissionHistoryService:
     """
@@ -22,6 +40,108 @@ class SubmissionHistoryService:
     :version: 10/09/2025
     """
 
+    # Columns read for history rows; the text content and other large fields are never loaded for history.
+    TEXT_LIST_FIELDS = ('id', 'name', 'created_at')
+    IMAGE_LIST_FIELDS = ('id', 'name', 'created_at', 'image', 'file_size', 'width', 'height')
+
+    # Submission models in lookup order, with the file fields whose stored objects are removed alongside the row.
+    DELETABLE_MODELS = ((TextSubmission, 'text', ()), (ImageSubmission, 'image', ('image',)))
+
+    @staticmethod
+    def _latest_analysis_subquery(result_model, submission_model) -> Subquery:
+        """
+        Build a subquery selecting the latest completed analysis ID for each submission row.
+
+        :param result_model: Analysis result model (TextAnalysisResult or ImageAnalysisResult)
+        :param submission_model: Submission model the results point at through the generic relation
+        :return: Subquery usable in an annotation on the submission queryset
+        """
+        return Subquery(
+            result_model.objects.filter(
+                content_type=ContentType.objects.get_for_model(submission_model),
+                object_id=OuterRef('pk'),
+                status=result_model.Status.COMPLETED
+            ).order_by('-created_at').values('id')[:1]
+        )
+
+    @staticmethod
+    def _aggregate_detection_counts(result_model, submission_model, submissions) -> Dict[str, int]:
+        """
+        Count a user's analyses and their AI/human verdicts in a single aggregate query.
+
+        :param result_model: Analysis result model (TextAnalysisResult or ImageAnalysisResult)
+        :param submission_model: Submission model the results point at through the generic relation
+        :param submissions: Queryset of the user's submissions of that type
+        :return: Dictionary with 'total', 'ai_detected' and 'human_detected' counts
+        """
+        counts = result_model.objects.filter(
+            content_type=ContentType.objects.get_for_model(submission_model),
+            object_id__in=submissions.values('id')
+        ).aggregate(
+            total=Count('id'),
+            ai_detected=Count('id', filter=Q(detection_result=result_model.DetectionResult.AI_GENERATED)),
+            human_detected=Count('id', filter=Q(detection_result=result_model.DetectionResult.HUMAN_WRITTEN))
+        )
+        return {key: value or 0 for key, value in counts.items()}
+
+    @staticmethod
+    def _history_rows(submissions, submission_type: str):
+        """
+        Reduce a submission queryset to the (id, created_at, type) rows used to order and paginate history.
+
+        :param submissions: Queryset of the user's submissions of one type
+        :param submission_type: 'text' or 'image'
+        :return: Values queryset that can be unioned with the other submission type
+        """
+        return submissions.annotate(
+            type=Value(submission_type, output_field=CharField())
+        ).values('id', 'created_at', 'type')
+
+    @staticmethod
+    def _serialize_history_rows(rows, text_submissions, image_submissions) -> list:
+        """
+        Serialize the submissions referenced by a page of history rows, preserving the page order.
+
+        :param rows: History rows for the current page, as produced by _history_rows
+        :param text_submissions: Filtered text submission queryset, or None if text is excluded
+        :param image_submissions: Filtered image submission queryset, or None if images are excluded
+        :return: List of serialized submissions with their 'type' field set
+        """
+        text_ids = [row['id'] for row in rows if row['type'] == 'text']
+        image_ids = [row['id'] for row in rows if row['type'] == 'image']
+        serialized = {}
+        
+        # Fetch only this page's submissions, resolving each row's latest analysis in the same query.
+        if text_ids:
+            page_text_rows = text_submissions.filter(id__in=text_ids).annotate(
+                latest_analysis_id=SubmissionHistoryService._latest_analysis_subquery(TextAnalysisResult, TextSubmission)
+            ).values(*SubmissionHistoryService.TEXT_LIST_FIELDS, 'latest_analysis_id')
+
+            # Text list rows are plain columns, so they are shaped directly rather than through a serializer.
+            for row in page_text_rows:
+                serialized[('text', str(row['id']))] = {
+                    'id': str(row['id']),
+                    'name': row['name'],
+                    'created_at': _DATETIME_FIELD.to_representation(row['created_at']),
+                    'analysis_id': str(row['latest_analysis_id']) if row['latest_analysis_id'] else None,
+                    'type': 'text'
+                }
+        
+        if image_ids:
+            page_image_submissions = image_submissions.filter(id__in=image_ids).only(
+                *SubmissionHistoryService.IMAGE_LIST_FIELDS
+            ).annotate(
+                latest_analysis_id=SubmissionHistoryService._latest_analysis_subquery(ImageAnalysisResult, ImageSubmission)
+            )
+            for submission_data in ImageSubmissionListSerializer(page_image_submissions, many=True).data:
+                submission_data['type'] = 'image'  # Add type field.
+                serialized[('image', str(submission_data['id']))] = submission_data
+        
+        return [
+            serialized[key] for key in ((row['type'], str(row['id'])) for row in rows)
+            if key in serialized
+        ]
+
     @staticmethod
     def get_user_submissions(user: User, page: int = 1, page_size: Optional[int] = 10, search: Optional[str] = None, submission_type: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -35,40 +155,38 @@ class SubmissionHistoryService:
         :return: Paginated submission data
         """
         try:
-            all_submissions = []
+            text_submissions = None
+            image_submissions = None
+            history_querysets = []
             
-            # Get text submissions using serializer.
+            # Build the text submission query.
             if submission_type != 'image':
                 text_submissions = TextSubmission.objects.filter(user=user)
                 if search:
                     text_submissions = text_submissions.filter(
                         Q(name__icontains=search) | Q(content__icontains=search)
                     )
-                
-                # Use TextSubmissionListSerializer.
-                text_serializer = TextSubmissionListSerializer(text_submissions, many=True)
-                for submission_data in text_serializer.data:
-                    submission_data['type'] = 'text'  # Add type field.
-                    all_submissions.append(submission_data)
+                history_querysets.append(SubmissionHistoryService._history_rows(text_submissions, 'text'))
             
-            # Get image submissions using serializer.
+            # Build the image submission query.
             if submission_type != 'text':
                 image_submissions = ImageSubmission.objects.filter(user=user)
                 if search:
                     image_submissions = image_submissions.filter(name__icontains=search)
-                
-                # Use ImageSubmissionListSerializer.
-                image_serializer = ImageSubmissionListSerializer(image_submissions, many=True)
-                for submission_data in image_serializer.data:
-                    submission_data['type'] = 'image'  # Add type field.
-                    all_submissions.append(submission_data)
+                history_querysets.append(SubmissionHistoryService._history_rows(image_submissions, 'image'))
             
-            # Sort by creation date (most recent first).
-            all_submissions.sort(key=lambda x: x['created_at'], reverse=True)
+            # Merge both types and sort by creation date (most recent first) in the database.
+            history = history_querysets[0]
+            if len(history_querysets) > 1:
+                history = history.union(*history_querysets[1:], all=True)
+            history = history.order_by('-created_at')
             
             # Handle pagination - if page_size is None, return all results
             if page_size is None:
                 # Return all submissions without pagination
+                all_submissions = SubmissionHistoryService._serialize_history_rows(
+                    list(history), text_submissions, image_submissions
+                )
                 return {
                     'success': True,
                     'submissions': all_submissions,
@@ -82,13 +200,21 @@ class SubmissionHistoryService:
                     }
                 }
             else:
-                # Use normal pagination.
-                paginator = Paginator(all_submissions, page_size)
+                # Use normal pagination; only the requested page is fetched and serialized.
+                paginator = Paginator(history, page_size)
+                if not search:
+                    # Unfiltered totals only change with the user's submissions, so skip the COUNT until then.
+                    count_cache_key = SubmissionHistoryService._history_count_cache_key(user.id, submission_type)
+                    paginator.count = cache.get_or_set(
+                        count_cache_key, lambda: paginator.count, timeout=HISTORY_COUNT_CACHE_TIMEOUT
+                    )
                 page_obj = paginator.get_page(page)
                 
                 return {
                     'success': True,
-                    'submissions': page_obj.object_list,
+                    'submissions': SubmissionHistoryService._serialize_history_rows(
+                        list(page_obj.object_list), text_submissions, image_submissions
+                    ),
                     'pagination': {
                         'current_page': page,
                         'total_pages': paginator.num_pages,
@@ -165,129 +291,225 @@ class SubmissionHistoryService:
         :return: Success/error response
         """
         try:
-            submission_name = None
-            submission_type = None
+            with transaction.atomic():
+                # Look the submission up in each table in turn; filter() avoids DoesNotExist control flow.
+                for submission_model, submission_type, file_fields in SubmissionHistoryService.DELETABLE_MODELS:
+                    submissions = submission_model.objects.filter(id=submission_id, user=user)
+                    row = submissions.values_list('name', *file_fields).first()
+                    if row is None:
+                        continue
+                    
+                    submission_name, *stored_files = row
+                    submissions.delete()
+                    SubmissionHistoryService._remove_stored_files_on_commit(stored_files)
+                    return {
+                        'success': True,
+                        'message': f'{submission_type.title()} submission "{submission_name}" deleted successfully'
+                    }
             
-            # Try to find and delete text submission
-            try:
-                submission = TextSubmission.objects.get(id=submission_id, user=user)
-                submission_name = submission.name
-                submission_type = 'text'
-                submission.delete()
-                
-                return {
-                    'success': True,
-                    'message': f'{submission_type.title()} submission "{submission_name}" deleted successfully'
-                }
-                
-            except TextSubmission.DoesNotExist:
-                pass  # Continue to try image submission
+            return {
+                'success': False,
+                'error': 'Submission not found or you do not have permission to delete it'
+            }
+
+        except Exception as e:
+            logger.exception("Failed to delete submission %s", submission_id)
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    @staticmethod
+    def delete_submissions(submission_ids: list, user: User) -> Dict[str, Any]:
+        """
+        Delete several submissions (text or image) at once, with one DELETE per submission table
+        and a single storage call for their stored files.
+
+        :param submission_ids: IDs of the submissions to delete
+        :param user: User deleting the submissions
+        :return: Success/error response with the number of submissions deleted
+        """
+        try:
+            deleted_count = 0
+            stored_files = []
+            with transaction.atomic():
+                for submission_model, _, file_fields in SubmissionHistoryService.DELETABLE_MODELS:
+                    submissions = submission_model.objects.filter(id__in=submission_ids, user=user)
+                    for file_field in file_fields:
+                        stored_files.extend(submissions.values_list(file_field, flat=True))
+                    _, deleted_per_model = submissions.delete()
+                    deleted_count += deleted_per_model.get(submission_model._meta.label, 0)
+                SubmissionHistoryService._remove_stored_files_on_commit(stored_files)
             
-            # Try to find and delete image submission
-            try:
-                submission = ImageSubmission.objects.get(id=submission_id, user=user)
-                submission_name = submission.name
-                submission_type = 'image'
-                submission.delete()
-                
-                return {
-                    'success': True,
-                    'message': f'{submission_type.title()} submission "{submission_name}" deleted successfully'
-                }
-                
-            except ImageSubmission.DoesNotExist:
+            if deleted_count == 0:
                 return {
                     'success': False,
-                    'error': 'Submission not found or you do not have permission to delete it'
+                    'error': 'No submissions found or you do not have permission to delete them'
                 }
+            
+            return {
+                'success': True,
+                'deleted_count': deleted_count,
+                'message': f'{deleted_count} submission(s) deleted successfully'
+            }
 
         except Exception as e:
-            import traceback
             return {
                 'success': False,
-                'error': str(traceback.format_exc())
+                'error': str(e)
             }
+
+    @staticmethod
+    def _remove_stored_files_on_commit(stored_files) -> None:
+        """
+        Remove the stored files of deleted submissions once the surrounding transaction commits.
+
+        :param stored_files: Storage names of the files to remove (empty names are ignored)
+        """
+        names = [name for name in stored_files if name]
+        if names:
+            transaction.on_commit(lambda: SubmissionHistoryService._remove_stored_files(names), robust=True)
+
+    @staticmethod
+    def _remove_stored_files(names: list) -> None:
+        """
+        Remove stored submission files, in a single call when the storage backend supports batch deletes.
+
+        :param names: Storage names of the files to remove
+        """
+        storage = ImageSubmission._meta.get_field('image').storage
+        delete_many = getattr(storage, 'delete_many', None)
+        if delete_many is not None:
+            delete_many(names)
+        else:
+            for name in names:
+                storage.delete(name)
     
+    @staticmethod
+    def _compute_submission_statistics(user: User) -> Dict[str, Any]:
+        """
+        Compute submission statistics for a user directly from the database.
+
+        :param user: User to compute statistics for
+        :return: Statistics dictionary
+        """
+        # Text submission statistics: one count plus one aggregate grouped by detection result.
+        text_submissions = TextSubmission.objects.filter(user=user)
+        total_text_submissions = text_submissions.count()
+        text_counts = SubmissionHistoryService._aggregate_detection_counts(
+            TextAnalysisResult, TextSubmission, text_submissions
+        )
+        total_text_analyses = text_counts['total']
+        text_ai_detected = text_counts['ai_detected']
+        text_human_detected = text_counts['human_detected']
+
+        # Image submission statistics: one count plus one aggregate grouped by detection result.
+        image_submissions = ImageSubmission.objects.filter(user=user)
+        total_image_submissions = image_submissions.count()
+        image_counts = SubmissionHistoryService._aggregate_detection_counts(
+            ImageAnalysisResult, ImageSubmission, image_submissions
+        )
+        total_image_analyses = image_counts['total']
+        image_ai_detected = image_counts['ai_detected']
+        image_human_detected = image_counts['human_detected']
+
+        # Combined statistics
+        total_submissions = total_text_submissions + total_image_submissions
+        total_analyses = total_text_analyses + total_image_analyses
+        total_ai_detected = text_ai_detected + image_ai_detected
+        total_human_detected = text_human_detected + image_human_detected
+        
+        return {
+            'total_submissions': total_submissions,
+            'total_analyses': total_analyses,
+            'ai_detected_count': total_ai_detected,
+            'human_detected_count': total_human_detected,
+            'ai_detection_rate': round((total_ai_detected / total_analyses * 100), 2) if total_analyses > 0 else 0,
+            'breakdown': {
+                'text': {
+                    'submissions': total_text_submissions,
+                    'analyses': total_text_analyses,
+                    'ai_detected': text_ai_detected,
+                    'human_detected': text_human_detected
+                },
+                'image': {
+                    'submissions': total_image_submissions,
+                    'analyses': total_image_analyses,
+                    'ai_detected': image_ai_detected,
+                    'human_detected': image_human_detected
+                }
+            }
+        }
+
+    @staticmethod
+    def _cache_version(user_id) -> str:
+        """
+        Get the version token that every cached value derived from a user's submissions is keyed on.
+
+        :param user_id: ID of the user
+        :return: Version token that changes whenever invalidate_user_cache is called for the user
+        """
+        version_key = f"submission_cache_version:{user_id}"
+        version = cache.get(version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.set(version_key, version, timeout=None)
+        return version
+
+    @staticmethod
+    def _statistics_cache_key(user_id) -> str:
+        """
+        Build the statistics cache key for a user from their current cache version.
+
+        :param user_id: ID of the user
+        :return: Cache key for the user's statistics
+        """
+        return f"submission_stats:{user_id}:{SubmissionHistoryService._cache_version(user_id)}"
+
+    @staticmethod
+    def _history_count_cache_key(user_id, submission_type: Optional[str]) -> str:
+        """
+        Build the cache key for the total number of items in a user's unfiltered history.
+
+        :param user_id: ID of the user
+        :param submission_type: Submission type filter ('text', 'image', or None for both)
+        :return: Cache key for the user's history count
+        """
+        version = SubmissionHistoryService._cache_version(user_id)
+        return f"submission_history_count:{user_id}:{submission_type or 'all'}:{version}"
+
+    @staticmethod
+    def invalidate_user_cache(user_id) -> None:
+        """
+        Invalidate a user's cached statistics and history counts by moving them to a new cache version. The version
+        moves once the surrounding transaction commits, since a request before then still reads the old rows and
+        would cache them under the new version.
+
+        :param user_id: ID of the user whose submissions or analyses changed
+        """
+        transaction.on_commit(
+            lambda: cache.set(f"submission_cache_version:{user_id}", uuid.uuid4().hex, timeout=None)
+        )
+
     @staticmethod
     def get_submission_statistics(user: User) -> Dict[str, Any]:
         """
         Get submission statistics for a user (both text and image).
+        Results are cached until the user's submissions or analyses change.
 
         :param user: User to get statistics for
         :return: Statistics data
         """
         try:
-            # Text submission statistics
-            total_text_submissions = TextSubmission.objects.filter(user=user).count()
-            text_content_type = ContentType.objects.get_for_model(TextSubmission)
-            
-            total_text_analyses = TextAnalysisResult.objects.filter(
-                content_type=text_content_type,
-                object_id__in=TextSubmission.objects.filter(user=user).values_list('id', flat=True)
-            ).count()
-            
-            text_ai_detected = TextAnalysisResult.objects.filter(
-                content_type=text_content_type,
-                object_id__in=TextSubmission.objects.filter(user=user).values_list('id', flat=True),
-                detection_result=TextAnalysisResult.DetectionResult.AI_GENERATED
-            ).count()
-            
-            text_human_detected = TextAnalysisResult.objects.filter(
-                content_type=text_content_type,
-                object_id__in=TextSubmission.objects.filter(user=user).values_list('id', flat=True),
-                detection_result=TextAnalysisResult.DetectionResult.HUMAN_WRITTEN
-            ).count()
-            
-            # Image submission statistics
-            total_image_submissions = ImageSubmission.objects.filter(user=user).count()
-            image_content_type = ContentType.objects.get_for_model(ImageSubmission)
-            
-            total_image_analyses = ImageAnalysisResult.objects.filter(
-                content_type=image_content_type,
-                object_id__in=ImageSubmission.objects.filter(user=user).values_list('id', flat=True)
-            ).count()
-            
-            image_ai_detected = ImageAnalysisResult.objects.filter(
-                content_type=image_content_type,
-                object_id__in=ImageSubmission.objects.filter(user=user).values_list('id', flat=True),
-                detection_result=ImageAnalysisResult.DetectionResult.AI_GENERATED
-            ).count()
-            
-            image_human_detected = ImageAnalysisResult.objects.filter(
-                content_type=image_content_type,
-                object_id__in=ImageSubmission.objects.filter(user=user).values_list('id', flat=True),
-                detection_result=ImageAnalysisResult.DetectionResult.HUMAN_WRITTEN
-            ).count()
-            
-            # Combined statistics
-            total_submissions = total_text_submissions + total_image_submissions
-            total_analyses = total_text_analyses + total_image_analyses
-            total_ai_detected = text_ai_detected + image_ai_detected
-            total_human_detected = text_human_detected + image_human_detected
+            cache_key = SubmissionHistoryService._statistics_cache_key(user.id)
+            statistics = cache.get(cache_key)
+            if statistics is None:
+                statistics = SubmissionHistoryService._compute_submission_statistics(user)
+                cache.set(cache_key, statistics, timeout=STATISTICS_CACHE_TIMEOUT)
             
             return {
                 'success': True,
-                'statistics': {
-                    'total_submissions': total_submissions,
-                    'total_analyses': total_analyses,
-                    'ai_detected_count': total_ai_detected,
-                    'human_detected_count': total_human_detected,
-                    'ai_detection_rate': round((total_ai_detected / total_analyses * 100), 2) if total_analyses > 0 else 0,
-                    'breakdown': {
-                        'text': {
-                            'submissions': total_text_submissions,
-                            'analyses': total_text_analyses,
-                            'ai_detected': text_ai_detected,
-                            'human_detected': text_human_detected
-                        },
-                        'image': {
-                            'submissions': total_image_submissions,
-                            'analyses': total_image_analyses,
-                            'ai_detected': image_ai_detected,
-                            'human_detected': image_human_detected
-                        }
-                    }
-                }
+                'statistics': statistics
             }
             
         except Exception as e:
@@ -1,11 +1,61 @@
 import os
 import uuid
+import mimetypes
 import requests
+from requests.adapters import HTTPAdapter
 from supabase import create_client, Client
 from django.conf import settings
 from django.core.files.storage import Storage
 from django.core.files.base import ContentFile
 from django.utils.deconstruct import deconstructible
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Timeout in seconds for downloading stored files over HTTP.
+HTTP_TIMEOUT = 30
+
+# Maximum number of concurrent uploads in a batch.
+UPLOAD_MAX_WORKERS = 8
+
+# Pooled HTTP session for downloading stored files, so repeated opens reuse TCP and TLS connections.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+
+# Content types for the image formats uploaded to storage; other extensions fall back to Python's built-in table.
+_CONTENT_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+# Built-in mimetypes table only, so the result does not depend on the host's /etc/mime.types.
+_MIME_TYPES = mimetypes.MimeTypes()
+
+def _content_type_for(name: str) -> str:
+    """
+    Get the content type for a file name from its extension.
+
+    :param name: File name or path
+    :return: MIME type, or application/octet-stream if the extension is unknown
+    """
+    ext = os.path.splitext(name)[1].lower()
+    return _CONTENT_TYPES.get(ext) or _MIME_TYPES.guess_type(name)[0] or 'application/octet-stream'
+
+@lru_cache(maxsize=None)
+def _get_client(url: str, key: str) -> Client:
+    """
+    Create the Supabase client for a project once per process, so every storage instance shares its connection pool.
+
+    :param url: Supabase project URL
+    :param key: Supabase service role key
+    :return: Shared Supabase client
+    """
+    return create_client(url, key)
 
 @deconstructible
 class SupabaseStorage(Storage):
@@ -20,7 +70,7 @@ class SupabaseStorage(Storage):
         """
         Create an instance of the Supabase Storage Service.
         """
-        self.supabase: Client = create_client(
+        self.supabase: Client = _get_client(
             settings.SUPABASE_URL,
             settings.SUPABASE_SERVICE_ROLE_KEY
         )
@@ -38,8 +88,8 @@ class SupabaseStorage(Storage):
             # Get the public URL
             url = self.url(name)
             
-            # Download the file content
-            response = requests.get(url)
+            # Download the file content over the pooled session
+            response = _HTTP_SESSION.get(url, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
             
             # Return as ContentFile
@@ -70,24 +120,15 @@ class SupabaseStorage(Storage):
                 return name
                 
             except Exception as upload_error:
-                # If upsert fails, try update instead
+                # Upsert already overwrites server-side, so retry a remaining conflict once under a unique name
                 if "already exists" in str(upload_error).lower() or "409" in str(upload_error):
-                    try:
-                        result = self.supabase.storage.from_(self.bucket_name).update(
-                            path=name,
-                            file=file_data,
-                            file_options={"content-type": self._get_content_type(name)}
-                        )
-                        return name
-                    except Exception as update_error:
-                        # If update also fails, generate unique name
-                        unique_name = self._get_unique_name(name)
-                        result = self.supabase.storage.from_(self.bucket_name).upload(
-                            path=unique_name,
-                            file=file_data,
-                            file_options={"content-type": self._get_content_type(unique_name)}
-                        )
-                        return unique_name
+                    unique_name = self._get_unique_name(name)
+                    result = self.supabase.storage.from_(self.bucket_name).upload(
+                        path=unique_name,
+                        file=file_data,
+                        file_options={"content-type": self._get_content_type(unique_name)}
+                    )
+                    return unique_name
                 else:
                     raise upload_error
                 
@@ -119,44 +160,36 @@ class SupabaseStorage(Storage):
         try:
             self.supabase.storage.from_(self.bucket_name).remove([name])
         except Exception:
-            pass
+            logger.exception("Failed to delete %s from storage bucket %s", name, self.bucket_name)
+
+    def delete_many(self, names: list) -> None:
+        """
+        Delete several files from Supabase storage in a single request.
+        """
+        try:
+            self.supabase.storage.from_(self.bucket_name).remove(list(names))
+        except Exception:
+            logger.exception("Failed to delete %s file(s) from storage bucket %s", len(names), self.bucket_name)
         
     def exists(self, name: str) -> bool:
         """
-        Check if file exists in Supabase storage.
+        Check if file exists in Supabase storage with a HEAD request on its public URL.
         """
         try:
-            result = self.supabase.storage.from_(self.bucket_name).list(
-                path=os.path.dirname(name) if os.path.dirname(name) else "",
-                limit=1000 # type: ignore
-            )
-            
-            if not result:
-                return False
-                
-            # Check if the specific file exists in the result
-            filename = os.path.basename(name)
-            return any(file.get('name') == filename for file in result)
+            response = _HTTP_SESSION.head(self.url(name), timeout=HTTP_TIMEOUT)
+            return response.status_code == 200
         except Exception:
             return False
         
     def size(self, name: str) -> int:
         """
-        Get file size.
+        Get file size from the Content-Length of a HEAD request on its public URL.
         """
         try:
-            result = self.supabase.storage.from_(self.bucket_name).list(
-                path=os.path.dirname(name) if os.path.dirname(name) else ""
-            )
-            
-            # Get the images size 
-            filename = os.path.basename(name)
-            for file in result:
-                if isinstance(file, dict) and file.get('name') == filename:
-                    metadata = file.get('metadata', {})
-                    if isinstance(metadata, dict):
-                        return metadata.get('size', 0)
-            return 0
+            response = _HTTP_SESSION.head(self.url(name), timeout=HTTP_TIMEOUT)
+            if response.status_code != 200:
+                return 0
+            return int(response.headers.get('Content-Length', 0))
         except Exception:
             return 0
         
@@ -172,15 +205,7 @@ class SupabaseStorage(Storage):
         """
         Get content type based on file extension.
         """
-        ext = os.path.splitext(name)[1].lower()
-        content_types = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp'
-        }
-        return content_types.get(ext, 'application/octet-stream')
+        return _content_type_for(name)
     
 class SupabaseStorageService:
     """
@@ -191,7 +216,7 @@ class SupabaseStorageService:
         """
         Create an instance of the Supabase storage client.
         """
-        self.supabase: Client = create_client(
+        self.supabase: Client = _get_client(
             settings.SUPABASE_URL,
             settings.SUPABASE_SERVICE_ROLE_KEY
         )
@@ -222,6 +247,21 @@ class SupabaseStorageService:
         except Exception as e:
             raise Exception(f"Failed to upload image: {e}")
     
+    def upload_images(self, pairs: list, max_workers: int = UPLOAD_MAX_WORKERS) -> list:
+        """
+        Upload several image files to Supabase storage concurrently over the shared client.
+        
+        :param pairs: List of (local file path, storage path) tuples
+        :param max_workers: Maximum number of uploads in flight at once
+        :return: Public URLs of the uploaded files, in the same order as pairs
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+            return list(executor.map(lambda pair: self.upload_image(*pair), pairs))
+    
     def get_public_url(self, storage_path: str) -> str:
         """
         Get public URL for stored file.
@@ -242,12 +282,4 @@ class SupabaseStorageService:
         """
         Get content type based on file extension.
         """
-        ext = os.path.splitext(file_path)[1].lower()
-        content_types = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp'
-        }
-        return content_types.get(ext, 'application/octet-stream')
\ No newline at end of file
+        return _content_type_for(file_path)
\ No newline at end of file
@@ -1,9 +1,14 @@
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Q
 from rest_framework.authtoken.models import Token
 from app.models.user import User
+from app.services.admin_service import AdminService
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import logging
 import secrets
 
@@ -20,6 +25,14 @@ class UserService:
     # Token expiration settings (tokens expire after 24 hours).
     TOKEN_EXPIRY_HOURS = 1000
 
+    # Profile fields a caller may change through update_user_profile.
+    PROFILE_UPDATE_FIELDS = frozenset({'first_name', 'last_name', 'email', 'username'})
+
+    # Failed verification attempts allowed per email within the attempt window (in seconds). Attempts are counted in
+    # the default cache, so the limit only holds across server processes with a shared cache backend (REDIS_URL).
+    VERIFICATION_MAX_ATTEMPTS = 5
+    VERIFICATION_ATTEMPT_WINDOW = 3600
+
     @staticmethod
     def generate_verification_code() -> str:
         """
@@ -56,11 +69,95 @@ class UserService:
             user = token.user
             token.delete()
             new_token = Token.objects.create(user=user)
-            logger.info(f"Token refreshed for user: {user.pk} ({user.email})")
+            logger.info("Token refreshed for user: %s (%s)", user.pk, user.email)
             return new_token
             
         return token
  
+    @staticmethod
+    def _prefetched_token(user: User):
+        """
+        Return the user's token loaded through select_related('auth_token'), or None if they have none.
+
+        :param user: User fetched with select_related('auth_token').
+        :return: Token instance or None.
+        """
+        # The reverse one-to-one raises a subclass of AttributeError when no token row exists.
+        return getattr(user, 'auth_token', None)
+ 
+    @staticmethod
+    def _verification_attempts_key(email: str) -> str:
+        """
+        Build the cache key counting failed verification attempts for an email.
+
+        :param email: Email address being verified.
+        :return: Cache key for the attempt counter.
+        """
+        return f'verification_attempts:{email.lower()}'
+
+    @staticmethod
+    def _record_failed_verification(email: str) -> None:
+        """
+        Count a failed verification attempt, starting a new window if none is open.
+
+        :param email: Email address being verified.
+        """
+        attempts_key = UserService._verification_attempts_key(email)
+        cache.add(attempts_key, 0, timeout=UserService.VERIFICATION_ATTEMPT_WINDOW)
+        try:
+            cache.incr(attempts_key)
+        except ValueError:
+            # The window expired between add and incr, so start a new one.
+            cache.set(attempts_key, 1, timeout=UserService.VERIFICATION_ATTEMPT_WINDOW)
+
+    @staticmethod
+    def _ensure_user_available(username: Optional[str], email: Optional[str]) -> None:
+        """
+        Check that neither the email nor the username is taken, using a single query for both.
+
+        :param username: Username to check, or None to skip the username check.
+        :param email: Email to check, or None to skip the email check.
+        :raises ValueError: If the email or username already belongs to a user.
+        """
+        conditions = Q()
+        counts = {}
+        if email is not None:
+            conditions |= Q(email=email)
+            counts['email'] = Count('pk', filter=Q(email=email))
+        if username is not None:
+            conditions |= Q(username=username)
+            counts['username'] = Count('pk', filter=Q(username=username))
+
+        if not counts:
+            return
+
+        taken = User.objects.filter(conditions).aggregate(**counts)
+
+        if taken.get('email'):
+            raise ValueError("A user with this email already exists.")
+        
+        if taken.get('username'):
+            raise ValueError("A user with this username already exists.")
+
+    @staticmethod
+    def _insert_user(username: str, email: str, **fields) -> User:
+        """
+        Insert a new user, relying on the unique constraints if a concurrent signup takes the email or username.
+
+        :param username: Username for the new user.
+        :param email: Email for the new user.
+        :param fields: Remaining fields passed to User.objects.create_user.
+        :return: The created User instance.
+        :raises ValueError: If the email or username was taken between the availability check and the insert.
+        """
+        try:
+            # Savepoint, so the surrounding transaction can still be queried after a constraint violation.
+            with transaction.atomic():
+                return User.objects.create_user(username=username, email=email, **fields)
+        except IntegrityError:
+            UserService._ensure_user_available(username, email)
+            raise
+
     @staticmethod
     @transaction.atomic
     def create_user_with_verification(username: str, email: str, password: str, first_name: str, last_name: str, is_admin: bool = False):
@@ -76,17 +173,13 @@ class UserService:
         :returns: Tuple of (User instance, verification_code)
         """
         # Check for existing users.
-        if User.objects.filter(email=email).exists():
-            raise ValueError("A user with this email already exists.")
-        
-        if User.objects.filter(username=username).exists():
-            raise ValueError("A user with this username already exists.")
+        UserService._ensure_user_available(username, email)
         
         # Generate verification code that expires in 15 minutes from creation.
         verification_code = UserService.generate_verification_code()
         expires_at = timezone.now() + timedelta(minutes=15)
         
-        user = User.objects.create_user(
+        user = UserService._insert_user(
             username=username,
             email=email,
             password=password,
@@ -96,14 +189,11 @@ class UserService:
             is_email_verified=False,
             is_staff=is_admin,
             is_superuser=is_admin,
+            email_verification_code_hash=User.hash_verification_code(verification_code),    # Stored with the insert.
             verification_code_expires_at=expires_at
         )
 
-        # Hash and store the verification code.
-        user.set_verification_code(verification_code)
-        user.save(update_fields=['email_verification_code_hash'])
-
-        logger.info(f"User created with verification required: {user.pk} ({user.email})")
+        logger.info("User created with verification required: %s (%s)", user.pk, user.email)
         
         # Return plain verification code for verification email.
         return user, verification_code
@@ -114,13 +204,9 @@ class UserService:
         """
         Create an admin user without email verification requirement.
         """
-        if User.objects.filter(email=email).exists():
-            raise ValueError("A user with this email already exists.")
-        
-        if User.objects.filter(username=username).exists():
-            raise ValueError("A user with this username already exists.")
+        UserService._ensure_user_available(username, email)
 
-        user = User.objects.create_user(
+        user = UserService._insert_user(
             username=username,
             email=email,
             password=password,
@@ -132,7 +218,7 @@ class UserService:
             is_superuser=True
         )
 
-        logger.info(f"Admin user created: {user.pk} ({user.email})")
+        logger.info("Admin user created: %s (%s)", user.pk, user.email)
         return user
     
     @staticmethod
@@ -145,8 +231,16 @@ class UserService:
         :param verification_code: 6 digit verification code.
         :return: Dictionary with success status, user, and token if successful.
         """
+        # Limit guesses, since the 6-digit code is short and its hash is fast to compute.
+        attempts_key = UserService._verification_attempts_key(email)
+        if cache.get(attempts_key, 0) >= UserService.VERIFICATION_MAX_ATTEMPTS:
+            return {
+                'success': False,
+                'error': 'Too many verification attempts. Please try again later.'
+            }
+        
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.select_related('auth_token').get(email=email)
 
             # Check if already verified.
             if user.is_email_verified:
@@ -164,22 +258,36 @@ class UserService:
             
             # Check if code matches using hash comparison
             if not user.check_verification_code(verification_code):
+                UserService._record_failed_verification(email)
                 return {
                     'success': False,
                     'error': 'Invalid verification code'
                 }
             
-            # Verify the user.
+            # Verify the user with one UPDATE, guarded so a concurrent second verification changes nothing.
+            verified = User.objects.filter(pk=user.pk, is_email_verified=False).update(
+                is_email_verified=True,
+                is_active=True,
+                email_verification_code_hash=None,
+                verification_code_expires_at=None
+            )
+            if not verified:
+                return {
+                    'success': False,
+                    'error': 'Email is already verified'
+                }
+            
+            # QuerySet.update() sends no post_save signal, so refresh the verified and active user counts directly.
+            AdminService.invalidate_cache()
+
+            # Mirror the update on the returned instance.
             user.is_email_verified = True
             user.is_active = True
             user.clear_verification_code()  # Clear sensitive data
-            user.save(update_fields=[
-                'is_email_verified', 'is_active',
-                'email_verification_code_hash', 'verification_code_expires_at'
-            ])
 
-            # Create authentication token.
-            token, created = Token.objects.get_or_create(user=user)
+            # Create authentication token, unless one was already loaded with the user.
+            token = UserService._prefetched_token(user) or Token.objects.create(user=user)
+            cache.delete(attempts_key)
 
             return {
                 'success': True,
@@ -218,8 +326,12 @@ class UserService:
             user.verification_code_expires_at = expires_at
             user.set_verification_code(verification_code)  # Hash the new code
             user.save(update_fields=['email_verification_code_hash', 'verification_code_expires_at'])
+
+            # Failed attempts were against the replaced code, so the new code gets a fresh allowance. Otherwise wrong
+            # guesses by anyone who knows the address would lock the user out until the window expires.
+            cache.delete(UserService._verification_attempts_key(email))
             
-            logger.info(f"Verification code resent for user: {user.pk} ({user.email})")
+            logger.info("Verification code resent for user: %s (%s)", user.pk, user.email)
             
             return {
                 'success': True,
@@ -243,31 +355,40 @@ class UserService:
         :return: Tuple of (User instance, token) if authentication successful, (None, None) otherwise.
         """
         try:
-            user = User.objects.get(email=email)
+            # Load the user's token in the same query, so no separate token lookup is needed.
+            user = User.objects.select_related('auth_token').get(email=email)
+
+            # Hash the password before any early return, so response time does not reveal the account's state.
+            password_valid = user.check_password(password)
 
             if not user.is_email_verified or not user.is_active:
                 return None, None
             
-            if user.check_password(password):
+            if password_valid:
                 user.update_last_login()
                 
-                # Get existing token or create new one
-                token, created = Token.objects.get_or_create(user=user)
+                # Use the existing token or create a new one
+                token = UserService._prefetched_token(user)
                 
-                # Check if token is still valid, refresh if needed
-                if not created and not UserService.is_token_valid(token):
+                if token is None:
+                    token = Token.objects.create(user=user)
+                elif not UserService.is_token_valid(token):
+                    # Replace an expired token
                     token.delete()
                     token = Token.objects.create(user=user)
-                    logger.info(f"Token recreated for user: {user.pk} ({user.email})")
+                    logger.info("Token recreated for user: %s (%s)", user.pk, user.email)
                 else:
+                    # Refresh the token if it is close to expiry
                     token = UserService.refresh_token_if_needed(token)
                 
-                logger.info(f"User authenticated: {user.pk} ({user.email})")
+                logger.info("User authenticated: %s (%s)", user.pk, user.email)
                 return user, token.key
                 
             return None, None
         
         except User.DoesNotExist:
+            # Run the password hasher once anyway, so unknown emails take as long as wrong passwords.
+            User().set_password(password)
             return None, None
                
     @staticmethod
@@ -281,10 +402,10 @@ class UserService:
         try:
             # Delete the user's current token
             Token.objects.filter(user=user).delete()
-            logger.info(f"User logged out: {user.pk} ({user.email})")
+            logger.info("User logged out: %s (%s)", user.pk, user.email)
             return True
         except Exception as e:
-            logger.error(f"Error logging out user {user.pk}: {str(e)}")
+            logger.error("Error logging out user %s: %s", user.pk, e)
             return False
             
     @staticmethod
@@ -296,7 +417,8 @@ class UserService:
         :return: User instance or None if not found.
         """
         try:
-            return User.objects.get(id=user_id)
+            # Skip the credential hashes; profile callers never read them.
+            return User.objects.defer('password', 'email_verification_code_hash').get(id=user_id)
         
         except (User.DoesNotExist, ValueError):
             return None
@@ -326,19 +448,22 @@ class UserService:
         :return: Dictionary with user and verification info if email changed.
         """
         try:
-            user = User.objects.get(id=user_id)
+            # The password and verification hash are not needed to update or return the profile.
+            user = User.objects.defer('password', 'email_verification_code_hash').get(id=user_id)
             original_email = user.email  # Store original email
 
-            # Define allowable fields for update.
-            allowed_fields = ['first_name', 'last_name', 'email', 'username']
             email_changed = False
             verification_code = None
 
-            # Check for duplicate email if email is being updated.
-            if 'email' in update_data and update_data['email'] != user.email:
-                if User.objects.filter(email=update_data['email']).exists():
-                    raise ValueError("A user with this email already exists.")
-                
+            # Check for duplicate email and username in one query, only for the values that are changing.
+            email_changing = 'email' in update_data and update_data['email'] != user.email
+            username_changing = 'username' in update_data and update_data['username'] != user.username
+            UserService._ensure_user_available(
+                update_data['username'] if username_changing else None,
+                update_data['email'] if email_changing else None
+            )
+
+            if email_changing:
                 # Require re-verification when email changes
                 verification_code = UserService.generate_verification_code()
                 expires_at = timezone.now() + timedelta(minutes=15)
@@ -347,31 +472,29 @@ class UserService:
                 user.is_active = False  # Deactivate until new email is verified
                 user.verification_code_expires_at = expires_at
                 user.set_verification_code(verification_code)
-                
-                # Add verification fields to update list
-                allowed_fields.extend(['is_email_verified', 'is_active', 'email_verification_code_hash', 'verification_code_expires_at'])
                 email_changed = True
                 
-            # Check for duplicate username if username is being updated.
-            if 'username' in update_data and update_data['username'] != user.username:
-                if User.objects.filter(username=update_data['username']).exists():
-                    raise ValueError("A user with this username already exists.")
-                
             # Update allowed fields.
             updated_fields = []
             for field, value in update_data.items():
-                if field in allowed_fields and hasattr(user, field):
-                    # Only update if value has changed
-                    if getattr(user, field) != value:
-                        setattr(user, field, value)
-                        updated_fields.append(field)
+                if field not in UserService.PROFILE_UPDATE_FIELDS:
+                    continue
+                
+                # Only update if value has changed
+                if getattr(user, field) != value:
+                    setattr(user, field, value)
+                    updated_fields.append(field)
+            
+            # Save the re-verification state set above along with the new email.
+            if email_changed:
+                updated_fields.extend(['is_email_verified', 'is_active', 'email_verification_code_hash', 'verification_code_expires_at'])
             
             # Save the updated fields to the user's profile.
             if updated_fields:
                 user.save(update_fields=updated_fields)
-                logger.info(f"User profile updated: {user.pk} ({user.email}) - Fields: {', '.join(updated_fields)}")
+                logger.info("User profile updated: %s (%s) - Fields: %s", user.pk, user.email, ', '.join(updated_fields))
             else:
-                logger.info(f"No changes made to user profile: {user.pk} ({user.email})")
+                logger.info("No changes made to user profile: %s (%s)", user.pk, user.email)
 
             # Return result with verification info if needed
             result = {
@@ -401,20 +524,21 @@ class UserService:
         :raises ValueError: If current password is incorrect.
         """
         try:
-            user = User.objects.get(id=user_id)
+            # Only the password (to verify) and email (for logging) are needed.
+            user = User.objects.only('id', 'email', 'password').get(id=user_id)
             
             # Verify current password.
             if not user.check_password(current_password):
                 raise ValueError("Current password is incorrect.")
             
-            # Set new password.
-            user.set_password(new_password)
-            user.save(update_fields=['password'])
+            # Set new password with a direct UPDATE; the tokens are deleted next, which clears their cached
+            # authentication, so the user post_save handler would only repeat that work.
+            User.objects.filter(pk=user.pk).update(password=make_password(new_password))
 
             # Invalidate all existing tokens for security.
             Token.objects.filter(user=user).delete()
             
-            logger.info(f"Password changed for user: {user.pk} ({user.email})")
+            logger.info("Password changed for user: %s (%s)", user.pk, user.email)
             return True
         
         except User.DoesNotExist:
@@ -430,14 +554,16 @@ class UserService:
         :return: True if deleted, False if not found.
         """
         try:
-            user = User.objects.get(id=user_id)
-            user.delete()
-            logger.info(f"User deleted: {user.pk} ({user.email})")
-            return True
+            # Delete straight from the queryset; the count says whether the user existed.
+            deleted, _ = User.objects.filter(id=user_id).delete()
         
-        except (User.DoesNotExist, ValueError):
+        except (ValidationError, ValueError):
             return False
         
+        if deleted:
+            logger.info("User deleted: %s", user_id)
+        return deleted > 0
+        
     @staticmethod
     def validate_user_token(token_key: str) -> dict:
         """
@@ -451,7 +577,7 @@ class UserService:
             
             if not UserService.is_token_valid(token):
                 token.delete()
-                logger.info(f"Expired token deleted for user: {token.user.pk}")
+                logger.info("Expired token deleted for user: %s", token.user.pk)
                 return {
                     'valid': False,
                     'error': 'Token expired'
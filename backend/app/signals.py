@@ -0,0 +1,113 @@
+import logging
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from app.authentication import token_cache_key
+from app.models.user import User
+from app.models.text_submission import TextSubmission
+from app.models.image_submission import ImageSubmission
+from app.models.text_analysis_result import TextAnalysisResult
+from app.models.image_analysis_result import ImageAnalysisResult
+from app.models.feedback import Feedback
+from app.services.admin_service import AdminService
+from app.services.submission_history_service import SubmissionHistoryService
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=TextSubmission)
+@receiver(post_delete, sender=TextSubmission)
+@receiver(post_save, sender=ImageSubmission)
+@receiver(post_delete, sender=ImageSubmission)
+def invalidate_user_cache_for_submission(sender, instance, **kwargs):
+    """
+    Invalidate the owner's cached submission statistics and history counts when a submission is saved or deleted.
+
+    :param sender: Submission model class that sent the signal
+    :param instance: Submission instance that changed
+    """
+    SubmissionHistoryService.invalidate_user_cache(instance.user_id)
+
+
+@receiver(post_save, sender=TextAnalysisResult)
+@receiver(post_delete, sender=TextAnalysisResult)
+@receiver(post_save, sender=ImageAnalysisResult)
+@receiver(post_delete, sender=ImageAnalysisResult)
+def invalidate_user_cache_for_analysis(sender, instance, **kwargs):
+    """
+    Invalidate the submission owner's cached statistics and history counts when an analysis result is saved or deleted.
+
+    :param sender: Analysis result model class that sent the signal
+    :param instance: Analysis result instance that changed
+    """
+    try:
+        submission_model = ContentType.objects.get_for_id(instance.content_type_id).model_class()
+        user_id = submission_model.objects.filter(pk=instance.object_id).values_list('user_id', flat=True).first()
+        if user_id is not None:
+            SubmissionHistoryService.invalidate_user_cache(user_id)
+    except Exception as e:
+        logger.error("Failed to invalidate submission statistics for analysis %s: %s", instance.pk, e)
+
+
+@receiver(post_save, sender=TextSubmission)
+@receiver(post_delete, sender=TextSubmission)
+@receiver(post_save, sender=TextAnalysisResult)
+@receiver(post_delete, sender=TextAnalysisResult)
+@receiver(post_save, sender=Feedback)
+@receiver(post_delete, sender=Feedback)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_admin_cache(sender, instance, update_fields=None, **kwargs):
+    """
+    Invalidate the cached admin dashboard data when a model it is computed from is saved or deleted.
+
+    :param sender: Model class that sent the signal
+    :param instance: Instance that changed
+    :param update_fields: Fields passed to save(update_fields=...), or None for a full save or a delete
+    """
+    # The login timestamp is not shown on the dashboard, so logins keep the cached data.
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+
+    AdminService.invalidate_cache()
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_cached_token(sender, instance, **kwargs):
+    """
+    Drop a deleted token's cached authentication, so logout and token rotation take effect immediately.
+    The entry is dropped once the deletion commits, since a request before then still finds the token and would
+    cache it again.
+
+    :param sender: Token model class that sent the signal
+    :param instance: Token instance that was deleted
+    """
+    cache_key = token_cache_key(instance.key)
+    transaction.on_commit(lambda: cache.delete(cache_key))
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_tokens_for_user(sender, instance, created, update_fields, **kwargs):
+    """
+    Drop the cached authentication for a user's tokens when the user is saved, so requests see the updated user.
+    The entries are dropped once the save commits, so a request in between cannot cache the old user again.
+
+    :param sender: User model class that sent the signal
+    :param instance: User instance that was saved
+    :param created: Whether the user was just created (and so has no tokens yet)
+    :param update_fields: Fields passed to save(update_fields=...), or None for a full save
+    """
+    if created or not apps.is_installed('rest_framework.authtoken'):
+        return
+    
+    # The login timestamp update does not affect authentication, so it keeps the cached entries.
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    
+    token_keys = Token.objects.filter(user_id=instance.pk).values_list('key', flat=True)
+    cache_keys = [token_cache_key(key) for key in token_keys]
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
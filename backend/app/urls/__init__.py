@@ -0,0 +1,11 @@
+from django.urls import include, path
+
+# Each prefix resolves through its own include, so a request is only matched against its own section's patterns.
+urlpatterns = [
+    path('analysis/', include('app.urls.analysis')),
+    path('users/', include('app.urls.users')),
+    path('feedback/', include('app.urls.feedback')),
+    path('admin/', include('app.urls.admin')),
+    path('reports/', include('app.urls.reports')),
+    path('submissions/', include('app.urls.submissions')),
+]
@@ -0,0 +1,17 @@
+from django.urls import path
+from app.views import feedback_views
+from app.views import admin_views
+
+urlpatterns = [
+    # Admin feedback management
+    path('feedback/', feedback_views.get_all_feedback_admin, name='get_all_feedback_admin'),
+    path('feedback/<str:feedback_id>/reviewed/', feedback_views.mark_feedback_as_reviewed, name='mark_feedback_as_reviewed'),
+    path('feedback/<str:feedback_id>/resolved/', feedback_views.mark_feedback_as_resolved, name='mark_feedback_as_resolved'),
+
+    # Admin dashboard and statistics
+    path('statistics/', admin_views.get_system_statistics, name='get_system_statistics'),
+    path('activity/', admin_views.get_recent_activity, name='get_recent_activity'),
+    path('performance/', admin_views.get_performance_metrics, name='get_performance_metrics'),
+    path('dashboard/', admin_views.get_admin_dashboard_data, name='get_admin_dashboard_data'),
+    path('users/', admin_views.get_users_list, name='admin_users_list'),
+]
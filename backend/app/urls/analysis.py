@@ -0,0 +1,10 @@
+from django.urls import path
+from app.views import analysis_views
+
+urlpatterns = [
+    # Text analysis
+    path('text/', analysis_views.analyse_text, name="analyse_text"),
+    
+    # Image analysis
+    path('image/', analysis_views.analyse_image, name='analyse_image'),
+]
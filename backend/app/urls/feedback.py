@@ -0,0 +1,11 @@
+from django.urls import path
+from app.views import feedback_views
+
+urlpatterns = [
+    # User feedback management
+    path('', feedback_views.get_user_feedback, name='get_user_feedback'),
+    path('statistics/', feedback_views.get_feedback_statistics, name='get_feedback_statistics'),
+    path('<str:feedback_id>/delete/', feedback_views.delete_feedback, name='delete_feedback'),
+    path('analysis/<str:analysis_id>/', feedback_views.get_feedback_for_analysis, name='get_feedback_for_analysis'),
+    path('analysis/<str:analysis_id>/submit/', feedback_views.submit_feedback, name='submit_feedback'),
+]
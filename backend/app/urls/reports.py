@@ -0,0 +1,8 @@
+from django.urls import path
+from app.views import report_views
+
+urlpatterns = [
+    # Analysis report download and email management
+    path('analysis/<str:analysis_id>/download/', report_views.download_report, name='download_report'),
+    path('analysis/<str:analysis_id>/email/', report_views.email_report, name='email_report'),
+]
@@ -0,0 +1,11 @@
+from django.urls import path
+from app.views import submission_history_views
+
+urlpatterns = [
+    # Submission history management
+    path('', submission_history_views.get_user_submissions, name='get_user_submissions'),
+    path('statistics/', submission_history_views.get_submission_statistics, name='get_submission_statistics'),
+    path('delete/', submission_history_views.delete_submissions, name='delete_submissions'),
+    path('<str:submission_id>/', submission_history_views.get_submission_detail, name='get_submission_detail'),
+    path('<str:submission_id>/delete/', submission_history_views.delete_submission, name='delete_submission'),
+]
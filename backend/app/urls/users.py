@@ -0,0 +1,25 @@
+from django.urls import path
+from app.views import user_views
+
+urlpatterns = [
+    # User authentication
+    path('register/', user_views.register_user, name='register_user'),
+    path('login/', user_views.login_user, name='login_user'),
+    path('logout/', user_views.logout_user, name='logout_user'),
+
+    # Password managemement
+    path('forgot-password/', user_views.forgot_password, name='forgot_password'),
+    path('reset-password/', user_views.reset_password, name='reset_password'),
+
+    # User verification
+    path('verify-email/', user_views.verify_email, name='verify_email'),
+    path('resend-verification/', user_views.resend_verification_code, name='resend_verification'),
+    path('validate-token/', user_views.validate_token, name='validate_token'),
+
+    # User profile management
+    path('me/', user_views.get_current_user, name='get_current_user'),
+    path('<str:user_id>/', user_views.get_user_profile, name='get_user_profile'),
+    path('<str:user_id>/update/', user_views.update_user_profile, name='update_user_profile'),
+    path('<str:user_id>/change-password/', user_views.change_user_password, name='change_user_password'),
+    path('<str:user_id>/delete/', user_views.delete_user, name='delete_user'),
+]
@@ -0,0 +1,45 @@
+from rest_framework import status
+from rest_framework.response import Response
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Any
+import time
+
+@lru_cache(maxsize=1)
+def _timestamp_for(second: int) -> str:
+    """
+    Format a Unix time in whole seconds as a local ISO 8601 timestamp. Only the latest second is kept, so responses
+    sent within the same second share one string.
+
+    :param second: Unix time in whole seconds
+    :return: ISO 8601 timestamp
+    """
+    return datetime.fromtimestamp(second).isoformat()
+
+def create_json_response(success: bool = True, message: Optional[str] = None, data: Optional[Any] = None, error: Optional[str] = None, status_code = status.HTTP_200_OK, **kwargs):
+    """
+    Create standardised JSON response. The message, data and error fields are left out when they are None.
+
+    :param success: Whether the request succeeded
+    :param message: Message describing the result
+    :param data: Response payload
+    :param error: Error description
+    :param status_code: HTTP status code
+    :param kwargs: Additional fields, placed after the data field
+    :return: DRF response
+    """
+    response_data = {'success': success}
+    if message is not None:
+        response_data['message'] = message
+    if data is not None:
+        response_data['data'] = data
+
+    # Add any additional fields.
+    response_data.update(kwargs)
+
+    # Add error and timestamp at the end.
+    if error is not None:
+        response_data['error'] = error
+    response_data['timestamp'] = _timestamp_for(int(time.time()))
+
+    return Response(response_data, status=status_code)
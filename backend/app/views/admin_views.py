@@ -1,26 +1,100 @@
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from rest_framework.response import Response
-from datetime import datetime
-from app.services.admin_service import AdminService
-from typing import Optional, Any
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from app.services.admin_service import AdminService, ADMIN_ACTIVITY_CACHE_TIMEOUT, ADMIN_STATISTICS_CACHE_TIMEOUT
+from app.utils.responses import create_json_response
 
-def create_json_response(success: bool = True, message: Optional[str] = None, data: Optional[Any] = None, error: Optional[str] = None, status_code = status.HTTP_200_OK):
-    """
-    Create standardised JSON response.
-    """
-    response_data = {
-        'success': success,
-        'message': message,
-        'data': data,
-        'error': error,
-        'timestamp': datetime.now().isoformat()
-    }
-    return Response(response_data, status=status_code)
+# Shared pool for running independent dashboard queries concurrently.
+DASHBOARD_MAX_WORKERS = 4
+_dashboard_executor = ThreadPoolExecutor(max_workers=DASHBOARD_MAX_WORKERS, thread_name_prefix='admin-dashboard')
+
+# Accepted values for the activity limit and performance period, and the defaults used outside them.
+ACTIVITY_LIMIT_RANGE = range(1, 101)
+DEFAULT_ACTIVITY_LIMIT = 20
+PERFORMANCE_DAYS_RANGE = range(1, 91)
+DEFAULT_PERFORMANCE_DAYS = 7
+
+def _run_with_db_connection(func, *args, **kwargs):
+    """
+    Run a service call in a worker thread, releasing stale or broken database connections around it as Django does
+    around each request.
+
+    :param func: Service callable to run
+    :return: Result of the callable
+    """
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+def _get_admin_response(view_func, request, etag: str, max_age: int, *args, **kwargs):
+    """
+    Run an admin view, reusing its encoded JSON body while the data's ETag is unchanged. A repeat request is
+    answered from the cached bytes, skipping the service call, response construction and JSON encoding. Only
+    successful JSON responses are cached; other formats, such as the browsable API, always run the view.
+
+    :param view_func: Admin view to run
+    :param request: Admin request
+    :param etag: Current ETag of the view's data
+    :param max_age: Number of seconds the view's data is cached for
+    :return: Cached JSON response, or the view's response
+    """
+    if request.accepted_renderer.format != 'json':
+        return view_func(request, *args, **kwargs)
+
+    cache_key = f"admin_response:{request.get_full_path()}:{request.accepted_media_type}:{etag}"
+    content = cache.get(cache_key)
+    if content is not None:
+        return HttpResponse(content, content_type=request.accepted_media_type)
+
+    response = view_func(request, *args, **kwargs)
+    if status.is_success(response.status_code):
+        content = request.accepted_renderer.render(
+            response.data, request.accepted_media_type, {'request': request, 'response': response}
+        )
+        cache.set(cache_key, content, max_age)
+    return response
+
+def _conditional_admin_get(max_age: int):
+    """
+    Answer repeated requests for unchanged admin dashboard data with an empty 304 Not Modified, or from the cached
+    response body. Successful responses carry a weak ETag from AdminService.get_data_etag, which clients send back in
+    If-None-Match. It is applied below the permission checks, so only admins are answered.
+
+    :param max_age: Number of seconds the view's data is cached for
+    :return: Decorator for an admin view
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            etag = AdminService.get_data_etag(max_age)
+            request_etags = [tag.removeprefix('W/') for tag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))]
+
+            if etag in request_etags or '*' in request_etags:
+                response = HttpResponseNotModified()
+                response['ETag'] = f'W/{etag}'
+            else:
+                response = _get_admin_response(view_func, request, etag, max_age, *args, **kwargs)
+                if status.is_success(response.status_code):
+                    response['ETag'] = f'W/{etag}'
+
+            # Clients must revalidate before reusing a response, and shared caches must not store it.
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
+@_conditional_admin_get(ADMIN_STATISTICS_CACHE_TIMEOUT)
 def get_system_statistics(request):
     """
     Get system-wide statistics for admin dashboard.
@@ -52,6 +126,7 @@ def get_system_statistics(request):
     
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
+@_conditional_admin_get(ADMIN_ACTIVITY_CACHE_TIMEOUT)
 def get_recent_activity(request):
     """
     Get recent activity across the system.
@@ -67,8 +142,8 @@ def get_recent_activity(request):
             limit = int(limit_param)
             
             # Validate limit
-            if limit < 1 or limit > 100:
-                limit = 20
+            if limit not in ACTIVITY_LIMIT_RANGE:
+                limit = DEFAULT_ACTIVITY_LIMIT
         else:
             # No limit - return all activities
             limit = None
@@ -108,6 +183,7 @@ def get_recent_activity(request):
     
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
+@_conditional_admin_get(ADMIN_STATISTICS_CACHE_TIMEOUT)
 def get_performance_metrics(request):
     """
     Get performance metrics over a specified time period.
@@ -115,11 +191,11 @@ def get_performance_metrics(request):
     GET /api/admin/performance/?days=7
     """
     try:
-        days = int(request.GET.get('days', 7))
+        days = int(request.GET.get('days', DEFAULT_PERFORMANCE_DAYS))
         
         # Validate days parameter
-        if days < 1 or days > 90:
-            days = 7
+        if days not in PERFORMANCE_DAYS_RANGE:
+            days = DEFAULT_PERFORMANCE_DAYS
             
         result = AdminService.get_performance_metrics(days=days)
         
@@ -151,6 +227,7 @@ def get_performance_metrics(request):
     
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
+@_conditional_admin_get(ADMIN_ACTIVITY_CACHE_TIMEOUT)
 def get_admin_dashboard_data(request):
     """
     Get comprehensive admin dashboard data (statistics + recent activity).
@@ -158,9 +235,11 @@ def get_admin_dashboard_data(request):
     GET /api/admin/dashboard/
     """
     try:
-        # Get both statistics and recent activity.
-        stats_result = AdminService.get_system_statistics()
-        activity_result = AdminService.get_recent_activity()
+        # Get both statistics and recent activity concurrently, so latency is that of the slower query.
+        stats_future = _dashboard_executor.submit(_run_with_db_connection, AdminService.get_system_statistics)
+        activity_future = _dashboard_executor.submit(_run_with_db_connection, AdminService.get_recent_activity)
+        stats_result = stats_future.result()
+        activity_result = activity_future.result()
         
         if stats_result['success'] and activity_result['success']:
             return create_json_response(
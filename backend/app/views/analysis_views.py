@@ -1,5 +1,4 @@
 from rest_framework import status, permissions
-from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from app.services.ai_text_analyser import AiTextAnalyser
 from app.services.ai_image_analyser import AiImageAnalyser
@@ -8,23 +7,144 @@ from app.models.image_submission import ImageSubmission
 from app.services.claude_service import ClaudeService
 from app.ai.ai_text_model import AiTextModel
 from app.ai.ai_image_model import AiImageModel
-from typing import Optional, Any
+from app.utils.responses import create_json_response
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.db import close_old_connections, transaction
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional, Tuple
+from PIL import Image, UnidentifiedImageError
 import tempfile
+import shutil
 import os
+import logging
 
-def create_json_response(success: bool = True, message: Optional[str] = None, data: Optional[Any] = None, error: Optional[str] = None, status_code = status.HTTP_200_OK):
+logger = logging.getLogger(__name__)
+
+# Buffer size used when copying an in-memory upload to a temporary file for analysis.
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Largest image file accepted for analysis, in bytes.
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+# Largest image accepted for analysis, in pixels, checked from the header before the image is decoded.
+MAX_IMAGE_PIXELS = 40_000_000
+
+# Allowed image file extensions, and the image formats each may contain. Pillow reports JPEGs carrying multi-picture
+# data, as many phone and camera photos do, as MPO.
+_EXTENSION_FORMATS = {'.jpg': {'JPEG', 'MPO'}, '.jpeg': {'JPEG', 'MPO'}, '.png': {'PNG'}}
+
+# Shared pool for generating submission names with Claude after the response has been sent.
+NAMING_MAX_WORKERS = 4
+_naming_executor = ThreadPoolExecutor(max_workers=NAMING_MAX_WORKERS, thread_name_prefix='submission-naming')
+
+@lru_cache(maxsize=1)
+def _get_text_analyser() -> AiTextAnalyser:
+    """
+    Get the text analyser shared by every request in this process. It holds no per-request state, so reusing it
+    skips rebuilding the model wrappers and the Claude client on each request.
+
+    :return: Shared text analyser instance
+    """
+    return AiTextAnalyser()
+
+@lru_cache(maxsize=1)
+def _get_image_analyser() -> AiImageAnalyser:
+    """
+    Get the image analyser shared by every request in this process, loading the image model on first use.
+
+    :return: Shared image analyser instance
+    """
+    return AiImageAnalyser(AiImageModel())
+
+def _read_image_header(image_file) -> Optional[Tuple[str, int, int]]:
+    """
+    Identify an uploaded image from its header. Pillow opens images lazily, so only the header is read and nothing
+    is decoded.
+
+    :param image_file: Uploaded image file, rewound afterwards
+    :return: Tuple of (format, width, height), or None if the file is not a readable image
+    """
+    try:
+        with Image.open(image_file) as img:
+            return img.format, img.width, img.height
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError):
+        return None
+    finally:
+        image_file.seek(0)
+
+def _wants_sync_name(request) -> bool:
+    """
+    Check whether the client asked for the generated submission name in the response (?sync_name=1), rather than
+    having it applied in the background.
+
+    :param request: Analysis request
+    :return: True if the name should be generated before responding
+    """
+    return request.query_params.get('sync_name') == '1'
+
+def _wants_echo(request) -> bool:
+    """
+    Check whether the client asked for the submitted text to be echoed back in the response (?echo=1).
+
+    :param request: Analysis request
+    :return: True if the response should include the input text
+    """
+    return request.query_params.get('echo') == '1'
+
+def _project_fields(request, data: dict) -> dict:
     """
-    Create standardised JSON response.
+    Keep only the fields the client selected with ?fields= (e.g. ?fields=id,name). Unknown names are ignored, and
+    all fields are kept when none are selected.
+
+    :param request: Analysis request
+    :param data: Fields that can be returned
+    :return: Selected fields
     """
-    response_data = {
-        'success': success,
-        'message': message,
-        'data': data,
-        'error': error,
-        'timestamp': datetime.now().isoformat()
-    }
-    return Response(response_data, status=status_code)
+    fields = request.query_params.get('fields')
+    if not fields:
+        return data
+    selected = {field.strip() for field in fields.split(',')}
+    return {key: value for key, value in data.items() if key in selected}
+
+def _name_text_submission(submission_id, text: str) -> None:
+    """
+    Replace a text submission's placeholder name with one generated by Claude. Runs on the naming executor, so a
+    failure is logged and the placeholder name is kept.
+
+    :param submission_id: ID of the submission to rename
+    :param text: Submitted text
+    """
+    close_old_connections()
+    try:
+        submission_name = ClaudeService().create_text_submission_name(text, max_length=50)
+        TextSubmission.objects.filter(id=submission_id).update(name=submission_name)
+    except Exception as e:
+        logger.warning("Failed to generate a name for text submission %s: %s", submission_id, e)
+    finally:
+        close_old_connections()
+
+def _name_image_submission(submission_id, image_path: str) -> None:
+    """
+    Replace an image submission's placeholder name with one generated by Claude, then delete the image copy handed
+    over for naming. Runs on the naming executor, so a failure is logged and the placeholder name is kept.
+
+    :param submission_id: ID of the submission to rename
+    :param image_path: Path to a temporary copy of the image owned by this task
+    """
+    close_old_connections()
+    try:
+        submission_name = ClaudeService().create_image_submission_name(image_path, max_length=50)
+        ImageSubmission.objects.filter(id=submission_id).update(name=submission_name)
+    except Exception as e:
+        logger.warning("Failed to generate a name for image submission %s: %s", submission_id, e)
+    finally:
+        try:
+            os.unlink(image_path)
+        except OSError as cleanup_error:
+            logger.warning("Failed to clean up temporary file: %s", cleanup_error)
+        close_old_connections()
 
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
@@ -48,44 +168,60 @@ def analyse_text(request):
         )
     
     try:
-        # Create model and analyser instances.
-        analyser = AiTextAnalyser()
+        # Get the shared analyser instance.
+        analyser = _get_text_analyser()
 
-        # For registered users, create a submission.
-        submission = None
-        if request.user.is_authenticated:
-            # Generate submission name if not provided.
-            if not submission_name:
+        # For registered users, name the submission before the transaction, so Claude is not called while it is open.
+        name_in_background = False
+        if request.user.is_authenticated and not submission_name:
+            # Generate submission name if not provided. By default a date-based placeholder is saved and Claude
+            # names the submission in the background; ?sync_name=1 waits for the generated name instead.
+            fallback_name = f"Text Analysis {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+            if _wants_sync_name(request):
                 try:
                     # Use Claude to generate a smart name
                     claude_service = ClaudeService()
                     submission_name = claude_service.create_text_submission_name(text, max_length=50)
                 except Exception:
                     # Fallback to date-based name if Claude fails
-                    submission_name = f"Text Analysis {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+                    submission_name = fallback_name
+            else:
+                submission_name = fallback_name
+                name_in_background = True
 
-            # Create the submission.
-            submission = TextSubmission.objects.create(
-                name=submission_name,
-                content=text,
-                user=request.user
-            )
+        # Perform analysis before anything is saved, so a failed analysis leaves no submission behind.
+        result = analyser.analyse(text)
 
-        # Perform analysis.
-        result = analyser.analyse(text, user=request.user, submission=submission)
+        # Create the submission and save its analysis in one short transaction, so they are committed together.
+        submission = None
+        if request.user.is_authenticated:
+            with transaction.atomic():
+                submission = TextSubmission.objects.create(
+                    name=submission_name,
+                    content=text,
+                    user=request.user
+                )
+                analyser.save_result(result, request.user, submission, text)
+
+                # Rename the submission only once it is committed, so the naming task always finds it.
+                if name_in_background:
+                    transaction.on_commit(lambda: _naming_executor.submit(_name_text_submission, submission.id, text))
 
         response_data = {
-            'input_text': text,
             'analysis_result': result
         }
 
+        # The submitted text is only echoed back on request (?echo=1), since the client already has it.
+        if _wants_echo(request):
+            response_data['input_text'] = text
+
         # Add submission information for registered users.
         if request.user.is_authenticated and submission:
-            response_data['submission'] = {
+            response_data['submission'] = _project_fields(request, {
                 'id': str(submission.id),
                 'name': submission.name,
                 'created_at': submission.created_at.isoformat()
-            }
+            })
 
         return create_json_response(
             success=True,
@@ -121,8 +257,7 @@ def analyse_image(request):
     submission_name = request.data.get('name', None)
 
     # Validate file size.  # Fixed typo
-    max_size = 10 * 1024 * 1024
-    if image_file.size > max_size:
+    if image_file.size > MAX_IMAGE_BYTES:
         return create_json_response(
             success=False,
             error='Image file too large. Maximum size is 10MB.',
@@ -130,51 +265,105 @@ def analyse_image(request):
         )
     
     # Validate file extension
-    allowed_extensions = ['.jpg', '.jpeg', '.png']
     file_extension = os.path.splitext(image_file.name)[1].lower()
-    if file_extension not in allowed_extensions:
+    if file_extension not in _EXTENSION_FORMATS:
         return create_json_response(
             success=False,
             error='Unsupported file format. Please upload JPG, JPEG, or PNG files.',
             status_code=status.HTTP_400_BAD_REQUEST
         )
     
+    # Check the real format and dimensions from the header, so corrupt, mislabelled or oversized images are rejected
+    # before they are written to disk or analysed.
+    image_header = _read_image_header(image_file)
+    if image_header is None or image_header[0] not in _EXTENSION_FORMATS[file_extension]:
+        return create_json_response(
+            success=False,
+            error='Invalid image file. Please upload a valid JPG, JPEG, or PNG image.',
+            status_code=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if image_header[1] * image_header[2] > MAX_IMAGE_PIXELS:
+        return create_json_response(
+            success=False,
+            error='Image dimensions too large. Maximum is 40 megapixels.',
+            status_code=status.HTTP_400_BAD_REQUEST
+        )
+    
     temp_file_path = None
 
     try:
-        # Save uploaded file temporarily for analysis
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-            for chunk in image_file.chunks():
-                temp_file.write(chunk)
-            temp_file_path = temp_file.name
+        if isinstance(image_file, TemporaryUploadedFile):
+            # Large uploads are already on disk, so analyse Django's temporary file in place (Django deletes it).
+            image_path = image_file.temporary_file_path()
+        else:
+            # Save in-memory uploads temporarily for analysis.
+            with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
+                temp_file_path = temp_file.name
+                image_file.seek(0)
+                shutil.copyfileobj(image_file, temp_file, UPLOAD_COPY_BUFFER_SIZE)
+            image_path = temp_file_path
 
-        # Create model and analyser instances
-        model = AiImageModel()
-        analyser = AiImageAnalyser(model)
+        # Get the shared analyser instance.
+        analyser = _get_image_analyser()
 
-        # For registered users, create a submission.
+        # For registered users, name the submission before the transaction, so Claude is not called while it is open.
         submission = None
+        name_in_background = False
         if request.user.is_authenticated:
-            # Generate submission name if not provided
+            # Generate submission name if not provided. By default a filename-based placeholder is saved and Claude
+            # names the submission in the background; ?sync_name=1 waits for the generated name instead.
             if not submission_name:
-                try:
-                    # Use Claude to generate a smart name
-                    claude_service = ClaudeService()
-                    submission_name = claude_service.create_image_submission_name(temp_file_path, max_length=50)
-                except Exception:
-                    # Fallback to filename-based name if Claude fails
-                    submission_name = f"Image Analysis - {os.path.splitext(image_file.name)[0]}"
+                fallback_name = f"Image Analysis - {os.path.splitext(image_file.name)[0]}"
+                if _wants_sync_name(request):
+                    try:
+                        # Use Claude to generate a smart name
+                        claude_service = ClaudeService()
+                        submission_name = claude_service.create_image_submission_name(image_path, max_length=50)
+                    except Exception:
+                        # Fallback to filename-based name if Claude fails
+                        submission_name = fallback_name
+                else:
+                    submission_name = fallback_name
+                    name_in_background = True
+
+        # Perform analysis before anything is saved, so a failed analysis leaves no submission behind.
+        result = analyser.analyse(image_path)
 
-            # Create the submission with the uploaded image
+        if request.user.is_authenticated:
+            # Read the image's size and dimensions from the upload and store it in Supabase before the transaction,
+            # so the transaction only holds the database writes.
             submission = ImageSubmission(
                 name=submission_name,
-                user=request.user
+                user=request.user,
+                image=image_file
             )
-            # Save the image file to Supabase storage
-            submission.image.save(image_file.name, image_file, save=True)
+            submission.store_image()
+
+            # Create the submission and save its analysis in one short transaction, so they are committed together.
+            try:
+                with transaction.atomic():
+                    submission.save()
+                    analyser.save_result(result, request.user, submission, image_path)
+            except Exception:
+                # The rows were rolled back, so delete the stored image no submission refers to.
+                try:
+                    submission.image.delete(save=False)
+                except Exception as cleanup_error:
+                    logger.warning("Failed to delete stored image %s: %s", submission.image.name, cleanup_error)
+                raise
 
-        # Perform analysis (FIXED: moved outside the auth check)
-        result = analyser.analyse(temp_file_path, user=request.user, submission=submission)
+        # Name the submission in the background once analysis no longer needs the image. The naming task gets its
+        # own copy of the image: the analysis copy if it belongs to this view, otherwise a new one.
+        if name_in_background:
+            if temp_file_path is not None:
+                naming_path, temp_file_path = temp_file_path, None
+            else:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as naming_file:
+                    naming_path = naming_file.name
+                    with open(image_path, 'rb') as source:
+                        shutil.copyfileobj(source, naming_file, UPLOAD_COPY_BUFFER_SIZE)
+            transaction.on_commit(lambda: _naming_executor.submit(_name_image_submission, submission.id, naming_path))
 
         response_data = {
             'analysis_result': result
@@ -182,14 +371,14 @@ def analyse_image(request):
 
         # Add submission information for registered users
         if request.user.is_authenticated and submission:
-            response_data['submission'] = {
+            response_data['submission'] = _project_fields(request, {
                 'id': str(submission.id),
                 'name': submission.name,
                 'image_url': submission.image.url if submission.image else None,  
                 'file_size_mb': submission.file_size_mb,
                 'dimensions': submission.dimensions,
                 'created_at': submission.created_at.isoformat() if submission.created_at else None
-            }
+            })
 
         return create_json_response(
             success=True,
@@ -211,4 +400,4 @@ def analyse_image(request):
             try:
                 os.unlink(temp_file_path)
             except Exception as cleanup_error:
-                print(f"Warning: Failed to clean up temporary file: {cleanup_error}")
\ No newline at end of file
+                logger.warning("Failed to clean up temporary file: %s", cleanup_error)
\ No newline at end of file
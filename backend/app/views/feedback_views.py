@@ -1,24 +1,9 @@
-from datetime import datetime
-from typing import Optional, Any
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from rest_framework.response import Response
 from app.services.feedback_service import FeedbackService
 from app.models.feedback import Feedback
-
-def create_json_response(success: bool = True, message: Optional[str] = None, data: Optional[Any] = None, error: Optional[str] = None, status_code = status.HTTP_200_OK):
-    """
-    Create standardised JSON response.
-    """
-    response_data = {
-        'success': success,
-        'message': message,
-        'data': data,
-        'error': error,
-        'timestamp': datetime.now().isoformat()
-    }
-    return Response(response_data, status=status_code)
+from app.utils.responses import create_json_response
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
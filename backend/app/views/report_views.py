@@ -1,28 +1,52 @@
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
+from django.core.cache import cache
 from django.http import HttpResponse
 from app.services.report_service import ReportService
 from app.services.email_service import EmailService
 from app.models.text_analysis_result import TextAnalysisResult
 from app.models.image_analysis_result import ImageAnalysisResult
-from typing import Optional, Any
-from datetime import datetime
+from app.utils.responses import create_json_response
+from typing import Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
-def create_json_response(success: bool = True, message: Optional[str] = None, data: Optional[Any] = None, error: Optional[str] = None, status_code = status.HTTP_200_OK):
-    """Create standardised JSON response."""
-    response_data = {
-        'success': success,
-        'message': message,
-        'data': data,
-        'error': error,
-        'timestamp': datetime.now().isoformat()
-    }
-    return Response(response_data, status=status_code)
+# How long the type of an analysis is remembered. An analysis never changes type, so this only bounds the cache size.
+ANALYSIS_TYPE_CACHE_TIMEOUT = 86400
+
+# Analysis result model for each analysis type, in the order they are tried when the type is not known.
+_ANALYSIS_MODELS = {'text': TextAnalysisResult, 'image': ImageAnalysisResult}
+
+def _get_analysis(analysis_id) -> Tuple[Optional[Union[TextAnalysisResult, ImageAnalysisResult]], Optional[str]]:
+    """
+    Find a text or image analysis result by ID, with its submission loaded for the report. Its type is cached once
+    found, so later requests for the same analysis (such as emailing a report after downloading it) query only its
+    own table.
+
+    :param analysis_id: ID of the analysis result
+    :return: Tuple of (analysis result, analysis type), or (None, None) if there is no such analysis
+    """
+    cache_key = f'analysis_type:{analysis_id}'
+    cached_type = cache.get(cache_key)
+    analysis_types = [cached_type] if cached_type in _ANALYSIS_MODELS else list(_ANALYSIS_MODELS)
+
+    for analysis_type in analysis_types:
+        model = _ANALYSIS_MODELS[analysis_type]
+        try:
+            analysis = model.objects.get(id=analysis_id)
+        except model.DoesNotExist:
+            continue
+
+        if analysis_type != cached_type:
+            cache.set(cache_key, analysis_type, ANALYSIS_TYPE_CACHE_TIMEOUT)
+
+        # Load the submission without its full text content, for both the ownership check and the report.
+        analysis.load_submission_for_report()
+        return analysis, analysis_type
+
+    return None, None
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -33,44 +57,32 @@ def download_report(request, analysis_id):
     GET /api/reports/analysis/<analysis_id>/download/
     """
     try:
-        # Try to get text analysis first
-        analysis = None
-        analysis_type = None
-        
-        try:
-            analysis = TextAnalysisResult.objects.get(id=analysis_id)
-            analysis_type = 'text'
-        except TextAnalysisResult.DoesNotExist:
-            try:
-                analysis = ImageAnalysisResult.objects.get(id=analysis_id)
-                analysis_type = 'image'
-            except ImageAnalysisResult.DoesNotExist:
-                return create_json_response(
-                    success=False,
-                    error='Analysis result not found',
-                    status_code=status.HTTP_404_NOT_FOUND
-                )
+        analysis, analysis_type = _get_analysis(analysis_id)
+        if analysis is None:
+            return create_json_response(
+                success=False,
+                error='Analysis result not found',
+                status_code=status.HTTP_404_NOT_FOUND
+            )
         
-        # Check ownership
-        if analysis.submission and analysis.submission.user != request.user:
+        # Check ownership against the submission's user ID, so the user row is not loaded
+        if analysis.submission and analysis.submission.user_id != request.user.id:
             return create_json_response(
                 success=False,
                 error='You can only download reports for your own analyses',
                 status_code=status.HTTP_403_FORBIDDEN
             )
         
-        # Generate report
+        # Generate report straight into the PDF response
+        response = HttpResponse(content_type='application/pdf')
         report_service = ReportService()
-        pdf_buffer = report_service.generate_analysis_report(analysis, request.user.email)
-        
-        # Return PDF response
-        response = HttpResponse(pdf_buffer.read(), content_type='application/pdf')
+        report_service.generate_analysis_report_to(response, analysis, request.user.email)
         response['Content-Disposition'] = f'attachment; filename="{analysis_type}_analysis_report_{analysis_id}.pdf"'
         
         return response
         
     except Exception as e:
-        logger.error(f"Failed to generate report: {str(e)}")
+        logger.error("Failed to generate report: %s", e)
         return create_json_response(
             success=False,
             error=f'Failed to generate report: {str(e)}',
@@ -86,26 +98,16 @@ def email_report(request, analysis_id):
     POST /api/reports/analysis/<analysis_id>/email/
     """
     try:
-        # Try to get text analysis first
-        analysis = None
-        analysis_type = None
-        
-        try:
-            analysis = TextAnalysisResult.objects.get(id=analysis_id)
-            analysis_type = 'text'
-        except TextAnalysisResult.DoesNotExist:
-            try:
-                analysis = ImageAnalysisResult.objects.get(id=analysis_id)
-                analysis_type = 'image'
-            except ImageAnalysisResult.DoesNotExist:
-                return create_json_response(
-                    success=False,
-                    error='Analysis result not found',
-                    status_code=status.HTTP_404_NOT_FOUND
-                )
+        analysis, analysis_type = _get_analysis(analysis_id)
+        if analysis is None:
+            return create_json_response(
+                success=False,
+                error='Analysis result not found',
+                status_code=status.HTTP_404_NOT_FOUND
+            )
         
-        # Check ownership
-        if analysis.submission and analysis.submission.user != request.user:
+        # Check ownership against the submission's user ID, so the user row is not loaded
+        if analysis.submission and analysis.submission.user_id != request.user.id:
             return create_json_response(
                 success=False,
                 error='You can only email reports for your own analyses',
@@ -134,7 +136,7 @@ def email_report(request, analysis_id):
             )
             
     except Exception as e:
-        logger.error(f"Failed to send report: {str(e)}")
+        logger.error("Failed to send report: %s", e)
         return create_json_response(
             success=False,
             error=f'Failed to send report: {str(e)}',
@@ -1,23 +1,8 @@
-from datetime import datetime
-from typing import Optional, Any
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
 from app.services.submission_history_service import SubmissionHistoryService
-
-def create_json_response(success: bool = True, message: Optional[str] = None, data: Optional[Any] = None, error: Optional[str] = None, status_code = status.HTTP_200_OK):
-    """
-    Create standardised JSON response.
-    """
-    response_data = {
-        'success': success,
-        'message': message,
-        'data': data,
-        'error': error,
-        'timestamp': datetime.now().isoformat()
-    }
-    return Response(response_data, status=status_code)
+from app.utils.responses import create_json_response
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -160,6 +145,49 @@ def delete_submission(request, submission_id):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def delete_submissions(request):
+    """
+    Delete several submissions at once.
+
+    POST /api/submissions/delete/
+    Body: {"submission_ids": ["<submission_id>", ...]}
+    """
+    try:
+        submission_ids = request.data.get('submission_ids')
+        if not isinstance(submission_ids, list) or not submission_ids:
+            return create_json_response(
+                success=False,
+                error='submission_ids must be a non-empty list',
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = SubmissionHistoryService.delete_submissions(
+            submission_ids=submission_ids,
+            user=request.user
+        )
+        
+        if result['success']:
+            return create_json_response(
+                success=True,
+                message=result.get('message'),
+                data={'deleted_count': result.get('deleted_count')}
+            )
+        else:
+            return create_json_response(
+                success=False,
+                error=result.get('error'),
+                status_code=status.HTTP_404_NOT_FOUND
+            )
+            
+    except Exception as e:
+        return create_json_response(
+            success=False,
+            error=str(e),
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_submission_statistics(request):
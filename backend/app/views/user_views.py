@@ -1,5 +1,4 @@
 from rest_framework import status, permissions
-from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from django.contrib.auth.tokens import default_token_generator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
@@ -9,33 +8,11 @@ from app.services.user_service import UserService
 from app.serializers.user_serializers import UserSerializer
 from app.services.email_service import EmailService
 from app.models.user import User
-from typing import Optional, Any
-from datetime import datetime
+from app.utils.responses import create_json_response
 import logging
 
 logger = logging.getLogger(__name__)
 
-def create_json_response(success: bool = True, message: Optional[str] = None, data: Optional[Any] = None, error: Optional[str] = None, status_code = status.HTTP_200_OK, **kwargs):
-    """
-    Create standardised JSON response.
-    """
-    response_data = {
-        'success': success,
-        'message': message,
-        'data': data,
-    }
-
-    # Add any additional fields.
-    response_data.update(kwargs)
-
-    # Add error and timestamp at the end.
-    response_data.update({
-        'error': error,
-        'timestamp': datetime.now().isoformat()
-    })
-
-    return Response(response_data, status=status_code)
-
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
 def register_user(request):
@@ -170,7 +147,7 @@ def verify_email(request):
             )
         
     except Exception as e:
-        logger.error(f"Error verifying email: {str(e)}")
+        logger.error("Error verifying email: %s", e)
         return create_json_response(
             success=False,
             error='An error occurred while verifying your email',
@@ -239,7 +216,7 @@ def resend_verification_code(request):
             )
             
     except Exception as e:
-        logger.error(f"Error resending verification code: {str(e)}")
+        logger.error("Error resending verification code: %s", e)
         return create_json_response(
             success=False,
             error='An error occurred while resending verification code',
@@ -447,7 +424,7 @@ def update_user_profile(request, user_id: str):
                 )
                 
             except Exception as e:
-                logger.error(f"Failed to send verification email: {str(e)}")
+                logger.error("Failed to send verification email: %s", e)
                 return create_json_response(
                     success=True,
                     message='Profile updated but verification email failed to send. Please use the resend verification endpoint.',
@@ -92,10 +92,32 @@ DATABASES = {
         'PORT': os.getenv('DB_PORT', '5432'),
         'OPTIONS': {
             'sslmode': 'require',
-        }
+        },
+        # Keep connections open between requests so each one skips the TCP/TLS/auth handshake.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        # Set when connecting through a transaction-pooling proxy (e.g. pgbouncer), which cannot keep cursors open.
+        'DISABLE_SERVER_SIDE_CURSORS': os.getenv('DB_DISABLE_SERVER_SIDE_CURSORS', 'False').lower() == 'true',
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+#
+# Set REDIS_URL to share the cache between server processes (gunicorn workers). Without it each process has its
+# own in-memory cache, so an invalidation in one process is not seen by the others: token lookups are then not
+# cached, other cached data is kept only briefly, and per-email limits are counted per process.
+REDIS_URL = os.getenv('REDIS_URL')
+SHARED_CACHE = bool(REDIS_URL)
+
+if SHARED_CACHE:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+
 # Supabase Configuration
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_ANON_KEY = os.getenv('SUPABASE_ANON_KEY')
@@ -162,12 +184,18 @@ AUTH_USER_MODEL = 'app.User'
 
 # REST Framework configuration
 REST_FRAMEWORK = {
+    # Cached token lookups are only safe when revoking a token clears the entry for every process.
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        'app.authentication.CachedTokenAuthentication' if SHARED_CACHE else
         'rest_framework.authentication.TokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'app.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 # Email configuration
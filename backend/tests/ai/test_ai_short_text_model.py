@@ -249,6 +249,11 @@ class TestAiShortTextModel:
         assert 'confidence' in result
         assert isinstance(result['is_ai_generated'], bool)
 
+        # The single text is truncated but not padded to max_length.
+        mock_tokenizer.assert_called_once_with(
+            "This is short test text", padding=False, truncation=True, max_length=128, return_tensors='pt'
+        )
+
     def test_predict_model_not_loaded(self):
         """Test prediction when model not loaded."""
         model = AiShortTextModel()
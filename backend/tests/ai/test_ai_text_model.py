@@ -236,6 +236,11 @@ class TestAiTextModel:
         assert 'confidence' in result
         assert isinstance(result['is_ai_generated'], bool)
 
+        # The single text is truncated but not padded to max_length.
+        mock_tokenizer.assert_called_once_with(
+            "This is test text", padding=False, truncation=True, max_length=1024, return_tensors='pt'
+        )
+
     def test_predict_model_not_loaded(self):
         """Test prediction when model not loaded."""
         model = AiTextModel()
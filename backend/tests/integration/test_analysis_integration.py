@@ -1,5 +1,7 @@
 # type: ignore
 from unittest.mock import Mock, patch, MagicMock
+from io import BytesIO
+from PIL import Image
 import pytest
 import tempfile
 import os
@@ -7,7 +9,14 @@ import uuid
 from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APIRequestFactory, force_authenticate
 from rest_framework import status
-from app.views.analysis_views import analyse_text, analyse_image
+from app.views.analysis_views import analyse_text, analyse_image, _get_text_analyser, _get_image_analyser
+
+
+def make_image_bytes(image_format='JPEG', size=(4, 3)):
+    """Encode a small solid-colour image in the given format."""
+    buffer = BytesIO()
+    Image.new('RGB', size, color=(200, 30, 30)).save(buffer, image_format)
+    return buffer.getvalue()
 
 class TestAnalysisWorkflowsIntegration:
     """
@@ -17,6 +26,22 @@ class TestAnalysisWorkflowsIntegration:
     :version: 28/09/2025
     """
 
+    @pytest.fixture(autouse=True)
+    def run_naming_inline(self):
+        """Run background submission naming inline, so its effects can be asserted once the view returns."""
+        with patch('app.views.analysis_views._naming_executor') as mock_executor:
+            mock_executor.submit.side_effect = lambda func, *args: func(*args)
+            yield mock_executor
+
+    @pytest.fixture(autouse=True)
+    def clear_shared_analysers(self):
+        """Drop the shared analysers, so each test builds its own from the patched classes."""
+        _get_text_analyser.cache_clear()
+        _get_image_analyser.cache_clear()
+        yield
+        _get_text_analyser.cache_clear()
+        _get_image_analyser.cache_clear()
+
     @pytest.fixture
     def api_factory(self):
         """Create APIRequestFactory instance."""
@@ -43,7 +68,7 @@ class TestAnalysisWorkflowsIntegration:
         """Create a valid test image file."""
         return SimpleUploadedFile(
             "test_image.jpg",
-            b"fake_image_content",
+            make_image_bytes(),
             content_type="image/jpeg"
         )
 
@@ -98,10 +123,9 @@ class TestAnalysisWorkflowsIntegration:
         
         # Verify analyser was created and used
         mock_analyser_class.assert_called_once()
-        mock_analyser.analyse.assert_called_once_with(
-            request_data['text'], 
-            user=authenticated_user, 
-            submission=mock_submission
+        mock_analyser.analyse.assert_called_once_with(request_data['text'])
+        mock_analyser.save_result.assert_called_once_with(
+            mock_analysis_result, authenticated_user, mock_submission, request_data['text']
         )
         
         # Verify submission was created
@@ -150,11 +174,8 @@ class TestAnalysisWorkflowsIntegration:
         assert 'submission' not in response.data['data']
         
         # Verify analysis was performed
-        mock_analyser.analyse.assert_called_once_with(
-            request_data['text'], 
-            user=anonymous_user, 
-            submission=None
-        )
+        mock_analyser.analyse.assert_called_once_with(request_data['text'])
+        mock_analyser.save_result.assert_not_called()
 
     # Image Analysis Workflow Integration Tests
     @patch('app.views.analysis_views.AiImageAnalyser')
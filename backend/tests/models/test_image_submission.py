@@ -4,10 +4,13 @@ from django.core.validators import FileExtensionValidator
 from django.utils import timezone
 from app.models import ImageSubmission
 from unittest.mock import Mock, patch
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
 from datetime import datetime, timezone as dt_timezone
 from app.models.image_submission import image_upload_path
 import pytest
 import uuid
+import io
 
 User = get_user_model()
 
@@ -58,8 +61,8 @@ class TestImageSubmissionModel:
         # Test db_table
         assert meta.db_table == 'image_submissions'
         
-        # Test that indexes are defined (2 indexes)
-        assert len(meta.indexes) == 2
+        # Test that indexes are defined (3 indexes)
+        assert len(meta.indexes) == 3
 
     def test_image_upload_path_function(self):
         """
@@ -244,6 +247,61 @@ class TestImageSubmissionModel:
         assert mock_submission.height is None
         assert mock_submission.image_format is None
 
+    @patch('app.models.image_submission.Submission.save')
+    def test_save_reads_metadata_from_new_image(self, mock_super_save):
+        """
+        Test saving a newly assigned image reads its size, format and dimensions from the upload.
+        """
+        buffer = io.BytesIO()
+        Image.new('RGB', (4, 3)).save(buffer, format='PNG')
+        submission = ImageSubmission(name='Upload')
+        submission.image = SimpleUploadedFile('upload.png', buffer.getvalue(), content_type='image/png')
+
+        submission.save()
+
+        assert submission.file_size == len(buffer.getvalue())
+        assert submission.image_format == 'png'
+        assert (submission.width, submission.height) == (4, 3)
+        mock_super_save.assert_called_once()
+
+    @patch('app.models.image_submission.Image.open')
+    @patch('app.models.image_submission.Submission.save')
+    def test_save_keeps_metadata_of_stored_image(self, mock_super_save, mock_image_open):
+        """
+        Test saving a submission whose image is already stored keeps its metadata without reading from storage.
+        """
+        submission = ImageSubmission(name='Stored', file_size=2048, width=640, height=480, image_format='jpg')
+        submission.image = 'submissions/images/user/2026/10/stored.jpg'
+
+        submission.save()
+
+        mock_image_open.assert_not_called()
+        assert (submission.file_size, submission.width, submission.height) == (2048, 640, 480)
+        mock_super_save.assert_called_once()
+
+    @patch('app.models.image_submission.Submission.save')
+    def test_store_image_stores_upload_without_saving(self, mock_super_save):
+        """
+        Test storing a newly assigned image reads its metadata and uploads it, but writes no row, and a later save
+        does not upload it again.
+        """
+        buffer = io.BytesIO()
+        Image.new('RGB', (4, 3)).save(buffer, format='PNG')
+        submission = ImageSubmission(name='Upload', user=User(email='owner@example.com'))
+        submission.image = SimpleUploadedFile('upload.png', buffer.getvalue(), content_type='image/png')
+        storage = ImageSubmission._meta.get_field('image').storage
+
+        with patch.object(storage, 'save', return_value='submissions/images/upload.png') as mock_storage_save:
+            submission.store_image()
+            mock_super_save.assert_not_called()
+
+            submission.save()
+
+        mock_storage_save.assert_called_once()
+        assert submission.image.name == 'submissions/images/upload.png'
+        assert (submission.width, submission.height) == (4, 3)
+        mock_super_save.assert_called_once()
+
     def test_save_method_no_image(self):
         """
         Test save method when no image is provided.
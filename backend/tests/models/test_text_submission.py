@@ -43,8 +43,8 @@ class TestTextSubmissionModel:
         # Test db_table
         assert meta.db_table == 'text_submissions'
         
-        # Test that indexes are defined (1 index)
-        assert len(meta.indexes) == 1
+        # Test that indexes are defined (user/created_at, user/id, plus the name and content trigram indexes)
+        assert len(meta.indexes) == 4
 
     def test_content_field_configuration(self):
         """
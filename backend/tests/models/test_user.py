@@ -47,7 +47,7 @@ class TestUserModel:
         meta = User._meta
         
         assert meta.db_table == 'users'
-        assert len(meta.indexes) == 6  # Check number of indexes
+        assert len(meta.indexes) == 4  # Check number of indexes (email and username use their unique constraint indexes)
 
     def test_username_field_configuration(self):
         """Test USERNAME_FIELD is set to email."""
@@ -158,34 +158,37 @@ class TestUserModel:
 
     # Verification Code Tests
     def test_set_verification_code(self):
-        """Test set_verification_code method."""
+        """Test set_verification_code stores a keyed hash rather than the code itself."""
         user = User()
         
-        with patch('app.models.user.make_password', return_value='hashed_code') as mock_make_password:
-            user.set_verification_code('123456')
-            
-            mock_make_password.assert_called_once_with('123456')
-            assert user.email_verification_code_hash == 'hashed_code'
+        user.set_verification_code('123456')
+        
+        assert user.email_verification_code_hash == User.hash_verification_code('123456')
+        assert user.email_verification_code_hash != '123456'
+        assert len(user.email_verification_code_hash) == 64
 
     def test_check_verification_code_valid(self):
         """Test check_verification_code with valid code."""
-        user = User(email_verification_code_hash='hashed_code')
+        user = User(email_verification_code_hash=User.hash_verification_code('123456'))
+        
+        result = user.check_verification_code('123456')
         
-        with patch('app.models.user.check_password', return_value=True) as mock_check:
-            result = user.check_verification_code('123456')
-            
-            assert result is True
-            mock_check.assert_called_once_with('123456', 'hashed_code')
+        assert result is True
 
     def test_check_verification_code_invalid(self):
         """Test check_verification_code with invalid code."""
-        user = User(email_verification_code_hash='hashed_code')
+        user = User(email_verification_code_hash=User.hash_verification_code('123456'))
+        
+        result = user.check_verification_code('wrong_code')
+        
+        assert result is False
+
+    def test_check_verification_code_legacy_hash(self):
+        """Test check_verification_code still accepts codes stored with a password hasher."""
+        user = User(email_verification_code_hash=make_password('123456'))
         
-        with patch('app.models.user.check_password', return_value=False) as mock_check:
-            result = user.check_verification_code('wrong_code')
-            
-            assert result is False
-            mock_check.assert_called_once_with('wrong_code', 'hashed_code')
+        assert user.check_verification_code('123456') is True
+        assert user.check_verification_code('654321') is False
 
     def test_check_verification_code_no_hash(self):
         """Test check_verification_code when no hash is set."""
@@ -293,13 +296,11 @@ class TestUserModel:
         user = User()
         
         # Set verification code
-        with patch('app.models.user.make_password', return_value='hashed_123456'):
-            user.set_verification_code('123456')
-            assert user.email_verification_code_hash == 'hashed_123456'
+        user.set_verification_code('123456')
+        assert user.email_verification_code_hash
         
         # Check valid code
-        with patch('app.models.user.check_password', return_value=True):
-            assert user.check_verification_code('123456') is True
+        assert user.check_verification_code('123456') is True
         
         # Clear code
         user.clear_verification_code()
@@ -1,6 +1,7 @@
 # type: ignore
 from unittest.mock import Mock, patch, MagicMock
 from django.test import TestCase
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import datetime, timedelta
 from app.services.admin_service import AdminService
@@ -17,6 +18,11 @@ class TestAdminService:
     :version: 28/09/2025
     """
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty cache, so cached dashboard results do not leak between tests."""
+        cache.clear()
+
     @pytest.fixture
     def mock_timezone_now(self):
         """Mock timezone.now() to return a fixed datetime."""
@@ -141,6 +147,7 @@ class TestAdminService:
         mock_submission.id = uuid.uuid4()
         mock_submission.name = 'Test Submission'
         mock_submission.user.username = 'testuser'
+        mock_submission.user.full_name = 'Test User'
         mock_submission.user.email = 'test@example.com'
         mock_submission.created_at = timezone.now()
         mock_submission.character_count = 100
@@ -154,6 +161,7 @@ class TestAdminService:
         mock_analysis.processing_time_ms = 1500
         mock_analysis.created_at = timezone.now()
         mock_analysis.submission = mock_submission
+        mock_analysis.content_object = mock_submission
         
         # Create mock feedback
         mock_feedback = Mock()
@@ -161,6 +169,7 @@ class TestAdminService:
         mock_feedback.rating = Feedback.FeedbackRating.THUMBS_UP
         mock_feedback.comment = 'Great analysis!'
         mock_feedback.user.username = 'testuser'
+        mock_feedback.user.full_name = 'Test User'
         mock_feedback.user.email = 'test@example.com'
         mock_feedback.created_at = timezone.now()
         
@@ -337,4 +346,57 @@ class TestAdminService:
                         
                         assert result['success'] is True
                         # Verify that timezone calculations don't cause errors
-                        assert 'statistics' in result
\ No newline at end of file
+                        assert 'statistics' in result
+
+    # Caching Tests
+    @patch('app.services.admin_service.AdminService._compute_system_statistics')
+    def test_get_system_statistics_uses_cache(self, mock_compute):
+        """Test that repeated statistics requests are served from the cache."""
+        mock_compute.return_value = {'success': True, 'statistics': {'users': {'total': 3}}}
+
+        first = AdminService.get_system_statistics()
+        second = AdminService.get_system_statistics()
+
+        assert first == second == mock_compute.return_value
+        mock_compute.assert_called_once_with()
+
+    @patch('app.services.admin_service.AdminService._compute_system_statistics')
+    def test_get_system_statistics_does_not_cache_failures(self, mock_compute):
+        """Test that a failed statistics computation is retried on the next request."""
+        mock_compute.side_effect = [
+            {'success': False, 'error': 'Database error'},
+            {'success': True, 'statistics': {}}
+        ]
+
+        AdminService.get_system_statistics()
+        result = AdminService.get_system_statistics()
+
+        assert result['success'] is True
+        assert mock_compute.call_count == 2
+
+    @patch('app.services.admin_service.AdminService._compute_performance_metrics')
+    def test_get_performance_metrics_cached_per_days(self, mock_compute):
+        """Test that performance metrics are cached separately for each period."""
+        mock_compute.side_effect = lambda days: {'success': True, 'metrics': {'period_days': days}}
+
+        AdminService.get_performance_metrics(days=7)
+        AdminService.get_performance_metrics(days=7)
+        result = AdminService.get_performance_metrics(days=30)
+
+        assert result['metrics']['period_days'] == 30
+        assert mock_compute.call_count == 2
+
+    @patch('app.services.admin_service.AdminService._compute_recent_activity')
+    def test_invalidate_cache_recomputes_recent_activity(self, mock_compute):
+        """Test that invalidating the cache forces a fresh computation."""
+        mock_compute.side_effect = [
+            {'success': True, 'activities': []},
+            {'success': True, 'activities': [{'id': '1'}]}
+        ]
+
+        AdminService.get_recent_activity(limit=10)
+        AdminService.invalidate_cache()
+        result = AdminService.get_recent_activity(limit=10)
+
+        assert result['activities'] == [{'id': '1'}]
+        mock_compute.assert_called_with(10)
@@ -2,6 +2,7 @@
 from unittest.mock import Mock, patch, MagicMock, mock_open
 from django.test import TestCase
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 from PIL import Image
 from app.services.ai_image_analyser import AiImageAnalyser
@@ -9,6 +10,7 @@ from app.models.image_submission import ImageSubmission
 from app.models.image_analysis_result import ImageAnalysisResult
 import pytest
 import os
+import shutil
 import tempfile
 import uuid
 
@@ -20,6 +22,11 @@ class TestAiImageAnalyser:
     :version: 28/09/2025
     """
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty cache, so cached analyses do not leak between tests."""
+        cache.clear()
+
     @pytest.fixture
     def mock_ai_model(self):
         """Create a mock AI image model."""
@@ -131,14 +138,14 @@ class TestAiImageAnalyser:
         mock_ai_model.load.assert_not_called()
 
     # Analysis Tests
-    @patch('app.services.ai_image_analyser.time.time')
+    @patch('app.services.ai_image_analyser.time')
     @patch('app.services.ai_image_analyser.ClaudeService')
     def test_analyse_success_with_claude(self, mock_claude_class, mock_time, mock_ai_model, 
                                         temp_image_path, mock_user, mock_submission, mock_claude_service):
         """Test successful analysis with Claude enhancement."""
         # Setup mocks
         mock_claude_class.return_value = mock_claude_service
-        mock_time.side_effect = [1000.0, 1001.5]  # Start and end times
+        mock_time.time.side_effect = [1000.0, 1001.5]  # Start and end times
         
         analyser = AiImageAnalyser(mock_ai_model, use_claude=True)
         
@@ -159,10 +166,10 @@ class TestAiImageAnalyser:
             # Verify Claude was called
             mock_claude_service.analyse_image_patterns.assert_called_once_with(temp_image_path, mock_ai_model.predict.return_value)
 
-    @patch('app.services.ai_image_analyser.time.time')
+    @patch('app.services.ai_image_analyser.time')
     def test_analyse_success_without_claude(self, mock_time, mock_ai_model, temp_image_path):
         """Test successful analysis without Claude enhancement."""
-        mock_time.side_effect = [1000.0, 1001.0]  # Start and end times
+        mock_time.time.side_effect = [1000.0, 1001.0]  # Start and end times
         
         analyser = AiImageAnalyser(mock_ai_model, use_claude=False)
         
@@ -208,6 +215,57 @@ class TestAiImageAnalyser:
         assert result['prediction']['is_ai_generated'] is True
         assert result['metadata']['enhanced_analysis_used'] is False
 
+    @patch('app.services.ai_image_analyser.ClaudeService')
+    def test_analyse_reuses_cached_result_for_same_image(self, mock_claude_class, mock_ai_model,
+                                                         temp_image_path, mock_claude_service):
+        """Test resubmitting an identical image file skips the model and Claude."""
+        mock_claude_class.return_value = mock_claude_service
+        analyser = AiImageAnalyser(mock_ai_model, use_claude=True)
+
+        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as copy_file:
+            copy_path = copy_file.name
+        try:
+            shutil.copyfile(temp_image_path, copy_path)
+            first = analyser.analyse(temp_image_path)
+            second = analyser.analyse(copy_path)
+        finally:
+            os.unlink(copy_path)
+
+        assert second['prediction'] == first['prediction']
+        assert second['analysis'] == first['analysis']
+        mock_ai_model.predict.assert_called_once_with(temp_image_path)
+        mock_claude_service.analyse_image_patterns.assert_called_once()
+
+    def test_analyse_different_images_not_shared(self, mock_ai_model, temp_image_path):
+        """Test a different image is analysed rather than served another image's result."""
+        analyser = AiImageAnalyser(mock_ai_model, use_claude=False)
+
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as other_file:
+            Image.new('RGB', (100, 100), color='blue').save(other_file, 'PNG')
+        try:
+            analyser.analyse(temp_image_path)
+            analyser.analyse(other_file.name)
+        finally:
+            os.unlink(other_file.name)
+
+        assert mock_ai_model.predict.call_count == 2
+
+    @patch('app.services.ai_image_analyser.ClaudeService')
+    def test_analyse_claude_failure_not_cached(self, mock_claude_class, mock_ai_model,
+                                               temp_image_path, mock_claude_service):
+        """Test a result degraded by a Claude failure is recomputed on the next request."""
+        mock_claude_class.return_value = mock_claude_service
+        reasons = mock_claude_service.analyse_image_patterns.return_value
+        mock_claude_service.analyse_image_patterns.side_effect = [Exception("Claude API error"), reasons]
+        analyser = AiImageAnalyser(mock_ai_model, use_claude=True)
+
+        first = analyser.analyse(temp_image_path)
+        second = analyser.analyse(temp_image_path)
+
+        assert first['metadata']['enhanced_analysis_used'] is False
+        assert second['metadata']['enhanced_analysis_used'] is True
+        assert mock_ai_model.predict.call_count == 2
+
     @patch('app.services.ai_image_analyser.timezone.now')
     def test_analyse_failure_marks_result_as_failed(self, mock_now, mock_ai_model, temp_image_path, mock_user):
         """Test that analysis failure marks result as failed."""
@@ -220,16 +278,16 @@ class TestAiImageAnalyser:
 
     # Save Analysis Result Tests
     @patch('app.services.ai_image_analyser.ContentType.objects.get_for_model')
-    @patch('app.services.ai_image_analyser.ImageSubmission.objects.create')
+    @patch('app.services.ai_image_analyser.ImageSubmission')
     @patch('app.services.ai_image_analyser.ClaudeService')
-    def test_save_analysis_result_creates_submission(self, mock_claude_class, mock_create_submission,
+    def test_save_analysis_result_creates_submission(self, mock_claude_class, mock_submission_class,
                                                    mock_content_type, mock_ai_model, mock_user, 
                                                    temp_image_path, mock_claude_service):
         """Test saving analysis result creates submission when none provided."""
         mock_claude_class.return_value = mock_claude_service
         mock_submission = Mock()
         mock_submission.id = uuid.uuid4()
-        mock_create_submission.return_value = mock_submission
+        mock_submission_class.return_value = mock_submission
         
         mock_content_type_obj = Mock()
         mock_content_type.return_value = mock_content_type_obj
@@ -241,8 +299,10 @@ class TestAiImageAnalyser:
         with patch('builtins.open', mock_open(read_data=b'fake image data')):
             analysis_result = analyser._save_analysis_result(result, mock_user, None, temp_image_path, 1500.0)
             
-            # Verify submission was created
-            mock_create_submission.assert_called_once()
+            # Verify submission was created with its image and saved once
+            mock_submission_class.assert_called_once()
+            assert mock_submission_class.call_args.kwargs['image'].name == os.path.basename(temp_image_path)
+            mock_submission.save.assert_called_once_with()
             mock_claude_service.create_image_submission_name.assert_called_once_with(temp_image_path, max_length=50)
 
     @patch('app.services.ai_image_analyser.ContentType.objects.get_for_model')
@@ -268,6 +328,18 @@ class TestAiImageAnalyser:
             mock_analysis.save_analysis_result.assert_called_once_with(result)
             mock_analysis.save.assert_called()
 
+    def test_save_result_adds_analysis_id(self, mock_ai_model, mock_user, mock_submission, temp_image_path):
+        """Test saving a result from analyse() adds the saved analysis ID to it."""
+        analyser = AiImageAnalyser(mock_ai_model, use_claude=False)
+        result = {'prediction': {'is_ai_generated': True}, 'metadata': {'processing_time_ms': 1000.0}}
+        mock_analysis = Mock(id=uuid.uuid4())
+
+        with patch.object(analyser, '_save_analysis_result', return_value=mock_analysis) as mock_save:
+            assert analyser.save_result(result, mock_user, mock_submission, temp_image_path) == mock_analysis
+
+        mock_save.assert_called_once_with(result, mock_user, mock_submission, temp_image_path, 1000.0)
+        assert result['analysis_id'] == str(mock_analysis.id)
+
     def test_save_analysis_result_handles_exceptions(self, mock_ai_model, mock_user, temp_image_path):
         """Test that save analysis result handles exceptions gracefully."""
         analyser = AiImageAnalyser(mock_ai_model, use_claude=False)
@@ -291,6 +363,17 @@ class TestAiImageAnalyser:
         
         assert result == temp_image_path
 
+    def test_preprocess_multi_picture_jpeg(self, mock_ai_model):
+        """Test preprocessing accepts a JPEG with multi-picture data, which Pillow reports as MPO."""
+        analyser = AiImageAnalyser(mock_ai_model)
+
+        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as photo_file:
+            Image.new('RGB', (10, 10)).save(photo_file, 'MPO', save_all=True, append_images=[Image.new('RGB', (10, 10))])
+        try:
+            assert analyser.preprocess(image_path=photo_file.name) == photo_file.name
+        finally:
+            os.unlink(photo_file.name)
+
     def test_preprocess_file_not_found(self, mock_ai_model):
         """Test preprocessing with non-existent file."""
         analyser = AiImageAnalyser(mock_ai_model)
@@ -2,6 +2,7 @@
 from unittest.mock import Mock, patch, MagicMock
 from django.test import TestCase
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 from app.services.ai_text_analyser import AiTextAnalyser
 from app.models.text_submission import TextSubmission
@@ -19,6 +20,11 @@ class TestAiTextAnalyser:
     :version: 28/09/2025
     """
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty cache, so cached analyses do not leak between tests."""
+        cache.clear()
+
     @pytest.fixture
     def mock_long_text_model(self):
         """Create a mock long text AI model."""
@@ -160,7 +166,7 @@ class TestAiTextAnalyser:
         assert model_type == "long_text"
 
     # Analysis Tests
-    @patch('app.services.ai_text_analyser.time.time')
+    @patch('app.services.ai_text_analyser.time')
     @patch('app.services.ai_text_analyser.AiShortTextModel')
     @patch('app.services.ai_text_analyser.ClaudeService')
     def test_analyse_success_with_claude_long_text(self, mock_claude_class, mock_short_class, 
@@ -169,7 +175,7 @@ class TestAiTextAnalyser:
         # Setup mocks
         mock_claude_class.return_value = mock_claude_service
         mock_short_class.return_value = Mock()
-        mock_time.side_effect = [1000.0, 1001.5]  # Start and end times
+        mock_time.time.side_effect = [1000.0, 1001.5]  # Start and end times
         
         analyser = AiTextAnalyser(ai_model=mock_long_text_model, use_claude=True)
         
@@ -188,7 +194,7 @@ class TestAiTextAnalyser:
         # Verify Claude was called
         mock_claude_service.analyse_text_patterns.assert_called_once()
 
-    @patch('app.services.ai_text_analyser.time.time')
+    @patch('app.services.ai_text_analyser.time')
     @patch('app.services.ai_text_analyser.AiShortTextModel')
     def test_analyse_success_short_text_without_claude(self, mock_short_class, mock_time, mock_long_text_model):
         """Test successful analysis for short text without Claude."""
@@ -200,7 +206,7 @@ class TestAiTextAnalyser:
             'confidence': 0.78
         }
         mock_short_class.return_value = mock_short_instance
-        mock_time.side_effect = [1000.0, 1001.0]
+        mock_time.time.side_effect = [1000.0, 1001.0]
         
         analyser = AiTextAnalyser(ai_model=mock_long_text_model, use_claude=False)
         
@@ -293,6 +299,66 @@ class TestAiTextAnalyser:
         with pytest.raises(Exception, match="Model prediction failed"):
             analyser.analyse("Test text")
 
+    @patch('app.services.ai_text_analyser.AiShortTextModel')
+    @patch('app.services.ai_text_analyser.ClaudeService')
+    def test_analyse_reuses_cached_result(self, mock_claude_class, mock_short_class,
+                                          mock_long_text_model, mock_claude_service):
+        """Test resubmitting the same text skips the model and Claude."""
+        mock_claude_class.return_value = mock_claude_service
+        mock_short_class.return_value = Mock()
+        analyser = AiTextAnalyser(ai_model=mock_long_text_model, use_claude=True)
+        long_text = "This is a comprehensive analysis of artificial intelligence and machine learning technologies, " \
+                    "written to be long enough for the long text model."
+
+        first = analyser.analyse(long_text)
+        second = analyser.analyse("  " + long_text.replace(" ", "   ") + "  ")
+
+        assert second['prediction'] == first['prediction']
+        assert second['analysis'] == first['analysis']
+        mock_long_text_model.predict.assert_called_once()
+        mock_claude_service.analyse_text_patterns.assert_called_once()
+
+    @patch('app.services.ai_text_analyser.AiShortTextModel')
+    def test_analyse_cache_hit_still_saves_for_user(self, mock_short_class, mock_long_text_model, mock_user):
+        """Test a cached analysis is still saved for authenticated users, with its own analysis ID."""
+        mock_short_instance = Mock()
+        mock_short_instance.is_loaded.return_value = True
+        mock_short_instance.predict.return_value = {'probability': 0.65, 'is_ai_generated': True, 'confidence': 0.78}
+        mock_short_class.return_value = mock_short_instance
+        analyser = AiTextAnalyser(ai_model=mock_long_text_model, use_claude=False)
+
+        with patch.object(analyser, '_save_analysis_result') as mock_save:
+            mock_save.side_effect = [Mock(id=uuid.uuid4()), Mock(id=uuid.uuid4())]
+            first = analyser.analyse("Test text", user=mock_user)
+            second = analyser.analyse("Test text", user=mock_user)
+
+        assert mock_save.call_count == 2
+        assert first['analysis_id'] != second['analysis_id']
+        mock_short_instance.predict.assert_called_once()
+
+    @patch('app.services.ai_text_analyser.AiShortTextModel')
+    @patch('app.services.ai_text_analyser.ClaudeService')
+    def test_analyse_claude_failure_not_cached(self, mock_claude_class, mock_short_class,
+                                               mock_long_text_model, mock_claude_service):
+        """Test a result degraded by a Claude failure is recomputed on the next request."""
+        mock_claude_class.return_value = mock_claude_service
+        mock_claude_service.analyse_text_patterns.side_effect = [Exception("Claude API error"), {
+            'detection_reasons': [{'type': 'critical', 'title': 'AI', 'description': 'AI', 'impact': 'High'}],
+            'analysis_details': {}
+        }]
+        mock_short_instance = Mock()
+        mock_short_instance.is_loaded.return_value = True
+        mock_short_instance.predict.return_value = {'probability': 0.75, 'is_ai_generated': True, 'confidence': 0.85}
+        mock_short_class.return_value = mock_short_instance
+        analyser = AiTextAnalyser(ai_model=mock_long_text_model, use_claude=True)
+
+        first = analyser.analyse("Test text for analysis")
+        second = analyser.analyse("Test text for analysis")
+
+        assert first['metadata']['enhanced_analysis_used'] is False
+        assert second['metadata']['enhanced_analysis_used'] is True
+        assert mock_claude_service.analyse_text_patterns.call_count == 2
+
     # Save Analysis Result Tests
     @patch('app.services.ai_text_analyser.ContentType.objects.get_for_model')
     @patch('app.services.ai_text_analyser.TextSubmission.objects.create')
@@ -46,6 +46,7 @@ class TestFeedbackService:
         submission = Mock(spec=TextSubmission)
         submission.id = uuid.uuid4()
         submission.user = mock_user
+        submission.user_id = mock_user.id
         submission.content = "Sample text"
         return submission
 
@@ -65,6 +66,7 @@ class TestFeedbackService:
         submission = Mock(spec=ImageSubmission)
         submission.id = uuid.uuid4()
         submission.user = mock_user
+        submission.user_id = mock_user.id
         
         result = Mock(spec=ImageAnalysisResult)
         result.id = uuid.uuid4()
@@ -490,6 +492,7 @@ class TestFeedbackService:
         analysis = Mock()
         analysis.submission = Mock()
         analysis.submission.user = other_user
+        analysis.submission.user_id = other_user.id
         
         mock_text_objects.get.return_value = analysis
         
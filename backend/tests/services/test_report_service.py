@@ -2,9 +2,10 @@
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 from io import BytesIO
+from reportlab.lib.units import inch
 from datetime import datetime
 from django.utils import timezone
-from app.services.report_service import ReportService
+from app.services.report_service import ReportService, _build_report_context, _escape, _text_sample
 from app.models.text_analysis_result import TextAnalysisResult
 from app.models.image_analysis_result import ImageAnalysisResult
 from app.models.text_submission import TextSubmission
@@ -185,7 +186,7 @@ class TestReportService:
         """Test adding report metadata for text analysis."""
         story = []
         
-        report_service._add_report_metadata(story, mock_text_analysis_result, 'test@example.com')
+        report_service._add_report_metadata(story, _build_report_context(mock_text_analysis_result), 'test@example.com')
         
         # Verify content was added to story
         assert len(story) > 0
@@ -197,7 +198,7 @@ class TestReportService:
         """Test adding report metadata for image analysis."""
         story = []
         
-        report_service._add_report_metadata(story, mock_image_analysis_result, 'test@example.com')
+        report_service._add_report_metadata(story, _build_report_context(mock_image_analysis_result), 'test@example.com')
         
         # Verify content was added to story
         assert len(story) > 0
@@ -213,7 +214,7 @@ class TestReportService:
         story = []
         
         # Should not raise exception
-        report_service._add_report_metadata(story, minimal_result, 'test@example.com')
+        report_service._add_report_metadata(story, _build_report_context(minimal_result), 'test@example.com')
         
         assert len(story) > 0
 
@@ -226,7 +227,7 @@ class TestReportService:
         story = []
         
         # Should handle exception gracefully
-        report_service._add_report_metadata(story, problematic_result, 'test@example.com')
+        report_service._add_report_metadata(story, _build_report_context(problematic_result), 'test@example.com')
         
         # Should still add error section
         assert len(story) > 0
@@ -236,7 +237,7 @@ class TestReportService:
         """Test analysis summary for AI-generated content."""
         story = []
         
-        report_service._add_analysis_summary(story, mock_text_analysis_result)
+        report_service._add_analysis_summary(story, _build_report_context(mock_text_analysis_result))
         
         # Verify content was added
         assert len(story) >= 3  # Header, table, spacer
@@ -245,7 +246,7 @@ class TestReportService:
         """Test analysis summary for human-created content."""
         story = []
         
-        report_service._add_analysis_summary(story, mock_image_analysis_result)
+        report_service._add_analysis_summary(story, _build_report_context(mock_image_analysis_result))
         
         # Verify content was added
         assert len(story) >= 3
@@ -260,7 +261,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_analysis_summary(story, minimal_result)
+        report_service._add_analysis_summary(story, _build_report_context(minimal_result))
         
         # Should handle None values gracefully
         assert len(story) > 0
@@ -270,7 +271,7 @@ class TestReportService:
         """Test adding detection details with valid reasons."""
         story = []
         
-        report_service._add_detection_details(story, mock_text_analysis_result)
+        report_service._add_detection_details(story, _build_report_context(mock_text_analysis_result))
         
         # Should add header and content for each reason
         assert len(story) > 0
@@ -282,7 +283,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_detection_details(story, result_no_reasons)
+        report_service._add_detection_details(story, _build_report_context(result_no_reasons))
         
         # Should return early and not add content
         assert len(story) == 0
@@ -295,7 +296,7 @@ class TestReportService:
         story = []
         
         # Should handle gracefully without crashing
-        report_service._add_detection_details(story, result_invalid)
+        report_service._add_detection_details(story, _build_report_context(result_invalid))
         
         # Should add some content even with invalid data
         assert len(story) >= 0
@@ -305,7 +306,7 @@ class TestReportService:
         """Test adding statistics section with valid statistics."""
         story = []
         
-        report_service._add_statistics_section(story, mock_text_analysis_result)
+        report_service._add_statistics_section(story, _build_report_context(mock_text_analysis_result))
         
         # Should add header, table, and spacer
         assert len(story) >= 3
@@ -317,7 +318,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_statistics_section(story, result_no_stats)
+        report_service._add_statistics_section(story, _build_report_context(result_no_stats))
         
         # Should return early
         assert len(story) == 0
@@ -333,7 +334,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_statistics_section(story, result_partial)
+        report_service._add_statistics_section(story, _build_report_context(result_partial))
         
         # Should handle missing fields gracefully
         assert len(story) >= 3
@@ -343,7 +344,7 @@ class TestReportService:
         """Test adding text sample with valid content."""
         story = []
         
-        report_service._add_text_sample(story, mock_text_analysis_result)
+        report_service._add_text_sample(story, _build_report_context(mock_text_analysis_result))
         
         # Should add header, content, and spacer
         assert len(story) >= 3
@@ -358,11 +359,19 @@ class TestReportService:
         
         story = []
         
-        report_service._add_text_sample(story, result_long)
+        report_service._add_text_sample(story, _build_report_context(result_long))
         
         # Content should be added and truncated
         assert len(story) >= 3
 
+    def test_text_sample_prefers_content_preview(self):
+        """Test that the annotated content preview is used instead of the full content."""
+        submission = Mock()
+        submission.content_preview = "B" * 501
+        submission.content = "A" * 5000
+
+        assert _text_sample(submission) == "B" * 500 + "... [truncated]"
+
     def test_add_text_sample_no_submission(self, report_service):
         """Test text sample with no submission."""
         result_no_sub = Mock()
@@ -370,7 +379,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_text_sample(story, result_no_sub)
+        report_service._add_text_sample(story, _build_report_context(result_no_sub))
         
         # Should return early
         assert len(story) == 0
@@ -385,7 +394,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_text_sample(story, result_empty)
+        report_service._add_text_sample(story, _build_report_context(result_empty))
         
         # Should add "No content available"
         assert len(story) >= 3
@@ -402,7 +411,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_image_section(story, mock_image_analysis_result)
+        report_service._add_image_section(story, _build_report_context(mock_image_analysis_result))
         
         # Should add header, image, and details
         assert len(story) > 0
@@ -421,10 +430,12 @@ class TestReportService:
         
         story = []
         
-        report_service._add_image_section(story, mock_image_analysis_result)
+        ctx = _build_report_context(mock_image_analysis_result)
+        report_service._add_image_section(story, ctx)
         
-        # Should handle error gracefully and add error message
+        # Should handle error gracefully, add error message and mark the report as degraded
         assert len(story) > 0
+        assert ctx.degraded is True
 
     def test_add_image_section_no_submission(self, report_service):
         """Test image section with no submission."""
@@ -433,7 +444,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_image_section(story, result_no_sub)
+        report_service._add_image_section(story, _build_report_context(result_no_sub))
         
         # Should return early
         assert len(story) == 0
@@ -448,7 +459,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_image_section(story, result_no_url)
+        report_service._add_image_section(story, _build_report_context(result_no_url))
         
         # Should add "Image not available" message
         assert len(story) >= 2
@@ -475,7 +486,7 @@ class TestReportService:
         
         story = []
         
-        report_service._add_image_section(story, portrait_result)
+        report_service._add_image_section(story, _build_report_context(portrait_result))
         
         # Should handle portrait dimensions correctly
         assert len(story) > 0
@@ -518,17 +529,47 @@ class TestReportService:
         mock_canvas.getPageNumber.assert_called()
 
     def test_apply_canvas_elements(self, report_service):
-        """Test applying all canvas elements."""
+        """Test applying all canvas elements inside a single saved canvas state."""
         mock_canvas = Mock()
+        mock_canvas.getPageNumber.return_value = 3
+        mock_canvas.hasForm.return_value = False
         mock_doc = Mock()
         
-        with patch.object(report_service, '_add_watermark') as mock_watermark:
-            with patch.object(report_service, '_add_page_number') as mock_page_num:
-                report_service._apply_canvas_elements(mock_canvas, mock_doc)
-                
-                # Verify both methods were called
-                mock_watermark.assert_called_once_with(mock_canvas, mock_doc)
-                mock_page_num.assert_called_once_with(mock_canvas, mock_doc)
+        report_service._apply_canvas_elements(mock_canvas, mock_doc)
+        
+        # Verify both elements were drawn with one save/restore pair
+        assert mock_canvas.saveState.call_count == 1
+        assert mock_canvas.restoreState.call_count == 1
+        mock_canvas.drawCentredString.assert_called_once_with(0, 0, "Detective AI")
+        mock_canvas.drawRightString.assert_called_once()
+        assert mock_canvas.drawRightString.call_args[0][2] == "Page 3"
+        
+        # Verify the watermark is recorded as a form and drawn from it
+        mock_canvas.beginForm.assert_called_once_with('DetectiveAIWatermark')
+        mock_canvas.endForm.assert_called_once()
+        mock_canvas.doForm.assert_called_once_with('DetectiveAIWatermark')
+
+    def test_apply_canvas_elements_reuses_watermark_form(self, report_service):
+        """Test that later pages reference the existing watermark form instead of redrawing it."""
+        mock_canvas = Mock()
+        mock_canvas.getPageNumber.return_value = 2
+        mock_canvas.hasForm.return_value = True
+        
+        report_service._apply_canvas_elements(mock_canvas, Mock())
+        
+        mock_canvas.beginForm.assert_not_called()
+        mock_canvas.drawCentredString.assert_not_called()
+        mock_canvas.doForm.assert_called_once_with('DetectiveAIWatermark')
+
+    def test_apply_canvas_elements_restores_state_on_error(self, report_service):
+        """Test that canvas state is restored even if drawing fails."""
+        mock_canvas = Mock()
+        mock_canvas.drawRightString.side_effect = Exception("Canvas error")
+        
+        # Should not raise exception
+        report_service._apply_canvas_elements(mock_canvas, Mock())
+        
+        mock_canvas.restoreState.assert_called_once()
 
     # Edge Cases and Error Handling
     def test_html_escaping_in_content(self, report_service):
@@ -542,7 +583,7 @@ class TestReportService:
         story = []
         
         # Should handle HTML content safely
-        report_service._add_text_sample(story, malicious_result)
+        report_service._add_text_sample(story, _build_report_context(malicious_result))
         
         assert len(story) >= 3
 
@@ -557,7 +598,7 @@ class TestReportService:
         story = []
         
         # Should handle unicode content without errors
-        report_service._add_text_sample(story, unicode_result)
+        report_service._add_text_sample(story, _build_report_context(unicode_result))
         
         assert len(story) >= 3
 
@@ -574,7 +615,7 @@ class TestReportService:
         story = []
         
         # Should handle large numbers without issues
-        report_service._add_statistics_section(story, large_stats_result)
+        report_service._add_statistics_section(story, _build_report_context(large_stats_result))
         
         assert len(story) >= 3
 
@@ -592,7 +633,179 @@ class TestReportService:
         story = []
         
         # Should handle malformed data gracefully
-        report_service._add_detection_details(story, malformed_result)
+        report_service._add_detection_details(story, _build_report_context(malformed_result))
         
         # Should not raise an exception
-        assert True
\ No newline at end of file
+        assert True
+
+    def test_escape_plain_text_unchanged(self):
+        """Test that text without markup characters skips escaping."""
+        text = "Plain text without markup"
+
+        assert _escape(text) is text
+
+    def test_escape_markup_characters(self):
+        """Test that markup characters are escaped for the paragraph parser."""
+        assert _escape('<b>"Tom" & \'Jerry\'</b>') == '&lt;b&gt;&quot;Tom&quot; &amp; &#x27;Jerry&#x27;&lt;/b&gt;'
+
+    def test_build_report_context_formats_fields(self, mock_text_analysis_result):
+        """Test that the report context pre-formats analysis fields once."""
+        ctx = _build_report_context(mock_text_analysis_result)
+
+        assert ctx.analysis_id == str(mock_text_analysis_result.id)
+        assert ctx.analysis_type == "Text Analysis"
+        assert ctx.is_image_analysis is False
+        assert ctx.is_ai_generated is True
+        assert ctx.probability_text == "85.0%"
+        assert ctx.confidence_text == "92.0%"
+        assert ctx.processing_time_str == "1.50s"
+        assert ctx.submission is mock_text_analysis_result.submission
+
+    def test_build_report_context_missing_values(self):
+        """Test that the report context falls back to N/A for unusable values."""
+        minimal_result = Mock()
+        minimal_result.created_at = None
+        minimal_result.probability = None
+        minimal_result.processing_time_ms = None
+
+        ctx = _build_report_context(minimal_result)
+
+        assert ctx.created_at_str == 'N/A'
+        assert ctx.probability_text == 'N/A'
+        assert ctx.processing_time_str == 'N/A'
+
+    def test_build_report_context_non_numeric_processing_time(self):
+        """Test that a non-numeric processing time is reported as unavailable."""
+        result = Mock()
+        result.processing_time_ms = '1500'
+
+        assert _build_report_context(result).processing_time_str == 'N/A'
+        
+        result.processing_time_ms = 250
+        assert _build_report_context(result).processing_time_str == '0.25s'
+
+    @patch.object(TextAnalysisResult, 'load_submission_for_report')
+    def test_ensure_submission_loaded_loads_missing_submission(self, mock_load):
+        """Test that an unloaded submission is loaded before building the report."""
+        analysis = TextAnalysisResult(object_id=uuid.uuid4())
+
+        ReportService._ensure_submission_loaded(analysis)
+
+        mock_load.assert_called_once_with()
+
+    def test_ensure_submission_loaded_skips_mocks(self, mock_text_analysis_result):
+        """Test that non-model instances are left untouched."""
+        ReportService._ensure_submission_loaded(mock_text_analysis_result)
+
+        mock_text_analysis_result.load_submission_for_report.assert_not_called()
+
+    # Warm-up Tests
+    def test_warm_up_builds_document(self):
+        """Test that warming up the renderer builds a throwaway document."""
+        with patch('app.services.report_service.SimpleDocTemplate') as mock_doc_class:
+            ReportService.warm_up()
+
+            mock_doc_class.return_value.build.assert_called_once()
+
+    def test_warm_up_failure_is_not_raised(self):
+        """Test that a warm-up failure never prevents the app from starting."""
+        with patch('app.services.report_service.SimpleDocTemplate', side_effect=Exception("Font error")):
+            # Should not raise exception
+            ReportService.warm_up()
+
+    # Report Cache Tests
+    def test_report_cache_key_for_saved_result(self):
+        """Test that saved results get a key built from their identity, completion time and requester."""
+        analysis = TextAnalysisResult(object_id=uuid.uuid4(), completed_at=timezone.now())
+        analysis._state.adding = False
+
+        key = ReportService._report_cache_key(analysis, 'test@example.com')
+
+        assert key.startswith(f"report:TextAnalysisResult:{analysis.pk}:")
+        assert 'test@example.com' not in key
+        assert key != ReportService._report_cache_key(analysis, 'other@example.com')
+
+    def test_report_cache_key_skips_unsaved_and_mock_results(self, mock_text_analysis_result):
+        """Test that unsaved instances and mocks are never cached."""
+        assert ReportService._report_cache_key(TextAnalysisResult(object_id=uuid.uuid4()), 'test@example.com') is None
+        assert ReportService._report_cache_key(mock_text_analysis_result, 'test@example.com') is None
+
+    @patch('app.services.report_service.cache')
+    @patch.object(ReportService, '_report_cache_key', return_value='report:key')
+    def test_generate_report_returns_cached_pdf(self, mock_key, mock_cache, report_service, mock_text_analysis_result):
+        """Test that a cached PDF is returned without rebuilding the report."""
+        mock_cache.get.return_value = b'%PDF-cached'
+
+        with patch('app.services.report_service.SimpleDocTemplate') as mock_doc_class:
+            result = report_service.generate_analysis_report(mock_text_analysis_result, 'test@example.com')
+
+            mock_doc_class.assert_not_called()
+
+        assert result.getvalue() == b'%PDF-cached'
+
+    @patch('app.services.report_service.cache')
+    @patch.object(ReportService, '_report_cache_key', return_value='report:key')
+    def test_generate_report_caches_rendered_pdf(self, mock_key, mock_cache, report_service, mock_text_analysis_result):
+        """Test that a freshly rendered PDF is stored in the cache."""
+        mock_cache.get.return_value = None
+
+        result = report_service.generate_analysis_report(mock_text_analysis_result, 'test@example.com')
+
+        mock_cache.set.assert_called_once_with('report:key', result.getvalue(), timeout=3600)
+
+    @patch('app.services.report_service.requests.get', side_effect=Exception("Storage unavailable"))
+    @patch('app.services.report_service.cache')
+    @patch.object(ReportService, '_report_cache_key', return_value='report:key')
+    def test_generate_report_skips_cache_when_image_missing(self, mock_key, mock_cache, mock_get, report_service,
+                                                            mock_image_analysis_result):
+        """Test that a report rendered without its image is not cached, so the next request retries the image."""
+        mock_cache.get.return_value = None
+
+        result = report_service.generate_analysis_report(mock_image_analysis_result, 'test@example.com')
+
+        assert result.getvalue().startswith(b'%PDF')
+        mock_cache.set.assert_not_called()
+
+    # Style Cache Tests
+    def test_styles_are_shared_between_instances(self):
+        """Test that paragraph styles are built once and shared by every service instance."""
+        first = ReportService()
+        second = ReportService()
+
+        assert first.styles is second.styles
+        assert 'CustomTitle' in second.styles
+
+    def test_standard_table_style_is_cached(self, report_service):
+        """Test that the standard table style is built once and reused."""
+        assert report_service._get_standard_table_style() is ReportService._get_standard_table_style()
+
+    # Stream Output Tests
+    def test_generate_report_to_stream_writes_pdf(self, report_service, mock_text_analysis_result):
+        """Test that the report is written directly to the given stream."""
+        stream = BytesIO()
+
+        report_service.generate_analysis_report_to(stream, mock_text_analysis_result, 'test@example.com')
+
+        assert stream.getvalue().startswith(b'%PDF')
+
+    @patch('app.services.report_service.cache')
+    @patch.object(ReportService, '_report_cache_key', return_value='report:key')
+    def test_generate_report_to_stream_writes_cached_pdf(self, mock_key, mock_cache, report_service,
+                                                         mock_text_analysis_result):
+        """Test that a cached PDF is written to the stream without rebuilding the report."""
+        mock_cache.get.return_value = b'%PDF-cached'
+        stream = Mock(spec=['write'])
+
+        report_service.generate_analysis_report_to(stream, mock_text_analysis_result, 'test@example.com')
+
+        stream.write.assert_called_once_with(b'%PDF-cached')
+        mock_cache.set.assert_not_called()
+
+    def test_append_kv_table(self, report_service):
+        """Test that key/value tables share the standard style and are followed by a spacer."""
+        story = []
+
+        report_service._append_kv_table(story, [['Label:', 'Value']], col_widths=(1*inch, 2*inch))
+
+        assert len(story) == 2
+        assert story[0]._colWidths == [1*inch, 2*inch]
@@ -3,12 +3,15 @@ from unittest.mock import Mock, patch, MagicMock
 import pytest
 from django.contrib.auth.models import User
 from django.core.paginator import Paginator
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.utils import timezone
 from app.services.submission_history_service import SubmissionHistoryService
 from app.models.text_submission import TextSubmission
 from app.models.image_submission import ImageSubmission
 from app.models.text_analysis_result import TextAnalysisResult
 from app.models.image_analysis_result import ImageAnalysisResult
+from app.serializers.submission_serializers import TextSubmissionListSerializer, ImageSubmissionListSerializer
 import uuid
 from datetime import datetime, timedelta
 
@@ -51,6 +54,52 @@ class TestSubmissionHistoryService:
         submission.created_at = timezone.now() - timedelta(hours=1)
         return submission
 
+    @pytest.fixture(autouse=True)
+    def mock_content_types(self):
+        """Resolve submission content types without touching the database."""
+        content_types = {
+            TextSubmission: ContentType(id=1, app_label='app', model='textsubmission'),
+            ImageSubmission: ContentType(id=2, app_label='app', model='imagesubmission'),
+        }
+        with patch('app.services.submission_history_service.ContentType.objects.get_for_model',
+                   side_effect=content_types.get) as mock_get_for_model:
+            yield mock_get_for_model
+
+    def _mock_history(self, mock_objects, rows, search=False):
+        """Wire a patched submission manager so its history rows and page fetch return the given values."""
+        submissions = mock_objects.filter.return_value
+        if search:
+            submissions = submissions.filter.return_value
+        history_rows = submissions.annotate.return_value.values.return_value
+        history_rows.__iter__.side_effect = lambda: iter(rows)
+        return submissions, history_rows
+
+    def _text_row(self, submission, analysis_id=None):
+        """Build the values() row fetched for a text submission on the current page."""
+        return {
+            'id': submission.id,
+            'name': submission.name,
+            'created_at': submission.created_at,
+            'latest_analysis_id': analysis_id
+        }
+
+    def _mock_text_page(self, submissions, rows):
+        """Make the page fetch of a patched text submission queryset return the given values() rows."""
+        submissions.filter.return_value.annotate.return_value.values.return_value = rows
+
+    def _mock_paginator(self, mock_paginator_class, rows, count):
+        """Configure a patched Paginator to return a single page of history rows."""
+        mock_paginator = Mock()
+        mock_page_obj = Mock()
+        mock_page_obj.object_list = rows
+        mock_page_obj.has_next.return_value = False
+        mock_page_obj.has_previous.return_value = False
+        mock_paginator.get_page.return_value = mock_page_obj
+        mock_paginator.num_pages = 1
+        mock_paginator.count = count
+        mock_paginator_class.return_value = mock_paginator
+        return mock_paginator
+
     # Get User Submissions Tests
     @patch('app.services.submission_history_service.TextSubmission.objects')
     @patch('app.services.submission_history_service.ImageSubmission.objects')
@@ -59,63 +108,162 @@ class TestSubmissionHistoryService:
                                                        mock_text_objects, mock_user, mock_text_submission, 
                                                        mock_image_submission):
         """Test successful retrieval of mixed user submissions."""
-        # Mock querysets
-        mock_text_objects.filter.return_value = [mock_text_submission]
-        mock_image_objects.filter.return_value = [mock_image_submission]
-        
-        # Mock serializers
-        with patch('app.services.submission_history_service.TextSubmissionListSerializer') as mock_text_serializer:
-            with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
-                mock_text_serializer.return_value.data = [{'id': str(mock_text_submission.id), 'created_at': '2023-01-01'}]
-                mock_image_serializer.return_value.data = [{'id': str(mock_image_submission.id), 'created_at': '2023-01-02'}]
-                
-                # Mock paginator
-                mock_paginator = Mock()
-                mock_page_obj = Mock()
-                mock_page_obj.object_list = [{'id': str(mock_image_submission.id), 'type': 'image'}]
-                mock_page_obj.has_next.return_value = False
-                mock_page_obj.has_previous.return_value = False
-                mock_paginator.get_page.return_value = mock_page_obj
-                mock_paginator.num_pages = 1
-                mock_paginator.count = 2
-                mock_paginator_class.return_value = mock_paginator
-                
-                result = SubmissionHistoryService.get_user_submissions(mock_user, page=1, page_size=10)
-                
-                # Verify success
-                assert result['success'] is True
-                assert 'submissions' in result
-                assert 'pagination' in result
-                assert result['pagination']['current_page'] == 1
-                
-                # Verify correct filtering
-                mock_text_objects.filter.assert_called_once_with(user=mock_user)
-                mock_image_objects.filter.assert_called_once_with(user=mock_user)
+        # Mock history querysets
+        text_submissions, text_rows = self._mock_history(mock_text_objects, [])
+        self._mock_history(mock_image_objects, [])
+        analysis_id = uuid.uuid4()
+        self._mock_text_page(text_submissions, [self._text_row(mock_text_submission, analysis_id)])
+        page_rows = [
+            {'id': mock_text_submission.id, 'created_at': mock_text_submission.created_at, 'type': 'text'},
+            {'id': mock_image_submission.id, 'created_at': mock_image_submission.created_at, 'type': 'image'},
+        ]
+        mock_paginator = self._mock_paginator(mock_paginator_class, page_rows, 2)
+        
+        # Mock image serializer
+        with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
+            mock_image_serializer.return_value.data = [{'id': str(mock_image_submission.id), 'created_at': '2023-01-01'}]
+            
+            result = SubmissionHistoryService.get_user_submissions(mock_user, page=1, page_size=10)
+            
+            # Verify success
+            assert result['success'] is True
+            assert result['pagination']['current_page'] == 1
+            assert result['pagination']['total_items'] == 2
+            
+            # Verify page order and types are preserved
+            assert [item['type'] for item in result['submissions']] == ['text', 'image']
+            
+            # Verify text rows are shaped like the list serializer output
+            assert result['submissions'][0] == {
+                'id': str(mock_text_submission.id),
+                'name': mock_text_submission.name,
+                'created_at': mock_text_submission.created_at.isoformat().replace('+00:00', 'Z'),
+                'analysis_id': str(analysis_id),
+                'type': 'text'
+            }
+            
+            # Verify correct filtering
+            mock_text_objects.filter.assert_called_once_with(user=mock_user)
+            mock_image_objects.filter.assert_called_once_with(user=mock_user)
+            
+            # Verify both types are merged and ordered in the database
+            history = text_rows.union.return_value.order_by.return_value
+            text_rows.union.assert_called_once()
+            text_rows.union.return_value.order_by.assert_called_once_with('-created_at')
+            mock_paginator_class.assert_called_once_with(history, 10)
+
+    @patch('app.services.submission_history_service.TextSubmission.objects')
+    @patch('app.services.submission_history_service.ImageSubmission.objects')
+    @patch('app.services.submission_history_service.Paginator')
+    def test_get_user_submissions_serializes_only_current_page(self, mock_paginator_class, mock_image_objects,
+                                                             mock_text_objects, mock_user, mock_text_submission):
+        """Test that only submissions on the requested page are fetched and serialized."""
+        text_submissions, _ = self._mock_history(mock_text_objects, [])
+        image_submissions, _ = self._mock_history(mock_image_objects, [])
+        self._mock_text_page(text_submissions, [self._text_row(mock_text_submission)])
+        page_rows = [{'id': mock_text_submission.id, 'created_at': mock_text_submission.created_at, 'type': 'text'}]
+        self._mock_paginator(mock_paginator_class, page_rows, 25)
+        
+        with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
+            result = SubmissionHistoryService.get_user_submissions(mock_user, page=3, page_size=1)
+            
+            assert result['success'] is True
+            assert result['pagination']['total_items'] == 25
+            assert result['submissions'][0]['analysis_id'] is None
+            text_submissions.filter.assert_called_once_with(id__in=[mock_text_submission.id])
+            text_submissions.filter.return_value.annotate.return_value.values.assert_called_once_with(
+                'id', 'name', 'created_at', 'latest_analysis_id'
+            )
+            image_submissions.filter.assert_not_called()
+            mock_image_serializer.assert_not_called()
 
     @patch('app.services.submission_history_service.TextSubmission.objects')
-    def test_get_user_submissions_text_only_filter(self, mock_text_objects, mock_user, mock_text_submission):
+    @patch('app.services.submission_history_service.ImageSubmission.objects')
+    @patch('app.services.submission_history_service.Paginator')
+    def test_get_user_submissions_caches_history_count(self, mock_paginator_class, mock_image_objects,
+                                                       mock_text_objects, mock_user):
+        """Test that the unfiltered history count is reused until the user's cache is invalidated."""
+        self._mock_history(mock_text_objects, [])
+        self._mock_history(mock_image_objects, [])
+
+        self._mock_paginator(mock_paginator_class, [], 25)
+        first = SubmissionHistoryService.get_user_submissions(mock_user, page=1, page_size=10)
+
+        self._mock_paginator(mock_paginator_class, [], 30)
+        cached = SubmissionHistoryService.get_user_submissions(mock_user, page=1, page_size=10)
+
+        SubmissionHistoryService.invalidate_user_cache(mock_user.id)
+        self._mock_paginator(mock_paginator_class, [], 30)
+        refreshed = SubmissionHistoryService.get_user_submissions(mock_user, page=1, page_size=10)
+
+        assert first['pagination']['total_items'] == 25
+        assert cached['pagination']['total_items'] == 25
+        assert refreshed['pagination']['total_items'] == 30
+
+    @patch('app.services.submission_history_service.TextSubmission.objects')
+    @patch('app.services.submission_history_service.ImageSubmission.objects')
+    def test_get_user_submissions_annotates_latest_analysis(self, mock_image_objects, mock_text_objects, mock_user,
+                                                            mock_text_submission, mock_image_submission):
+        """Test that the latest analysis ID is annotated onto the page querysets."""
+        rows = [
+            {'id': mock_text_submission.id, 'created_at': mock_text_submission.created_at, 'type': 'text'},
+            {'id': mock_image_submission.id, 'created_at': mock_image_submission.created_at, 'type': 'image'},
+        ]
+        _, text_rows = self._mock_history(mock_text_objects, [])
+        self._mock_history(mock_image_objects, [])
+        text_rows.union.return_value.order_by.return_value = rows
+
+        with patch('app.services.submission_history_service.ImageSubmissionListSerializer'):
+            result = SubmissionHistoryService.get_user_submissions(mock_user, page_size=None)
+
+        assert result['success'] is True
+        text_page = mock_text_objects.filter.return_value.filter.return_value
+        image_page = mock_image_objects.filter.return_value.filter.return_value.only.return_value
+        text_annotation = text_page.annotate.call_args.kwargs['latest_analysis_id']
+        image_annotation = image_page.annotate.call_args.kwargs['latest_analysis_id']
+        assert text_annotation.query.model is TextAnalysisResult
+        assert image_annotation.query.model is ImageAnalysisResult
+
+    def test_list_serializers_use_annotated_analysis_id(self, mock_text_submission, mock_image_submission):
+        """Test that list serializers read the annotated ID instead of querying per row."""
+        analysis_id = uuid.uuid4()
+        mock_text_submission.latest_analysis_id = analysis_id
+        mock_image_submission.latest_analysis_id = None
+
+        with patch.object(TextAnalysisResult.objects, 'filter') as mock_text_filter:
+            with patch.object(ImageAnalysisResult.objects, 'filter') as mock_image_filter:
+                assert TextSubmissionListSerializer().get_analysis_id(mock_text_submission) == str(analysis_id)
+                assert ImageSubmissionListSerializer().get_analysis_id(mock_image_submission) is None
+
+                mock_text_filter.assert_not_called()
+                mock_image_filter.assert_not_called()
+
+    @patch('app.services.submission_history_service.TextSubmission.objects')
+    @patch('app.services.submission_history_service.ImageSubmission.objects')
+    def test_get_user_submissions_text_only_filter(self, mock_image_objects, mock_text_objects, mock_user,
+                                                   mock_text_submission):
         """Test user submissions with text-only filter."""
-        mock_text_objects.filter.return_value = [mock_text_submission]
+        text_submissions, text_rows = self._mock_history(mock_text_objects, [])
+        self._mock_text_page(text_submissions, [self._text_row(mock_text_submission)])
         
-        with patch('app.services.submission_history_service.TextSubmissionListSerializer') as mock_serializer:
-            mock_serializer.return_value.data = [{'id': str(mock_text_submission.id), 'created_at': '2023-01-01'}]
+        with patch('app.services.submission_history_service.Paginator') as mock_paginator_class:
+            page_rows = [{'id': mock_text_submission.id, 'created_at': mock_text_submission.created_at, 'type': 'text'}]
+            self._mock_paginator(mock_paginator_class, page_rows, 1)
             
-            with patch('app.services.submission_history_service.Paginator') as mock_paginator_class:
-                mock_paginator = Mock()
-                mock_page_obj = Mock()
-                mock_page_obj.object_list = [{'id': str(mock_text_submission.id), 'type': 'text'}]
-                mock_paginator.get_page.return_value = mock_page_obj
-                mock_paginator.count = 1
-                mock_paginator_class.return_value = mock_paginator
-                
-                result = SubmissionHistoryService.get_user_submissions(
-                    mock_user, 
-                    submission_type='text'
-                )
-                
-                # Verify success and text-only filtering
-                assert result['success'] is True
-                mock_text_objects.filter.assert_called_once_with(user=mock_user)
+            result = SubmissionHistoryService.get_user_submissions(
+                mock_user, 
+                submission_type='text'
+            )
+            
+            # Verify success and text-only filtering
+            assert result['success'] is True
+            assert result['submissions'][0]['type'] == 'text'
+            mock_text_objects.filter.assert_called_once_with(user=mock_user)
+            mock_image_objects.filter.assert_not_called()
+            
+            # Verify a single type is ordered without a union
+            text_rows.union.assert_not_called()
+            mock_paginator_class.assert_called_once_with(text_rows.order_by.return_value, 10)
 
     def test_get_user_submissions_exception_handling(self, mock_user):
         """Test user submissions exception handling."""
@@ -199,17 +347,21 @@ class TestSubmissionHistoryService:
     @patch('app.services.submission_history_service.TextSubmission.objects')
     def test_delete_submission_text_success(self, mock_text_objects, mock_user, mock_text_submission):
         """Test successful text submission deletion."""
-        mock_text_objects.get.return_value = mock_text_submission
+        mock_text_submissions = mock_text_objects.filter.return_value
+        mock_text_submissions.values_list.return_value.first.return_value = (mock_text_submission.name,)
         
         result = SubmissionHistoryService.delete_submission(str(mock_text_submission.id), mock_user)
         
         # Verify success - matches actual service message format
         assert result['success'] is True
         assert 'Text submission' in result['message']
+        assert mock_text_submission.name in result['message']
         assert 'deleted successfully' in result['message']
         
-        # Verify deletion was called
-        mock_text_submission.delete.assert_called_once()
+        # Verify deletion was issued on the filtered queryset
+        mock_text_objects.filter.assert_called_once_with(id=str(mock_text_submission.id), user=mock_user)
+        mock_text_submissions.values_list.assert_called_once_with('name')
+        mock_text_submissions.delete.assert_called_once()
 
     @patch('app.services.submission_history_service.TextSubmission.objects')
     @patch('app.services.submission_history_service.ImageSubmission.objects')
@@ -217,33 +369,84 @@ class TestSubmissionHistoryService:
                                            mock_user, mock_image_submission):
         """Test successful image submission deletion."""
         # Text submission doesn't exist
-        mock_text_objects.get.side_effect = TextSubmission.DoesNotExist()
+        mock_text_objects.filter.return_value.values_list.return_value.first.return_value = None
         
         # Image submission exists
-        mock_image_objects.get.return_value = mock_image_submission
+        mock_image_submissions = mock_image_objects.filter.return_value
+        mock_image_submissions.values_list.return_value.first.return_value = (mock_image_submission.name, 'submissions/images/test.jpg')
         
-        result = SubmissionHistoryService.delete_submission(str(mock_image_submission.id), mock_user)
+        with patch.object(SubmissionHistoryService, '_remove_stored_files') as mock_remove:
+            result = SubmissionHistoryService.delete_submission(str(mock_image_submission.id), mock_user)
         
         # Verify success - matches actual service message format
         assert result['success'] is True
         assert 'Image submission' in result['message']
         assert 'deleted successfully' in result['message']
         
-        # Verify deletion was called
-        mock_image_submission.delete.assert_called_once()
+        # Verify only the image submission was deleted, and its stored file removed after commit
+        mock_text_objects.filter.return_value.delete.assert_not_called()
+        mock_image_submissions.delete.assert_called_once()
+        mock_image_submissions.values_list.assert_called_once_with('name', 'image')
+        mock_remove.assert_called_once_with(['submissions/images/test.jpg'])
 
     @patch('app.services.submission_history_service.TextSubmission.objects')
     @patch('app.services.submission_history_service.ImageSubmission.objects')
     def test_delete_submission_not_found(self, mock_image_objects, mock_text_objects, mock_user):
         """Test deleting non-existent submission."""
         # Both submissions don't exist
-        mock_text_objects.get.side_effect = TextSubmission.DoesNotExist()
-        mock_image_objects.get.side_effect = ImageSubmission.DoesNotExist()
+        mock_text_objects.filter.return_value.values_list.return_value.first.return_value = None
+        mock_image_objects.filter.return_value.values_list.return_value.first.return_value = None
         
         result = SubmissionHistoryService.delete_submission('non-existent-id', mock_user)
         
         assert result['success'] is False
         assert 'Submission not found or you do not have permission to delete it' in result['error']
+        mock_text_objects.filter.return_value.delete.assert_not_called()
+        mock_image_objects.filter.return_value.delete.assert_not_called()
+
+    @patch('app.services.submission_history_service.TextSubmission.objects')
+    @patch('app.services.submission_history_service.ImageSubmission.objects')
+    def test_delete_submissions_bulk_success(self, mock_image_objects, mock_text_objects, mock_user):
+        """Test deleting several submissions with one delete per table and one storage call."""
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        mock_text_objects.filter.return_value.delete.return_value = (3, {'app.TextSubmission': 2})
+        mock_image_submissions = mock_image_objects.filter.return_value
+        mock_image_submissions.values_list.return_value = ['submissions/images/a.jpg']
+        mock_image_submissions.delete.return_value = (1, {'app.ImageSubmission': 1})
+        
+        with patch.object(SubmissionHistoryService, '_remove_stored_files') as mock_remove:
+            result = SubmissionHistoryService.delete_submissions(ids, mock_user)
+        
+        assert result['success'] is True
+        assert result['deleted_count'] == 3
+        mock_text_objects.filter.assert_called_once_with(id__in=ids, user=mock_user)
+        mock_image_objects.filter.assert_called_once_with(id__in=ids, user=mock_user)
+        mock_image_submissions.values_list.assert_called_once_with('image', flat=True)
+        mock_remove.assert_called_once_with(['submissions/images/a.jpg'])
+
+    @patch('app.services.submission_history_service.TextSubmission.objects')
+    @patch('app.services.submission_history_service.ImageSubmission.objects')
+    def test_delete_submissions_bulk_none_found(self, mock_image_objects, mock_text_objects, mock_user):
+        """Test bulk deletion when none of the submissions belong to the user."""
+        mock_text_objects.filter.return_value.delete.return_value = (0, {})
+        mock_image_objects.filter.return_value.values_list.return_value = []
+        mock_image_objects.filter.return_value.delete.return_value = (0, {})
+        
+        with patch.object(SubmissionHistoryService, '_remove_stored_files') as mock_remove:
+            result = SubmissionHistoryService.delete_submissions([str(uuid.uuid4())], mock_user)
+        
+        assert result['success'] is False
+        assert 'No submissions found' in result['error']
+        mock_remove.assert_not_called()
+
+    def test_remove_stored_files_uses_bulk_delete(self):
+        """Test stored files are removed with a single delete_many call when the storage supports it."""
+        mock_storage = Mock()
+        with patch.object(ImageSubmission._meta.get_field('image'), 'storage', mock_storage):
+            SubmissionHistoryService._remove_stored_files(['a.jpg', 'b.jpg'])
+        
+        mock_storage.delete_many.assert_called_once_with(['a.jpg', 'b.jpg'])
+        mock_storage.delete.assert_not_called()
 
     # Get Submission Statistics Tests
     @patch('app.services.submission_history_service.TextSubmission.objects')
@@ -260,19 +463,15 @@ class TestSubmissionHistoryService:
         mock_image_objects.filter.return_value.count.return_value = 8
         
         # Mock content types
-        mock_text_content_type = Mock()
-        mock_image_content_type = Mock()
-        mock_content_type_objects.get_for_model.side_effect = [
-            mock_text_content_type, mock_text_content_type, mock_text_content_type,
-            mock_image_content_type, mock_image_content_type, mock_image_content_type
-        ]
+        mock_content_type_objects.get_for_model.return_value = Mock()
         
-        # Mock analysis counts
-        mock_text_objects.filter.return_value.values_list.return_value = [1, 2, 3]
-        mock_image_objects.filter.return_value.values_list.return_value = [4, 5, 6]
-        
-        mock_text_analysis_objects.filter.return_value.count.side_effect = [10, 6, 4]  # total, ai, human
-        mock_image_analysis_objects.filter.return_value.count.side_effect = [5, 2, 3]  # total, ai, human
+        # Mock analysis aggregates
+        mock_text_analysis_objects.filter.return_value.aggregate.return_value = {
+            'total': 10, 'ai_detected': 6, 'human_detected': 4
+        }
+        mock_image_analysis_objects.filter.return_value.aggregate.return_value = {
+            'total': 5, 'ai_detected': 2, 'human_detected': 3
+        }
         
         result = SubmissionHistoryService.get_submission_statistics(mock_user)
         
@@ -285,6 +484,30 @@ class TestSubmissionHistoryService:
         assert stats['total_analyses'] == 15  # 10 + 5
         assert stats['ai_detected_count'] == 8  # 6 + 2
         assert stats['human_detected_count'] == 7  # 4 + 3
+        
+        # Verify each analysis model is aggregated in a single query
+        mock_text_analysis_objects.filter.return_value.aggregate.assert_called_once()
+        mock_image_analysis_objects.filter.return_value.aggregate.assert_called_once()
+        mock_text_analysis_objects.filter.return_value.count.assert_not_called()
+
+    @patch('app.services.submission_history_service.TextSubmission.objects')
+    @patch('app.services.submission_history_service.ImageSubmission.objects')
+    @patch('app.services.submission_history_service.TextAnalysisResult.objects')
+    @patch('app.services.submission_history_service.ImageAnalysisResult.objects')
+    def test_get_submission_statistics_no_analyses(self, mock_image_analysis_objects, mock_text_analysis_objects,
+                                                  mock_image_objects, mock_text_objects, mock_user):
+        """Test that empty aggregates are reported as zero counts."""
+        mock_text_objects.filter.return_value.count.return_value = 0
+        mock_image_objects.filter.return_value.count.return_value = 0
+        empty_counts = {'total': 0, 'ai_detected': None, 'human_detected': None}
+        mock_text_analysis_objects.filter.return_value.aggregate.return_value = empty_counts
+        mock_image_analysis_objects.filter.return_value.aggregate.return_value = empty_counts
+        
+        result = SubmissionHistoryService.get_submission_statistics(mock_user)
+        
+        assert result['success'] is True
+        assert result['statistics']['ai_detected_count'] == 0
+        assert result['statistics']['ai_detection_rate'] == 0
 
     def test_get_submission_statistics_exception_handling(self, mock_user):
         """Test submission statistics exception handling."""
@@ -296,6 +519,40 @@ class TestSubmissionHistoryService:
             assert result['success'] is False
             assert 'Database error' in result['error']
 
+    @patch('app.services.submission_history_service.SubmissionHistoryService._compute_submission_statistics')
+    def test_get_submission_statistics_uses_cache(self, mock_compute, mock_user):
+        """Test that repeated statistics requests are served from the cache."""
+        mock_compute.return_value = {'total_submissions': 3}
+
+        first = SubmissionHistoryService.get_submission_statistics(mock_user)
+        second = SubmissionHistoryService.get_submission_statistics(mock_user)
+
+        assert first == second == {'success': True, 'statistics': {'total_submissions': 3}}
+        mock_compute.assert_called_once_with(mock_user)
+
+    @patch('app.services.submission_history_service.SubmissionHistoryService._compute_submission_statistics')
+    def test_invalidate_user_cache_recomputes_statistics(self, mock_compute, mock_user):
+        """Test that invalidating a user's statistics forces a fresh computation."""
+        mock_compute.side_effect = [{'total_submissions': 3}, {'total_submissions': 4}]
+
+        SubmissionHistoryService.get_submission_statistics(mock_user)
+        SubmissionHistoryService.invalidate_user_cache(mock_user.id)
+        result = SubmissionHistoryService.get_submission_statistics(mock_user)
+
+        assert result['statistics'] == {'total_submissions': 4}
+        assert mock_compute.call_count == 2
+
+    def test_invalidate_user_cache_waits_for_commit(self, mock_user):
+        """Test that a user's cache version only moves once the surrounding transaction commits."""
+        version = SubmissionHistoryService._cache_version(mock_user.id)
+
+        with transaction.atomic():
+            SubmissionHistoryService.invalidate_user_cache(mock_user.id)
+
+            assert SubmissionHistoryService._cache_version(mock_user.id) == version
+
+        assert SubmissionHistoryService._cache_version(mock_user.id) != version
+
     # Search Functionality Tests
     @patch('app.services.submission_history_service.TextSubmission.objects')
     @patch('app.services.submission_history_service.ImageSubmission.objects')
@@ -303,44 +560,38 @@ class TestSubmissionHistoryService:
                                             mock_user, mock_text_submission):
         """Test user submissions with search functionality."""
         # Mock filtered querysets
-        mock_text_filtered = Mock()
-        mock_text_objects.filter.return_value.filter.return_value = [mock_text_submission]
-        mock_image_objects.filter.return_value.filter.return_value = []
-        
-        with patch('app.services.submission_history_service.TextSubmissionListSerializer') as mock_text_serializer:
-            with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
-                mock_text_serializer.return_value.data = [{'id': str(mock_text_submission.id), 'created_at': '2023-01-01'}]
-                mock_image_serializer.return_value.data = []
+        text_submissions, _ = self._mock_history(mock_text_objects, [], search=True)
+        self._mock_history(mock_image_objects, [], search=True)
+        self._mock_text_page(text_submissions, [self._text_row(mock_text_submission)])
+        
+        with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
+            mock_image_serializer.return_value.data = []
+            
+            with patch('app.services.submission_history_service.Paginator') as mock_paginator_class:
+                page_rows = [{'id': mock_text_submission.id, 'created_at': mock_text_submission.created_at, 'type': 'text'}]
+                self._mock_paginator(mock_paginator_class, page_rows, 1)
+                
+                result = SubmissionHistoryService.get_user_submissions(
+                    mock_user,
+                    search="sample"
+                )
                 
-                with patch('app.services.submission_history_service.Paginator') as mock_paginator_class:
-                    mock_paginator = Mock()
-                    mock_page_obj = Mock()
-                    mock_page_obj.object_list = [{'id': str(mock_text_submission.id), 'type': 'text'}]
-                    mock_paginator.get_page.return_value = mock_page_obj
-                    mock_paginator.count = 1
-                    mock_paginator_class.return_value = mock_paginator
-                    
-                    result = SubmissionHistoryService.get_user_submissions(
-                        mock_user,
-                        search="sample"
-                    )
-                    
-                    # Verify success and search was applied
-                    assert result['success'] is True
+                # Verify success and search was applied
+                assert result['success'] is True
+                assert len(result['submissions']) == 1
+                mock_image_objects.filter.return_value.filter.assert_called_once_with(name__icontains="sample")
 
     # Pagination Tests
     @patch('app.services.submission_history_service.TextSubmission.objects')
     @patch('app.services.submission_history_service.ImageSubmission.objects')
     def test_get_user_submissions_no_pagination(self, mock_image_objects, mock_text_objects, mock_user):
         """Test user submissions without pagination (page_size=None)."""
-        mock_text_objects.filter.return_value = []
-        mock_image_objects.filter.return_value = []
+        _, text_rows = self._mock_history(mock_text_objects, [])
+        self._mock_history(mock_image_objects, [])
+        text_rows.union.return_value.order_by.return_value = []
         
-        with patch('app.services.submission_history_service.TextSubmissionListSerializer') as mock_text_serializer:
-            with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
-                mock_text_serializer.return_value.data = []
-                mock_image_serializer.return_value.data = []
-                
+        with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
+            with patch('app.services.submission_history_service.Paginator') as mock_paginator_class:
                 result = SubmissionHistoryService.get_user_submissions(
                     mock_user,
                     page_size=None  # No pagination
@@ -350,36 +601,28 @@ class TestSubmissionHistoryService:
                 assert result['success'] is True
                 assert result['pagination']['showing_all'] is True
                 assert result['pagination']['total_pages'] == 1
+                mock_paginator_class.assert_not_called()
 
     # Edge Cases
     def test_get_user_submissions_empty_results(self, mock_user):
         """Test user submissions with no results."""
         with patch('app.services.submission_history_service.TextSubmission.objects') as mock_text_objects:
             with patch('app.services.submission_history_service.ImageSubmission.objects') as mock_image_objects:
-                mock_text_objects.filter.return_value = []
-                mock_image_objects.filter.return_value = []
+                self._mock_history(mock_text_objects, [])
+                self._mock_history(mock_image_objects, [])
                 
-                with patch('app.services.submission_history_service.TextSubmissionListSerializer') as mock_text_serializer:
-                    with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
-                        mock_text_serializer.return_value.data = []
-                        mock_image_serializer.return_value.data = []
+                with patch('app.services.submission_history_service.ImageSubmissionListSerializer') as mock_image_serializer:
+                    with patch('app.services.submission_history_service.Paginator') as mock_paginator_class:
+                        self._mock_paginator(mock_paginator_class, [], 0)
                         
-                        with patch('app.services.submission_history_service.Paginator') as mock_paginator_class:
-                            mock_paginator = Mock()
-                            mock_page_obj = Mock()
-                            mock_page_obj.object_list = []
-                            mock_page_obj.has_next.return_value = False
-                            mock_page_obj.has_previous.return_value = False
-                            mock_paginator.get_page.return_value = mock_page_obj
-                            mock_paginator.count = 0
-                            mock_paginator_class.return_value = mock_paginator
-                            
-                            result = SubmissionHistoryService.get_user_submissions(mock_user)
-                            
-                            # Verify empty results handled correctly
-                            assert result['success'] is True
-                            assert len(result['submissions']) == 0
-                            assert result['pagination']['total_items'] == 0
+                        result = SubmissionHistoryService.get_user_submissions(mock_user)
+                        
+                        # Verify empty results handled correctly
+                        assert result['success'] is True
+                        assert len(result['submissions']) == 0
+                        assert result['pagination']['total_items'] == 0
+                        mock_text_objects.filter.return_value.filter.assert_not_called()
+                        mock_image_serializer.assert_not_called()
 
     def test_get_submission_detail_exception_handling(self, mock_user):
         """Test submission detail exception handling."""
@@ -394,10 +637,9 @@ class TestSubmissionHistoryService:
     def test_delete_submission_exception_handling(self, mock_user):
         """Test delete submission exception handling."""
         with patch('app.services.submission_history_service.TextSubmission.objects') as mock_text_objects:
-            mock_text_objects.get.side_effect = Exception("Database error")
+            mock_text_objects.filter.side_effect = Exception("Database error")
             
             result = SubmissionHistoryService.delete_submission('test-id', mock_user)
             
             assert result['success'] is False
-            # The service returns a traceback, so just check it's an error
-            assert 'error' in result
\ No newline at end of file
+            assert result['error'] == 'Database error'
\ No newline at end of file
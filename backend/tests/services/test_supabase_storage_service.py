@@ -3,7 +3,7 @@ from unittest.mock import Mock, patch, mock_open, MagicMock
 import pytest
 from django.core.files.base import ContentFile
 from django.test import override_settings
-from app.services.supabase_storage_service import SupabaseStorage, SupabaseStorageService
+from app.services.supabase_storage_service import SupabaseStorage, SupabaseStorageService, _get_client
 import os
 import uuid
 import requests
@@ -19,10 +19,12 @@ class TestSupabaseStorage:
     @pytest.fixture
     def mock_supabase_client(self):
         """Create mock Supabase client."""
+        _get_client.cache_clear()
         with patch('app.services.supabase_storage_service.create_client') as mock_create:
             mock_client = Mock()
             mock_create.return_value = mock_client
             yield mock_client
+        _get_client.cache_clear()
 
     @pytest.fixture
     def storage_instance(self, mock_supabase_client):
@@ -51,17 +53,19 @@ class TestSupabaseStorage:
         assert result == 'test.jpg'
         mock_supabase_client.storage.from_.assert_called_with('test-bucket')
 
-    def test_save_file_exists_update_success(self, storage_instance, mock_supabase_client, mock_content_file):
-        """Test save when file exists, update succeeds."""
-        # Mock upload failure (file exists), then successful update
-        mock_supabase_client.storage.from_.return_value.upload.side_effect = Exception("already exists")
-        mock_supabase_client.storage.from_.return_value.update.return_value = {'path': 'test.jpg'}
+    def test_save_file_exists_retries_once_with_unique_name(self, storage_instance, mock_supabase_client, mock_content_file):
+        """Test save when the upsert conflicts goes straight to a unique name without an update call."""
+        mock_supabase_client.storage.from_.return_value.upload.side_effect = [
+            Exception("409 already exists"),
+            {'path': 'test_12345678.jpg'}
+        ]
         
         result = storage_instance._save('test.jpg', mock_content_file)
         
-        assert result == 'test.jpg'
-        # Verify update was called after upload failed
-        mock_supabase_client.storage.from_.return_value.update.assert_called_once()
+        assert result != 'test.jpg'
+        assert result.startswith('test_')
+        assert mock_supabase_client.storage.from_.return_value.upload.call_count == 2
+        mock_supabase_client.storage.from_.return_value.update.assert_not_called()
 
     def test_save_file_exists_generate_unique_name(self, storage_instance, mock_supabase_client, mock_content_file):
         """Test save when file exists and update fails, generates unique name."""
@@ -90,7 +94,7 @@ class TestSupabaseStorage:
             storage_instance._save('test.jpg', mock_content_file)
 
     # Open Method Tests
-    @patch('app.services.supabase_storage_service.requests.get')
+    @patch('app.services.supabase_storage_service._HTTP_SESSION.get')
     def test_open_success(self, mock_get, storage_instance, mock_supabase_client):
         """Test successful file open."""
         # Mock URL generation and HTTP response
@@ -105,9 +109,9 @@ class TestSupabaseStorage:
         
         assert isinstance(file_obj, ContentFile)
         assert file_obj.read() == b"test image content"
-        mock_get.assert_called_once_with('https://example.com/test.jpg')
+        mock_get.assert_called_once_with('https://example.com/test.jpg', timeout=30)
 
-    @patch('app.services.supabase_storage_service.requests.get')
+    @patch('app.services.supabase_storage_service._HTTP_SESSION.get')
     def test_open_http_error(self, mock_get, storage_instance, mock_supabase_client):
         """Test file open with HTTP error."""
         mock_supabase_client.storage.from_.return_value.get_public_url.return_value = 'https://example.com/test.jpg'
@@ -140,51 +144,54 @@ class TestSupabaseStorage:
             assert url == 'https://test.supabase.co/storage/v1/object/public/test-bucket/test.jpg'
 
     # Exists Method Tests
-    def test_exists_true(self, storage_instance, mock_supabase_client):
+    @patch('app.services.supabase_storage_service._HTTP_SESSION.head')
+    def test_exists_true(self, mock_head, storage_instance, mock_supabase_client):
         """Test file exists check returns True."""
-        mock_supabase_client.storage.from_.return_value.list.return_value = [
-            {'name': 'test.jpg', 'size': 1024}
-        ]
+        mock_supabase_client.storage.from_.return_value.get_public_url.return_value = 'https://example.com/test.jpg'
+        mock_head.return_value = Mock(status_code=200)
         
         exists = storage_instance.exists('test.jpg')
         assert exists is True
+        mock_head.assert_called_once_with('https://example.com/test.jpg', timeout=30)
+        mock_supabase_client.storage.from_.return_value.list.assert_not_called()
 
-    def test_exists_false(self, storage_instance, mock_supabase_client):
+    @patch('app.services.supabase_storage_service._HTTP_SESSION.head')
+    def test_exists_false(self, mock_head, storage_instance, mock_supabase_client):
         """Test file exists check returns False."""
-        mock_supabase_client.storage.from_.return_value.list.return_value = [
-            {'name': 'other.jpg', 'size': 1024}
-        ]
+        mock_head.return_value = Mock(status_code=400)
         
         exists = storage_instance.exists('test.jpg')
         assert exists is False
 
-    def test_exists_exception_handling(self, storage_instance, mock_supabase_client):
+    @patch('app.services.supabase_storage_service._HTTP_SESSION.head')
+    def test_exists_exception_handling(self, mock_head, storage_instance, mock_supabase_client):
         """Test exists with exception returns False."""
-        mock_supabase_client.storage.from_.return_value.list.side_effect = Exception("API error")
+        mock_head.side_effect = requests.RequestException("Connection error")
         
         exists = storage_instance.exists('test.jpg')
         assert exists is False
 
     # Size Method Tests
-    def test_size_success(self, storage_instance, mock_supabase_client):
+    @patch('app.services.supabase_storage_service._HTTP_SESSION.head')
+    def test_size_success(self, mock_head, storage_instance, mock_supabase_client):
         """Test successful file size retrieval."""
-        mock_supabase_client.storage.from_.return_value.list.return_value = [
-            {'name': 'test.jpg', 'metadata': {'size': 2048}}
-        ]
+        mock_head.return_value = Mock(status_code=200, headers={'Content-Length': '2048'})
         
         size = storage_instance.size('test.jpg')
         assert size == 2048
 
-    def test_size_file_not_found(self, storage_instance, mock_supabase_client):
+    @patch('app.services.supabase_storage_service._HTTP_SESSION.head')
+    def test_size_file_not_found(self, mock_head, storage_instance, mock_supabase_client):
         """Test size when file not found returns 0."""
-        mock_supabase_client.storage.from_.return_value.list.return_value = []
+        mock_head.return_value = Mock(status_code=400, headers={'Content-Length': '52'})
         
         size = storage_instance.size('test.jpg')
         assert size == 0
 
-    def test_size_exception_handling(self, storage_instance, mock_supabase_client):
+    @patch('app.services.supabase_storage_service._HTTP_SESSION.head')
+    def test_size_exception_handling(self, mock_head, storage_instance, mock_supabase_client):
         """Test size with exception returns 0."""
-        mock_supabase_client.storage.from_.return_value.list.side_effect = Exception("API error")
+        mock_head.side_effect = requests.RequestException("Connection error")
         
         size = storage_instance.size('test.jpg')
         assert size == 0
@@ -199,12 +206,27 @@ class TestSupabaseStorage:
         
         mock_supabase_client.storage.from_.return_value.remove.assert_called_once_with(['test.jpg'])
 
-    def test_delete_exception_handling(self, storage_instance, mock_supabase_client):
-        """Test delete with exception (should pass silently)."""
+    def test_delete_exception_handling(self, storage_instance, mock_supabase_client, caplog):
+        """Test delete with exception (should not raise, but is logged)."""
         mock_supabase_client.storage.from_.return_value.remove.side_effect = Exception("API error")
         
         # Should not raise exception
         storage_instance.delete('test.jpg')
+        
+        assert 'Failed to delete test.jpg' in caplog.text
+
+    def test_delete_many_single_request(self, storage_instance, mock_supabase_client):
+        """Test deleting several files with one remove call."""
+        storage_instance.delete_many(['a.jpg', 'b.png'])
+        
+        mock_supabase_client.storage.from_.return_value.remove.assert_called_once_with(['a.jpg', 'b.png'])
+
+    def test_delete_many_exception_handling(self, storage_instance, mock_supabase_client):
+        """Test delete_many with exception (should not raise)."""
+        mock_supabase_client.storage.from_.return_value.remove.side_effect = Exception("API error")
+        
+        # Should not raise exception
+        storage_instance.delete_many(['a.jpg'])
 
     # Content Type Tests
     def test_get_content_type_jpg(self, storage_instance):
@@ -222,6 +244,11 @@ class TestSupabaseStorage:
         content_type = storage_instance._get_content_type('test.xyz')
         assert content_type == 'application/octet-stream'
 
+    def test_get_content_type_falls_back_to_mimetypes(self, storage_instance):
+        """Test content type for an extension outside the image map uses the built-in mimetypes table."""
+        content_type = storage_instance._get_content_type('scan.tiff')
+        assert content_type == 'image/tiff'
+
     # Unique Name Generation Tests
     def test_get_unique_name(self, storage_instance):
         """Test unique name generation."""
@@ -234,6 +261,21 @@ class TestSupabaseStorage:
             assert unique_name.startswith('test_12345678')
             assert unique_name.endswith('.jpg')
 
+    # Client Reuse Tests
+    def test_client_shared_between_instances(self, mock_supabase_client):
+        """Test that storage backends and the storage service reuse one Supabase client."""
+        with override_settings(
+            SUPABASE_URL='https://test.supabase.co',
+            SUPABASE_SERVICE_ROLE_KEY='test-key',
+            SUPABASE_BUCKET_NAME='test-bucket'
+        ), patch('app.services.supabase_storage_service.create_client', return_value=mock_supabase_client) as mock_create:
+            first = SupabaseStorage()
+            second = SupabaseStorage()
+            service = SupabaseStorageService()
+
+        assert first.supabase is second.supabase is service.supabase
+        mock_create.assert_called_once_with('https://test.supabase.co', 'test-key')
+
 
 class TestSupabaseStorageService:
     """
@@ -246,10 +288,12 @@ class TestSupabaseStorageService:
     @pytest.fixture
     def mock_supabase_client(self):
         """Create mock Supabase client."""
+        _get_client.cache_clear()
         with patch('app.services.supabase_storage_service.create_client') as mock_create:
             mock_client = Mock()
             mock_create.return_value = mock_client
             yield mock_client
+        _get_client.cache_clear()
 
     @pytest.fixture
     def service_instance(self, mock_supabase_client):
@@ -298,6 +342,35 @@ class TestSupabaseStorageService:
         with pytest.raises(Exception, match="Upload failed: No response received"):
             service_instance.upload_image('/local/test.jpg', 'images/test.jpg')
 
+    # Upload Images Tests
+    def test_upload_images_preserves_order(self, service_instance):
+        """Test batch upload returns one URL per pair, in input order."""
+        pairs = [(f'/local/{i}.jpg', f'images/{i}.jpg') for i in range(5)]
+        
+        with patch.object(service_instance, 'upload_image', side_effect=lambda local, remote: f'url/{remote}') as mock_upload:
+            urls = service_instance.upload_images(pairs, max_workers=3)
+        
+        assert urls == [f'url/images/{i}.jpg' for i in range(5)]
+        assert mock_upload.call_count == 5
+
+    def test_upload_images_empty(self, service_instance):
+        """Test batch upload with no files does nothing."""
+        with patch.object(service_instance, 'upload_image') as mock_upload:
+            assert service_instance.upload_images([]) == []
+        
+        mock_upload.assert_not_called()
+
+    def test_upload_images_failure_propagates(self, service_instance):
+        """Test batch upload raises when any upload fails."""
+        def upload(local, remote):
+            if remote == 'images/bad.jpg':
+                raise Exception("Failed to upload image: boom")
+            return f'url/{remote}'
+        
+        with patch.object(service_instance, 'upload_image', side_effect=upload):
+            with pytest.raises(Exception, match="Failed to upload image: boom"):
+                service_instance.upload_images([('/a.jpg', 'images/a.jpg'), ('/bad.jpg', 'images/bad.jpg')])
+
     # Get Public URL Tests
     def test_get_public_url(self, service_instance):
         """Test public URL generation."""
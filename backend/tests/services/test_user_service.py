@@ -2,6 +2,8 @@
 from unittest.mock import Mock, patch
 import pytest
 from django.utils import timezone
+from django.contrib.auth.hashers import check_password
+from django.db import IntegrityError
 from rest_framework.authtoken.models import Token
 from app.services.user_service import UserService
 from app.models.user import User
@@ -93,7 +95,7 @@ class TestUserService:
     def test_create_user_with_verification_success(self, mock_user_objects):
         """Test successful user creation with verification."""
         # Mock no existing users
-        mock_user_objects.filter.return_value.exists.return_value = False
+        mock_user_objects.filter.return_value.aggregate.return_value = {'email': 0, 'username': 0}
         
         # Mock user creation
         mock_user = Mock(spec=User)
@@ -106,11 +108,44 @@ class TestUserService:
         assert user == mock_user
         assert isinstance(code, str)
         assert len(code) == 6
+        
+        # The hashed code is stored by the INSERT itself, with no follow-up UPDATE
+        create_kwargs = mock_user_objects.create_user.call_args.kwargs
+        assert create_kwargs['email_verification_code_hash']
+        assert create_kwargs['email_verification_code_hash'] != code
+        mock_user.save.assert_not_called()
 
     @patch('app.services.user_service.User.objects')
     def test_create_user_with_verification_email_exists(self, mock_user_objects):
         """Test user creation when email already exists."""
-        mock_user_objects.filter.return_value.exists.side_effect = [True, False]
+        mock_user_objects.filter.return_value.aggregate.return_value = {'email': 1, 'username': 0}
+        
+        with pytest.raises(ValueError, match="A user with this email already exists"):
+            UserService.create_user_with_verification(
+                'testuser', 'test@example.com', 'password123', 'Test', 'User'
+            )
+
+    @patch('app.services.user_service.User.objects')
+    def test_create_user_with_verification_username_exists(self, mock_user_objects):
+        """Test user creation when username already exists, checked in the same query as the email."""
+        mock_user_objects.filter.return_value.aggregate.return_value = {'email': 0, 'username': 1}
+        
+        with pytest.raises(ValueError, match="A user with this username already exists"):
+            UserService.create_user_with_verification(
+                'testuser', 'test@example.com', 'password123', 'Test', 'User'
+            )
+        
+        mock_user_objects.filter.assert_called_once()
+        mock_user_objects.create_user.assert_not_called()
+
+    @patch('app.services.user_service.User.objects')
+    def test_create_user_with_verification_concurrent_signup(self, mock_user_objects):
+        """Test a unique constraint violation from a concurrent signup is reported as the taken field."""
+        mock_user_objects.filter.return_value.aggregate.side_effect = [
+            {'email': 0, 'username': 0},
+            {'email': 1, 'username': 0}
+        ]
+        mock_user_objects.create_user.side_effect = IntegrityError("duplicate key value violates unique constraint")
         
         with pytest.raises(ValueError, match="A user with this email already exists"):
             UserService.create_user_with_verification(
@@ -118,25 +153,54 @@ class TestUserService:
             )
 
     # Email Verification Tests
+    @patch('app.services.user_service.AdminService.invalidate_cache')
     @patch('app.services.user_service.User.objects')
     @patch('app.services.user_service.Token')
-    def test_verify_email_success(self, mock_token_class, mock_user_objects, mock_user):
+    def test_verify_email_success(self, mock_token_class, mock_user_objects, mock_invalidate, mock_user):
         """Test successful email verification."""
         mock_user.is_email_verified = False
         mock_user.verification_code_expires_at = timezone.now() + timedelta(minutes=5)
         mock_user.check_verification_code.return_value = True
-        mock_user_objects.get.return_value = mock_user
+        mock_user.auth_token = None
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
+        mock_user_objects.filter.return_value.update.return_value = 1
         
         # Mock token creation
         mock_token = Mock()
         mock_token.key = 'new-token'
-        mock_token_class.objects.get_or_create.return_value = (mock_token, True)
+        mock_token_class.objects.create.return_value = mock_token
         
         result = UserService.verify_email('test@example.com', '123456')
         
         assert result['success'] is True
         assert result['user'] == mock_user
         assert result['token'] == 'new-token'
+        mock_user_objects.select_related.assert_called_once_with('auth_token')
+        mock_token_class.objects.create.assert_called_once_with(user=mock_user)
+        mock_user_objects.filter.assert_called_once_with(pk=mock_user.pk, is_email_verified=False)
+        mock_user.save.assert_not_called()
+        assert mock_user.is_email_verified is True
+        assert mock_user.is_active is True
+        mock_invalidate.assert_called_once_with()
+
+    @patch('app.services.user_service.AdminService.invalidate_cache')
+    @patch('app.services.user_service.User.objects')
+    @patch('app.services.user_service.Token')
+    def test_verify_email_concurrent_verification(self, mock_token_class, mock_user_objects, mock_invalidate,
+                                                  mock_user):
+        """Test a verification that loses the race to another one creates no token."""
+        mock_user.is_email_verified = False
+        mock_user.verification_code_expires_at = timezone.now() + timedelta(minutes=5)
+        mock_user.check_verification_code.return_value = True
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
+        mock_user_objects.filter.return_value.update.return_value = 0
+        
+        result = UserService.verify_email('test@example.com', '123456')
+        
+        assert result['success'] is False
+        assert result['error'] == 'Email is already verified'
+        mock_token_class.objects.create.assert_not_called()
+        mock_invalidate.assert_not_called()
 
     @patch('app.services.user_service.User.objects')
     def test_verify_email_invalid_code(self, mock_user_objects, mock_user):
@@ -144,17 +208,44 @@ class TestUserService:
         mock_user.is_email_verified = False
         mock_user.verification_code_expires_at = timezone.now() + timedelta(minutes=5)
         mock_user.check_verification_code.return_value = False
-        mock_user_objects.get.return_value = mock_user
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
         
         result = UserService.verify_email('test@example.com', '123456')
         
         assert result['success'] is False
         assert result['error'] == 'Invalid verification code'
 
+    @patch('app.services.user_service.cache')
+    @patch('app.services.user_service.User.objects')
+    def test_verify_email_invalid_code_counts_attempt(self, mock_user_objects, mock_cache, mock_user):
+        """Test a wrong code is counted towards the verification attempt limit."""
+        mock_cache.get.return_value = 0
+        mock_user.is_email_verified = False
+        mock_user.verification_code_expires_at = timezone.now() + timedelta(minutes=5)
+        mock_user.check_verification_code.return_value = False
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
+        
+        UserService.verify_email('Test@Example.com', '000000')
+        
+        mock_cache.add.assert_called_once_with('verification_attempts:test@example.com', 0, timeout=UserService.VERIFICATION_ATTEMPT_WINDOW)
+        mock_cache.incr.assert_called_once_with('verification_attempts:test@example.com')
+
+    @patch('app.services.user_service.cache')
+    @patch('app.services.user_service.User.objects')
+    def test_verify_email_too_many_attempts(self, mock_user_objects, mock_cache):
+        """Test verification is refused without a lookup once the attempt limit is reached."""
+        mock_cache.get.return_value = UserService.VERIFICATION_MAX_ATTEMPTS
+        
+        result = UserService.verify_email('test@example.com', '123456')
+        
+        assert result['success'] is False
+        assert 'Too many verification attempts' in result['error']
+        mock_user_objects.select_related.assert_not_called()
+
     @patch('app.services.user_service.User.objects')
     def test_verify_email_user_not_found(self, mock_user_objects):
         """Test email verification with non-existent user."""
-        mock_user_objects.get.side_effect = User.DoesNotExist()
+        mock_user_objects.select_related.return_value.get.side_effect = User.DoesNotExist()
         
         result = UserService.verify_email('nonexistent@example.com', '123456')
         
@@ -169,13 +260,13 @@ class TestUserService:
         mock_user.is_email_verified = True
         mock_user.is_active = True
         mock_user.check_password.return_value = True
-        mock_user_objects.get.return_value = mock_user
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
         
         # Mock token creation
         mock_token = Mock()
         mock_token.key = 'auth-token'
         mock_token.created = timezone.now() - timedelta(hours=1)
-        mock_token_class.objects.get_or_create.return_value = (mock_token, False)
+        mock_user.auth_token = mock_token
         
         # Mock token validation
         with patch.object(UserService, 'is_token_valid', return_value=True):
@@ -184,18 +275,61 @@ class TestUserService:
                 
                 assert user == mock_user
                 assert token == 'auth-token'
+        
+        # The token was loaded with the user, so no separate token query is made
+        mock_user_objects.select_related.assert_called_once_with('auth_token')
+        mock_token_class.objects.get_or_create.assert_not_called()
+        mock_token_class.objects.create.assert_not_called()
+
+    @patch('app.services.user_service.User.objects')
+    @patch('app.services.user_service.Token')
+    def test_authenticate_user_without_token(self, mock_token_class, mock_user_objects, mock_user):
+        """Test authentication creates a token when the user has none."""
+        mock_user.check_password.return_value = True
+        mock_user.auth_token = None
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
+        mock_token_class.objects.create.return_value.key = 'new-token'
+        
+        user, token = UserService.authenticate_user('test@example.com', 'password123')
+        
+        assert user == mock_user
+        assert token == 'new-token'
+        mock_token_class.objects.create.assert_called_once_with(user=mock_user)
 
     @patch('app.services.user_service.User.objects')
     def test_authenticate_user_wrong_password(self, mock_user_objects, mock_user):
         """Test authentication with wrong password."""
         mock_user.check_password.return_value = False
-        mock_user_objects.get.return_value = mock_user
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
         
         user, token = UserService.authenticate_user('test@example.com', 'wrongpassword')
         
         assert user is None
         assert token is None
 
+    @patch('app.services.user_service.User.objects')
+    def test_authenticate_user_unknown_email_hashes_password(self, mock_user_objects):
+        """Test an unknown email still runs the password hasher, so it cannot be told apart by timing."""
+        mock_user_objects.select_related.return_value.get.side_effect = User.DoesNotExist()
+        
+        with patch.object(User, 'set_password') as mock_set_password:
+            user, token = UserService.authenticate_user('nobody@example.com', 'password123')
+        
+        assert user is None
+        assert token is None
+        mock_set_password.assert_called_once_with('password123')
+
+    @patch('app.services.user_service.User.objects')
+    def test_authenticate_user_unverified_checks_password(self, mock_user_objects, mock_user):
+        """Test an unverified account is rejected only after the password is hashed."""
+        mock_user.is_email_verified = False
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
+        
+        user, token = UserService.authenticate_user('test@example.com', 'password123')
+        
+        assert user is None
+        mock_user.check_password.assert_called_once_with('password123')
+
     # Logout Tests
     @patch('app.services.user_service.Token')
     def test_logout_user_success(self, mock_token_class, mock_user):
@@ -224,11 +358,21 @@ class TestUserService:
         
         assert user is None
 
+    @patch('app.services.user_service.User.objects')
+    def test_get_user_by_id_skips_credential_hashes(self, mock_user_objects, mock_user):
+        """Test user retrieval by id does not load the password or verification hashes."""
+        mock_user_objects.defer.return_value.get.return_value = mock_user
+        
+        user = UserService.get_user_by_id(str(mock_user.id))
+        
+        assert user == mock_user
+        mock_user_objects.defer.assert_called_once_with('password', 'email_verification_code_hash')
+
     # Update Profile Tests
     @patch('app.services.user_service.User.objects')
     def test_update_user_profile_success(self, mock_user_objects, mock_user):
         """Test successful user profile update."""
-        mock_user_objects.get.return_value = mock_user
+        mock_user_objects.defer.return_value.get.return_value = mock_user
         
         update_data = {'first_name': 'Updated', 'last_name': 'Name'}
         
@@ -236,13 +380,15 @@ class TestUserService:
         
         assert result['user'] == mock_user
         assert result['email_changed'] is False
+        # Neither email nor username changed, so no duplicate check is needed
+        mock_user_objects.filter.assert_not_called()
 
     @patch('app.services.user_service.User.objects')
     def test_update_user_profile_email_change(self, mock_user_objects, mock_user):
         """Test user profile update with email change."""
         mock_user.email = 'old@example.com'
-        mock_user_objects.get.return_value = mock_user
-        mock_user_objects.filter.return_value.exists.return_value = False
+        mock_user_objects.defer.return_value.get.return_value = mock_user
+        mock_user_objects.filter.return_value.aggregate.return_value = {'email': 0}
         
         update_data = {'email': 'new@example.com'}
         
@@ -250,6 +396,44 @@ class TestUserService:
         
         assert result['email_changed'] is True
         assert 'verification_code' in result
+        
+        # The re-verification state is saved along with the new email
+        saved_fields = mock_user.save.call_args.kwargs['update_fields']
+        assert set(saved_fields) == {
+            'email', 'is_email_verified', 'is_active', 'email_verification_code_hash', 'verification_code_expires_at'
+        }
+        assert mock_user.is_email_verified is False
+        assert mock_user.is_active is False
+
+    @patch('app.services.user_service.User.objects')
+    def test_update_user_profile_ignores_protected_fields(self, mock_user_objects, mock_user):
+        """Test fields outside the profile whitelist cannot be changed, even alongside an email change."""
+        mock_user.email = 'old@example.com'
+        mock_user.is_staff = False
+        mock_user_objects.defer.return_value.get.return_value = mock_user
+        mock_user_objects.filter.return_value.aggregate.return_value = {'email': 0}
+        
+        update_data = {'email': 'new@example.com', 'is_email_verified': True, 'is_active': True, 'is_staff': True}
+        
+        UserService.update_user_profile(str(mock_user.id), update_data)
+        
+        assert mock_user.is_email_verified is False
+        assert mock_user.is_active is False
+        assert mock_user.is_staff is False
+
+    @patch('app.services.user_service.User.objects')
+    def test_update_user_profile_duplicate_username(self, mock_user_objects, mock_user):
+        """Test email and username are checked for duplicates in a single query."""
+        mock_user.email = 'old@example.com'
+        mock_user.username = 'olduser'
+        mock_user_objects.defer.return_value.get.return_value = mock_user
+        mock_user_objects.filter.return_value.aggregate.return_value = {'email': 0, 'username': 1}
+        
+        with pytest.raises(ValueError, match="A user with this username already exists"):
+            UserService.update_user_profile(str(mock_user.id), {'email': 'new@example.com', 'username': 'taken'})
+        
+        mock_user_objects.filter.assert_called_once()
+        mock_user.save.assert_not_called()
 
     # Change Password Tests
     @patch('app.services.user_service.User.objects')
@@ -257,22 +441,48 @@ class TestUserService:
     def test_change_password_success(self, mock_token_class, mock_user_objects, mock_user):
         """Test successful password change."""
         mock_user.check_password.return_value = True
-        mock_user_objects.get.return_value = mock_user
+        mock_user_objects.only.return_value.get.return_value = mock_user
         
         result = UserService.change_password(str(mock_user.id), 'oldpassword', 'newpassword')
         
         assert result is True
-        mock_user.set_password.assert_called_once_with('newpassword')
+        mock_user_objects.only.assert_called_once_with('id', 'email', 'password')
+        mock_user_objects.filter.assert_called_once_with(pk=mock_user.pk)
+        new_hash = mock_user_objects.filter.return_value.update.call_args.kwargs['password']
+        assert check_password('newpassword', new_hash)
+        mock_user.save.assert_not_called()
+        mock_token_class.objects.filter.return_value.delete.assert_called_once()
 
     @patch('app.services.user_service.User.objects')
     def test_change_password_wrong_current(self, mock_user_objects, mock_user):
         """Test password change with wrong current password."""
         mock_user.check_password.return_value = False
-        mock_user_objects.get.return_value = mock_user
+        mock_user_objects.only.return_value.get.return_value = mock_user
         
         with pytest.raises(ValueError, match="Current password is incorrect"):
             UserService.change_password(str(mock_user.id), 'wrongpassword', 'newpassword')
 
+    # Delete User Tests
+    @patch('app.services.user_service.User.objects')
+    def test_delete_user_success(self, mock_user_objects, mock_user):
+        """Test deleting an existing user with a single queryset delete."""
+        mock_user_objects.filter.return_value.delete.return_value = (3, {'app.User': 1, 'authtoken.Token': 2})
+        
+        result = UserService.delete_user(str(mock_user.id))
+        
+        assert result is True
+        mock_user_objects.filter.assert_called_once_with(id=str(mock_user.id))
+        mock_user_objects.get.assert_not_called()
+
+    @patch('app.services.user_service.User.objects')
+    def test_delete_user_not_found(self, mock_user_objects):
+        """Test deleting a user that does not exist."""
+        mock_user_objects.filter.return_value.delete.return_value = (0, {})
+        
+        result = UserService.delete_user(str(uuid.uuid4()))
+        
+        assert result is False
+
     # Token Validation Tests
     @patch('app.services.user_service.Token')
     def test_validate_user_token_success(self, mock_token_class, mock_user):
@@ -301,6 +511,23 @@ class TestUserService:
         assert result['success'] is True
         assert 'verification_code' in result
 
+    @patch('app.services.user_service.User.objects')
+    def test_resend_verification_code_resets_attempts(self, mock_user_objects, mock_user):
+        """Test a new verification code can be tried again after the old one reached the attempt limit."""
+        mock_user.is_email_verified = False
+        mock_user.verification_code_expires_at = None
+        mock_user.check_verification_code.return_value = False
+        mock_user_objects.get.return_value = mock_user
+        mock_user_objects.select_related.return_value.get.return_value = mock_user
+
+        for _ in range(UserService.VERIFICATION_MAX_ATTEMPTS):
+            UserService.verify_email('Locked@example.com', '000000')
+        assert UserService.verify_email('locked@example.com', '000000')['error'].startswith('Too many')
+
+        UserService.resend_verification_code('locked@example.com')
+
+        assert UserService.verify_email('locked@example.com', '000000')['error'] == 'Invalid verification code'
+
     @patch('app.services.user_service.User.objects')
     def test_resend_verification_code_already_verified(self, mock_user_objects, mock_user):
         """Test resend verification code when already verified."""
@@ -0,0 +1,64 @@
+# type: ignore
+from unittest.mock import Mock, patch
+from django.apps import apps
+import pytest
+from app.apps import CoreAppConfig, _is_serving
+
+class TestCoreAppConfig:
+    """
+    Unit tests for the application start-up warm-up.
+
+    :author: Siyabonga Madondo, Ethan Ngwetjana, Lindokuhle Mdlalose
+    :version: 16/10/2026
+    """
+
+    @pytest.mark.parametrize("argv, run_main, expected", [
+        (['/usr/local/bin/gunicorn', 'config.wsgi'], None, True),
+        (['manage.py', 'runserver'], 'true', True),
+        (['manage.py', 'runserver'], None, False),
+        (['manage.py', 'runserver', '--noreload'], None, True),
+        (['manage.py', 'migrate'], None, False),
+        (['pytest'], None, False),
+    ])
+    def test_is_serving(self, monkeypatch, argv, run_main, expected):
+        """Test only gunicorn workers and runserver's serving process count as serving."""
+        monkeypatch.setattr('sys.argv', argv)
+        if run_main is None:
+            monkeypatch.delenv('RUN_MAIN', raising=False)
+        else:
+            monkeypatch.setenv('RUN_MAIN', run_main)
+
+        assert _is_serving() is expected
+
+    @pytest.mark.parametrize("serving", [True, False])
+    @patch('app.apps.Thread')
+    def test_ready_warms_up_analysis_only_when_serving(self, mock_thread, serving):
+        """Test the analysis warm-up runs in a background thread in server processes only."""
+        config = apps.get_app_config('app')
+
+        with patch('app.apps._is_serving', return_value=serving):
+            config.ready()
+
+        if serving:
+            mock_thread.assert_called_once_with(target=config.warm_up_analysis, name='analysis-warm-up', daemon=True)
+            mock_thread.return_value.start.assert_called_once()
+        else:
+            mock_thread.assert_not_called()
+
+    @patch('django.db.connections')
+    @patch('app.services.admin_service.AdminService.get_system_statistics')
+    @patch('app.views.analysis_views._get_image_analyser')
+    @patch('app.views.analysis_views._get_text_analyser')
+    def test_warm_up_analysis_continues_after_failure(self, mock_text, mock_image, mock_statistics, mock_connections):
+        """Test a failed step is logged and the remaining steps still run."""
+        mock_text.return_value.long_text_model.is_loaded.return_value = False
+        mock_text.return_value.short_text_model.is_loaded.return_value = True
+        mock_image.side_effect = RuntimeError("Model file missing")
+        mock_image.__name__ = '_get_image_analyser'
+
+        CoreAppConfig.warm_up_analysis()
+
+        mock_text.return_value.long_text_model.load.assert_called_once()
+        mock_text.return_value.short_text_model.load.assert_not_called()
+        mock_statistics.assert_called_once()
+        mock_connections.close_all.assert_called_once()
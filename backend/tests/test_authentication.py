@@ -0,0 +1,106 @@
+# type: ignore
+from unittest.mock import Mock, patch
+import pytest
+from django.db import transaction
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+from app.authentication import CachedTokenAuthentication, TOKEN_CACHE_TIMEOUT, token_cache_key
+from app.signals import invalidate_cached_token, invalidate_cached_tokens_for_user
+
+class TestCachedTokenAuthentication:
+    """
+    Unit tests for the cached token authentication class and its invalidation signals.
+
+    :author: Siyabonga Madondo, Ethan Ngwetjana, Lindokuhle Mdlalose
+    :version: 16/10/2026
+    """
+
+    @pytest.fixture
+    def authentication(self):
+        """Create an authentication instance."""
+        return CachedTokenAuthentication()
+
+    @patch('app.authentication.cache')
+    def test_authenticate_credentials_cache_hit(self, mock_cache, authentication):
+        """Test a cached token is authenticated without querying the database."""
+        credentials = (Mock(), Mock())
+        mock_cache.get.return_value = credentials
+
+        with patch.object(TokenAuthentication, 'authenticate_credentials') as mock_lookup:
+            result = authentication.authenticate_credentials('abc123')
+
+        assert result == credentials
+        mock_cache.get.assert_called_once_with(token_cache_key('abc123'))
+        mock_lookup.assert_not_called()
+
+    @patch('app.authentication.cache')
+    def test_authenticate_credentials_cache_miss(self, mock_cache, authentication):
+        """Test a token lookup is cached after a miss."""
+        credentials = (Mock(), Mock())
+        mock_cache.get.return_value = None
+
+        with patch.object(TokenAuthentication, 'authenticate_credentials', return_value=credentials) as mock_lookup:
+            result = authentication.authenticate_credentials('abc123')
+
+        assert result == credentials
+        mock_lookup.assert_called_once_with('abc123')
+        mock_cache.set.assert_called_once_with(token_cache_key('abc123'), credentials, TOKEN_CACHE_TIMEOUT)
+
+    @patch('app.authentication.cache')
+    def test_authenticate_credentials_invalid_token_not_cached(self, mock_cache, authentication):
+        """Test a failed lookup raises and is not cached."""
+        mock_cache.get.return_value = None
+
+        with patch.object(TokenAuthentication, 'authenticate_credentials', side_effect=AuthenticationFailed('Invalid token.')):
+            with pytest.raises(AuthenticationFailed):
+                authentication.authenticate_credentials('bad')
+
+        mock_cache.set.assert_not_called()
+
+    @patch('app.signals.cache')
+    def test_token_delete_invalidates_cache(self, mock_cache):
+        """Test deleting a token drops its cached authentication once the deletion commits."""
+        with transaction.atomic():
+            invalidate_cached_token(sender=Mock(), instance=Mock(key='abc123'))
+
+            mock_cache.delete.assert_not_called()
+
+        mock_cache.delete.assert_called_once_with(token_cache_key('abc123'))
+
+    @patch('app.signals.cache')
+    def test_token_delete_rolled_back_keeps_cache(self, mock_cache):
+        """Test a token deletion that rolls back leaves its cached authentication in place."""
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                invalidate_cached_token(sender=Mock(), instance=Mock(key='abc123'))
+                raise RuntimeError("Password change failed")
+
+        mock_cache.delete.assert_not_called()
+
+    @patch('app.signals.apps.is_installed', return_value=True)
+    @patch('app.signals.Token')
+    @patch('app.signals.cache')
+    def test_user_save_invalidates_cached_tokens(self, mock_cache, mock_token_class, mock_is_installed):
+        """Test saving a user drops the cached authentication for their tokens once the save commits."""
+        mock_token_class.objects.filter.return_value.values_list.return_value = ['abc123']
+        user = Mock(pk='user-id')
+
+        with transaction.atomic():
+            invalidate_cached_tokens_for_user(sender=Mock(), instance=user, created=False, update_fields=None)
+
+            mock_cache.delete_many.assert_not_called()
+
+        mock_token_class.objects.filter.assert_called_once_with(user_id='user-id')
+        mock_cache.delete_many.assert_called_once_with([token_cache_key('abc123')])
+
+    @patch('app.signals.apps.is_installed', return_value=True)
+    @patch('app.signals.Token')
+    @patch('app.signals.cache')
+    def test_user_login_timestamp_keeps_cached_tokens(self, mock_cache, mock_token_class, mock_is_installed):
+        """Test the login timestamp update leaves cached authentication in place."""
+        invalidate_cached_tokens_for_user(
+            sender=Mock(), instance=Mock(), created=False, update_fields=frozenset({'last_login'})
+        )
+
+        mock_token_class.objects.filter.assert_not_called()
+        mock_cache.delete_many.assert_not_called()
@@ -0,0 +1,46 @@
+# type: ignore
+from datetime import datetime, date, timezone as dt_timezone
+from decimal import Decimal
+import uuid
+import pytest
+from rest_framework.renderers import JSONRenderer
+from app.renderers import ORJSONRenderer
+
+class TestORJSONRenderer:
+    """
+    Unit tests for the orjson-backed JSON renderer.
+
+    :author: Siyabonga Madondo, Ethan Ngwetjana, Lindokuhle Mdlalose
+    :version: 16/10/2026
+    """
+
+    @pytest.fixture
+    def payload(self):
+        """Create a response payload mixing the types views return."""
+        return {
+            'success': True,
+            'message': 'Café   report',
+            'data': {
+                'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+                'created_at': datetime(2026, 10, 16, 12, 30, 45, 123456, tzinfo=dt_timezone.utc),
+                'day': date(2026, 10, 16),
+                'probability': Decimal('0.95'),
+                'counts': {1: 'one'},
+                'items': [1, 2.5, None, 'text'],
+            },
+            'error': None,
+        }
+
+    def test_render_matches_drf_json_renderer(self, payload):
+        """Test orjson output is byte-for-byte identical to DRF's JSONRenderer."""
+        assert ORJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+    def test_render_none(self):
+        """Test empty responses render to an empty body."""
+        assert ORJSONRenderer().render(None) == b''
+
+    def test_render_indented_uses_drf(self, payload):
+        """Test an explicitly requested indent is honoured."""
+        rendered = ORJSONRenderer().render(payload, 'application/json; indent=2', {})
+        
+        assert rendered == JSONRenderer().render(payload, 'application/json; indent=2', {})
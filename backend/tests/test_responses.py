@@ -0,0 +1,37 @@
+# type: ignore
+from unittest.mock import patch
+from rest_framework import status
+from app.utils.responses import create_json_response
+
+class TestCreateJsonResponse:
+    """
+    Unit tests for the shared JSON response helper.
+
+    :author: Siyabonga Madondo, Ethan Ngwetjana, Lindokuhle Mdlalose
+    :version: 16/10/2026
+    """
+
+    def test_omits_none_fields(self):
+        """Test message, data and error are left out when they are None."""
+        response = create_json_response(success=False, error='Test error', status_code=status.HTTP_400_BAD_REQUEST)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data) == ['success', 'error', 'timestamp']
+
+    def test_field_order_with_kwargs(self):
+        """Test additional fields come after the data and before the error."""
+        response = create_json_response(message='Test', data={'key': 'value'}, error='Partial', extra=True)
+
+        assert list(response.data) == ['success', 'message', 'data', 'extra', 'error', 'timestamp']
+
+    @patch('app.utils.responses.time.time')
+    def test_timestamp_shared_within_a_second(self, mock_time):
+        """Test responses in the same second share a timestamp and a new second gets a new one."""
+        mock_time.side_effect = [1_800_000_000.1, 1_800_000_000.9, 1_800_000_001.2]
+
+        first = create_json_response().data['timestamp']
+        second = create_json_response().data['timestamp']
+        third = create_json_response().data['timestamp']
+
+        assert first is second
+        assert third != first
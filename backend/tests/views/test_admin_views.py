@@ -3,7 +3,10 @@ from unittest.mock import Mock, patch
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, force_authenticate
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from datetime import datetime
+import json
+import threading
 from app.views.admin_views import (
     get_system_statistics,
     get_recent_activity,
@@ -11,6 +14,7 @@ from app.views.admin_views import (
     get_admin_dashboard_data,
     create_json_response
 )
+from app.services.admin_service import AdminService
 import pytest
 import uuid
 
@@ -24,6 +28,13 @@ class TestAdminViews:
     :version: 16/09/2025
     """
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """
+        Start every test with an empty cache, so cached admin responses do not leak between tests.
+        """
+        cache.clear()
+
     @pytest.fixture
     def mock_admin_user(self):
         """
@@ -145,7 +156,7 @@ class TestAdminViews:
             assert response.data['success'] is True
             assert response.data['message'] == 'Test message'
             assert response.data['data'] == data
-            assert response.data['error'] is None
+            assert 'error' not in response.data
             assert 'timestamp' in response.data
             assert isinstance(response.data['timestamp'], str)
 
@@ -167,8 +178,8 @@ class TestAdminViews:
         if response.data is not None:
             assert response.data['success'] is False
             assert response.data['error'] == 'Test error'
-            assert response.data['data'] is None
-            assert response.data['message'] is None
+            assert 'data' not in response.data
+            assert 'message' not in response.data
             assert 'timestamp' in response.data
             assert isinstance(response.data['timestamp'], str)
 
@@ -185,9 +196,9 @@ class TestAdminViews:
         # Must check since the data field is optional
         if response.data is not None:
             assert response.data['success'] is True
-            assert response.data['message'] is None
-            assert response.data['data'] is None
-            assert response.data['error'] is None
+            assert 'message' not in response.data
+            assert 'data' not in response.data
+            assert 'error' not in response.data
 
     @patch('app.views.admin_views.AdminService.get_system_statistics')
     def test_get_system_statistics_successful_response(self, mock_service, api_factory, mock_admin_user, mock_statistics_data):
@@ -212,7 +223,7 @@ class TestAdminViews:
         assert response.data['success'] is True                                       
         assert response.data['message'] == 'System statistics retrieved successfully'   
         assert response.data['data'] == mock_statistics_data                            
-        assert response.data['error'] is None                                           
+        assert 'error' not in response.data                                           
 
         mock_service.assert_called_once()
 
@@ -238,7 +249,7 @@ class TestAdminViews:
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR                                                                    # type: ignore
         assert response.data['success'] is False                                                        # type: ignore
         assert response.data['error'] == 'Database connection timeout while fetching user statistics'   # type: ignore
-        assert response.data['data'] is None                                                            # type: ignore
+        assert 'data' not in response.data                                                            # type: ignore
 
     @patch('app.views.admin_views.AdminService.get_system_statistics')
     def test_get_system_statistics_exception(self, mock_service, api_factory, mock_admin_user):
@@ -426,6 +437,181 @@ class TestAdminViews:
         assert 'Statistics error: Stats error' in response.data['error']
         assert 'Activity error: Activity error' in response.data['error']
 
+    @patch('app.views.admin_views.AdminService.get_recent_activity')
+    @patch('app.views.admin_views.AdminService.get_system_statistics')
+    def test_get_admin_dashboard_data_runs_queries_concurrently(self, mock_stats, mock_activity, api_factory, mock_admin_user):
+        """
+        Test dashboard statistics and activity are fetched at the same time.
+        """
+        # Each call waits for the other, so the view only completes if both run concurrently.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def stats():
+            barrier.wait()
+            return {'success': True, 'statistics': {}}
+
+        def activity():
+            barrier.wait()
+            return {'success': True, 'activities': []}
+
+        mock_stats.side_effect = stats
+        mock_activity.side_effect = activity
+
+        # Create authenticated request.
+        request = api_factory.get('/api/admin/dashboard/')
+        force_authenticate(request, user=mock_admin_user)
+
+        # Call view.
+        response = get_admin_dashboard_data(request)
+
+        # Assert that the fields are valid.
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['success'] is True
+
+    @patch('app.views.admin_views.AdminService.get_recent_activity')
+    @patch('app.views.admin_views.AdminService.get_system_statistics')
+    def test_get_admin_dashboard_data_service_exception(self, mock_stats, mock_activity, api_factory, mock_admin_user):
+        """
+        Test an exception raised in a worker thread is returned as a server error.
+        """
+        mock_stats.side_effect = Exception('Database error')
+        mock_activity.return_value = {'success': True, 'activities': []}
+
+        # Create authenticated request.
+        request = api_factory.get('/api/admin/dashboard/')
+        force_authenticate(request, user=mock_admin_user)
+
+        # Call view.
+        response = get_admin_dashboard_data(request)
+
+        # Assert that the fields are valid.
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert response.data['error'] == 'Database error'
+
+    @patch('app.services.admin_service.time')
+    @patch('app.views.admin_views.AdminService.get_system_statistics')
+    def test_get_system_statistics_not_modified(self, mock_service, mock_time, api_factory, mock_admin_user, mock_statistics_data):
+        """
+        Test a request repeating the ETag of unchanged statistics gets an empty 304 without querying them.
+        """
+        mock_time.time.return_value = 1000.0
+        mock_service.return_value = {'success': True, 'statistics': mock_statistics_data}
+
+        request = api_factory.get('/api/admin/statistics/')
+        force_authenticate(request, user=mock_admin_user)
+        response = get_system_statistics(request)
+        etag = response['ETag']
+
+        request = api_factory.get('/api/admin/statistics/', HTTP_IF_NONE_MATCH=etag)
+        force_authenticate(request, user=mock_admin_user)
+        not_modified = get_system_statistics(request)
+
+        assert etag.startswith('W/"')
+        assert 'no-cache' in response['Cache-Control'] and 'private' in response['Cache-Control']
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b''
+        assert not_modified['ETag'] == etag
+        mock_service.assert_called_once()
+
+    @patch('app.views.admin_views.AdminService.get_system_statistics')
+    def test_get_system_statistics_etag_changes_on_invalidation(self, mock_service, api_factory, mock_admin_user, mock_statistics_data):
+        """
+        Test invalidating the admin cache makes an earlier ETag stale.
+        """
+        mock_service.return_value = {'success': True, 'statistics': mock_statistics_data}
+
+        request = api_factory.get('/api/admin/statistics/')
+        force_authenticate(request, user=mock_admin_user)
+        etag = get_system_statistics(request)['ETag']
+
+        AdminService.invalidate_cache()
+
+        request = api_factory.get('/api/admin/statistics/', HTTP_IF_NONE_MATCH=etag)
+        force_authenticate(request, user=mock_admin_user)
+        response = get_system_statistics(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    @patch('app.services.admin_service.time')
+    def test_data_etag_expires_with_cached_data(self, mock_time):
+        """
+        Test the ETag changes once the cached data may have expired, even without invalidation.
+        """
+        mock_time.time.return_value = 960.0
+        etag = AdminService.get_data_etag(60)
+
+        mock_time.time.return_value = 1010.0
+        assert AdminService.get_data_etag(60) == etag
+
+        mock_time.time.return_value = 1030.0
+        assert AdminService.get_data_etag(60) != etag
+
+    @patch('app.views.admin_views.AdminService.get_system_statistics')
+    def test_get_system_statistics_failure_has_no_etag(self, mock_service, api_factory, mock_admin_user):
+        """
+        Test failed responses are not given an ETag, so they are never revalidated.
+        """
+        mock_service.return_value = {'success': False, 'error': 'Database error'}
+
+        request = api_factory.get('/api/admin/statistics/')
+        force_authenticate(request, user=mock_admin_user)
+        response = get_system_statistics(request)
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert not response.has_header('ETag')
+
+    @patch('app.services.admin_service.time')
+    @patch('app.views.admin_views.AdminService.get_performance_metrics')
+    def test_get_performance_metrics_reuses_encoded_response(self, mock_service, mock_time, api_factory, mock_admin_user):
+        """
+        Test a repeat request for unchanged data is answered from the cached JSON body without calling the service.
+        """
+        mock_time.time.return_value = 960.0
+        mock_service.return_value = {'success': True, 'metrics': {'period_days': 7}}
+
+        responses = []
+        for _ in range(2):
+            request = api_factory.get('/api/admin/performance/?days=7')
+            force_authenticate(request, user=mock_admin_user)
+            responses.append(get_performance_metrics(request))
+
+        first, second = responses
+        first.render()
+        assert second.status_code == status.HTTP_200_OK
+        assert second['Content-Type'] == 'application/json'
+        assert second.content == first.content
+        assert json.loads(second.content)['data'] == {'period_days': 7}
+        assert second['ETag'] == first['ETag']
+        mock_service.assert_called_once_with(days=7)
+
+    @patch('app.services.admin_service.time')
+    @patch('app.views.admin_views.AdminService.get_performance_metrics')
+    def test_get_performance_metrics_encoded_response_per_query(self, mock_service, mock_time, api_factory, mock_admin_user):
+        """
+        Test cached responses are kept per query string, since the data depends on its parameters.
+        """
+        mock_time.time.return_value = 960.0
+        mock_service.return_value = {'success': True, 'metrics': {}}
+
+        for days in (7, 30):
+            request = api_factory.get(f'/api/admin/performance/?days={days}')
+            force_authenticate(request, user=mock_admin_user)
+            get_performance_metrics(request)
+
+        assert mock_service.call_count == 2
+
+    def test_not_modified_requires_admin(self, api_factory, mock_regular_user):
+        """
+        Test a matching If-None-Match header does not bypass the admin permission check.
+        """
+        request = api_factory.get('/api/admin/statistics/', HTTP_IF_NONE_MATCH='*')
+        force_authenticate(request, user=mock_regular_user)
+
+        response = get_system_statistics(request)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
     def test_admin_views_require_authentication(self, api_factory):
         """
         Test that admin views require authentication.
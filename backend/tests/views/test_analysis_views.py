@@ -4,10 +4,25 @@ from rest_framework import status
 from rest_framework.test import APIRequestFactory, force_authenticate
 from django.core.files.uploadedfile import SimpleUploadedFile
 from datetime import datetime
-from app.views.analysis_views import analyse_text, analyse_image, create_json_response
+from django.test import override_settings
+import os
+from app.views.analysis_views import analyse_text, analyse_image, create_json_response, _get_text_analyser, _get_image_analyser
+from io import BytesIO
+from PIL import Image
 import pytest
 import uuid
 
+
+def make_image_bytes(image_format='JPEG', size=(4, 3)):
+    """Encode a small solid-colour image in the given format. MPO images get a second frame, as camera photos do."""
+    buffer = BytesIO()
+    image = Image.new('RGB', size, color=(200, 30, 30))
+    if image_format == 'MPO':
+        image.save(buffer, image_format, save_all=True, append_images=[Image.new('RGB', size)])
+    else:
+        image.save(buffer, image_format)
+    return buffer.getvalue()
+
 class TestAnalysisViews:
     """
     Unit tests for the Analysis Views (Text and Image).
@@ -16,6 +31,22 @@ class TestAnalysisViews:
     :version: 28/09/2025
     """
 
+    @pytest.fixture(autouse=True)
+    def run_naming_inline(self):
+        """Run background submission naming inline, so its effects can be asserted once the view returns."""
+        with patch('app.views.analysis_views._naming_executor') as mock_executor:
+            mock_executor.submit.side_effect = lambda func, *args: func(*args)
+            yield mock_executor
+
+    @pytest.fixture(autouse=True)
+    def clear_shared_analysers(self):
+        """Drop the shared analysers, so each test builds its own from the patched classes."""
+        _get_text_analyser.cache_clear()
+        _get_image_analyser.cache_clear()
+        yield
+        _get_text_analyser.cache_clear()
+        _get_image_analyser.cache_clear()
+
     @pytest.fixture
     def authenticated_user(self):
         """Create a mock authenticated user."""
@@ -117,7 +148,7 @@ class TestAnalysisViews:
         """Create a valid test image file."""
         return SimpleUploadedFile(
             "image.jpg",
-            b"fake_image_content",
+            make_image_bytes(),
             content_type="image/jpeg"
         )
 
@@ -148,13 +179,44 @@ class TestAnalysisViews:
         assert response.data['data']['analysis_result'] == mock_analysis_result
         assert 'submission' in response.data['data']
 
-        # Verify service calls
-        mock_analyser.analyse.assert_called_once_with(
-            valid_text_data['text'], 
-            user=authenticated_user, 
-            submission=mock_submission
+        # Verify the analysis runs first and its result is saved with the submission
+        mock_analyser.analyse.assert_called_once_with(valid_text_data['text'])
+        mock_analyser.save_result.assert_called_once_with(
+            mock_analysis_result, authenticated_user, mock_submission, valid_text_data['text']
         )
 
+    @patch('app.views.analysis_views.AiTextAnalyser')
+    def test_analyse_text_echo(
+        self, mock_analyser_class, api_factory, anonymous_user, valid_text_data, mock_analysis_result
+    ):
+        """Test the input text is only echoed back with ?echo=1."""
+        mock_analyser_class.return_value.analyse.return_value = mock_analysis_result
+
+        request = api_factory.post('/api/analysis/text/', valid_text_data, format='json')
+        force_authenticate(request, user=anonymous_user)
+        assert 'input_text' not in analyse_text(request).data['data']
+
+        request = api_factory.post('/api/analysis/text/?echo=1', valid_text_data, format='json')
+        force_authenticate(request, user=anonymous_user)
+        assert analyse_text(request).data['data']['input_text'] == valid_text_data['text']
+
+    @patch('app.views.analysis_views.TextSubmission')
+    @patch('app.views.analysis_views.AiTextAnalyser')
+    def test_analyse_text_submission_fields(
+        self, mock_analyser_class, mock_submission_class,
+        api_factory, authenticated_user, valid_text_data, mock_analysis_result, mock_submission
+    ):
+        """Test ?fields= selects the submission fields returned, ignoring unknown names."""
+        mock_analyser_class.return_value.analyse.return_value = mock_analysis_result
+        mock_submission_class.objects.create.return_value = mock_submission
+
+        request = api_factory.post('/api/analysis/text/?fields=id, name,content', valid_text_data, format='json')
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_text(request)
+
+        assert response.data['data']['submission'] == {'id': str(mock_submission.id), 'name': mock_submission.name}
+
     @patch('app.views.analysis_views.AiTextAnalyser')
     def test_analyse_text_success_anonymous_user(
         self, mock_analyser_class,
@@ -179,12 +241,9 @@ class TestAnalysisViews:
         assert response.data['data']['analysis_result'] == mock_analysis_result
         assert 'submission' not in response.data['data']
 
-        # Verify analyser called with None submission
-        mock_analyser.analyse.assert_called_once_with(
-            valid_text_data['text'], 
-            user=anonymous_user, 
-            submission=None
-        )
+        # Verify nothing is saved for anonymous users
+        mock_analyser.analyse.assert_called_once_with(valid_text_data['text'])
+        mock_analyser.save_result.assert_not_called()
 
     def test_analyse_text_missing_text_field(self, api_factory, authenticated_user):
         """Test validation error when text field is missing."""
@@ -238,6 +297,90 @@ class TestAnalysisViews:
         assert response.status_code == status.HTTP_200_OK
         mock_claude_service.create_text_submission_name.assert_called_once_with('Sample text', max_length=50)
 
+    @patch('app.views.analysis_views.ClaudeService')
+    @patch('app.views.analysis_views.TextSubmission')
+    @patch('app.views.analysis_views.AiTextAnalyser')
+    def test_analyse_text_names_submission_in_background(
+        self, mock_analyser_class, mock_submission_class, mock_claude_service_class, run_naming_inline,
+        api_factory, authenticated_user, mock_analysis_result, mock_submission
+    ):
+        """Test a placeholder name is saved and replaced by Claude's name in the background."""
+        mock_analyser_class.return_value.analyse.return_value = mock_analysis_result
+        mock_claude_service_class.return_value.create_text_submission_name.return_value = "AI-Generated Title"
+        mock_submission_class.objects.create.return_value = mock_submission
+
+        request = api_factory.post('/api/analysis/text/', {'text': 'Sample text'}, format='json')
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_text(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_submission_class.objects.create.call_args.kwargs['name'].startswith('Text Analysis ')
+        run_naming_inline.submit.assert_called_once()
+        mock_submission_class.objects.filter.assert_called_once_with(id=mock_submission.id)
+        mock_submission_class.objects.filter.return_value.update.assert_called_once_with(name="AI-Generated Title")
+
+    @patch('app.views.analysis_views.ClaudeService')
+    @patch('app.views.analysis_views.TextSubmission')
+    @patch('app.views.analysis_views.AiTextAnalyser')
+    def test_analyse_text_sync_name(
+        self, mock_analyser_class, mock_submission_class, mock_claude_service_class, run_naming_inline,
+        api_factory, authenticated_user, mock_analysis_result, mock_submission
+    ):
+        """Test ?sync_name=1 saves Claude's name before responding."""
+        mock_analyser_class.return_value.analyse.return_value = mock_analysis_result
+        mock_claude_service_class.return_value.create_text_submission_name.return_value = "AI-Generated Title"
+        mock_submission_class.objects.create.return_value = mock_submission
+
+        request = api_factory.post('/api/analysis/text/?sync_name=1', {'text': 'Sample text'}, format='json')
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_text(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_submission_class.objects.create.call_args.kwargs['name'] == "AI-Generated Title"
+        run_naming_inline.submit.assert_not_called()
+
+    @patch('app.views.analysis_views.ClaudeService')
+    @patch('app.views.analysis_views.TextSubmission')
+    @patch('app.views.analysis_views.AiTextAnalyser')
+    def test_analyse_text_background_naming_failure_keeps_placeholder(
+        self, mock_analyser_class, mock_submission_class, mock_claude_service_class,
+        api_factory, authenticated_user, mock_analysis_result, mock_submission
+    ):
+        """Test a failed background naming leaves the placeholder name in place."""
+        mock_analyser_class.return_value.analyse.return_value = mock_analysis_result
+        mock_claude_service_class.side_effect = ValueError("Anthropic API key is required")
+        mock_submission_class.objects.create.return_value = mock_submission
+
+        request = api_factory.post('/api/analysis/text/', {'text': 'Sample text'}, format='json')
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_text(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_submission_class.objects.filter.return_value.update.assert_not_called()
+
+    @patch('app.views.analysis_views.ClaudeService')
+    @patch('app.views.analysis_views.TextSubmission')
+    @patch('app.views.analysis_views.AiTextAnalyser')
+    def test_analyse_text_failure_skips_background_naming(
+        self, mock_analyser_class, mock_submission_class, mock_claude_service_class, run_naming_inline,
+        api_factory, authenticated_user, mock_submission
+    ):
+        """Test a failed analysis rolls back the submission without scheduling its background naming."""
+        mock_analyser_class.return_value.analyse.side_effect = Exception("Text processing failed")
+        mock_submission_class.objects.create.return_value = mock_submission
+
+        request = api_factory.post('/api/analysis/text/', {'text': 'Sample text'}, format='json')
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_text(request)
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        run_naming_inline.submit.assert_not_called()
+        mock_claude_service_class.assert_not_called()
+
     @patch('app.views.analysis_views.AiTextAnalyser')
     def test_analyse_text_analysis_execution_failure(
         self, mock_analyser_class, api_factory, authenticated_user, valid_text_data
@@ -268,6 +411,20 @@ class TestAnalysisViews:
 
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
 
+    @patch('app.views.analysis_views.AiTextAnalyser')
+    def test_analyse_text_reuses_analyser(self, mock_analyser_class, api_factory, anonymous_user, valid_text_data, mock_analysis_result):
+        """Test the text analyser is built once and shared across requests."""
+        mock_analyser_class.return_value.analyse.return_value = mock_analysis_result
+
+        for _ in range(2):
+            request = api_factory.post('/api/analysis/text/', valid_text_data, format='json')
+            force_authenticate(request, user=anonymous_user)
+            response = analyse_text(request)
+            assert response.status_code == status.HTTP_200_OK
+
+        mock_analyser_class.assert_called_once_with()
+        assert mock_analyser_class.return_value.analyse.call_count == 2
+
     # ===== Image Analysis Tests =====
 
     @patch('app.views.analysis_views.ImageSubmission')
@@ -313,6 +470,37 @@ class TestAnalysisViews:
         assert response.data['data']['analysis_result'] == mock_image_analysis_result
         assert 'submission' in response.data['data']
 
+        # The upload is attached to the submission and stored before the submission and its result are saved.
+        assert mock_submission_class.call_args.kwargs['image'].name == 'image.jpg'
+        mock_image_submission.store_image.assert_called_once_with()
+        mock_image_submission.save.assert_called_once_with()
+        mock_analyser.save_result.assert_called_once_with(
+            mock_image_analysis_result, authenticated_user, mock_image_submission, '/tmp/test_image.jpg'
+        )
+        mock_image_submission.image.delete.assert_not_called()
+
+    @patch('app.views.analysis_views.ImageSubmission')
+    @patch('app.views.analysis_views.AiImageAnalyser')
+    @patch('app.views.analysis_views.AiImageModel')
+    def test_analyse_image_rollback_deletes_stored_image(
+        self, mock_model_class, mock_analyser_class, mock_submission_class,
+        api_factory, authenticated_user, valid_image_file, mock_image_analysis_result, mock_image_submission
+    ):
+        """Test the stored image is deleted when saving the submission rolls back."""
+        mock_analyser_class.return_value.analyse.return_value = mock_image_analysis_result
+        mock_submission_class.return_value = mock_image_submission
+        mock_image_submission.save.side_effect = Exception("Database unavailable")
+
+        request = api_factory.post('/api/analysis/image/', {'image': valid_image_file, 'name': 'Test Image'})
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_image(request)
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        mock_image_submission.store_image.assert_called_once_with()
+        mock_image_submission.image.delete.assert_called_once_with(save=False)
+        mock_analyser_class.return_value.save_result.assert_not_called()
+
     @patch('app.views.analysis_views.AiImageAnalyser')
     @patch('app.views.analysis_views.AiImageModel')
     @patch('tempfile.NamedTemporaryFile')
@@ -347,6 +535,92 @@ class TestAnalysisViews:
         assert response.data['success'] is True
         assert 'submission' not in response.data['data']
 
+    @patch('app.views.analysis_views.AiImageAnalyser')
+    @patch('app.views.analysis_views.AiImageModel')
+    def test_analyse_image_copies_in_memory_upload(
+        self, mock_model_class, mock_analyser_class, api_factory, anonymous_user, valid_image_file, mock_image_analysis_result
+    ):
+        """Test an in-memory upload is copied to a temporary file that is removed afterwards."""
+        analysed = {}
+
+        def analyse(path, **kwargs):
+            with open(path, 'rb') as f:
+                analysed['content'] = f.read()
+            analysed['path'] = path
+            return mock_image_analysis_result
+
+        mock_analyser_class.return_value.analyse.side_effect = analyse
+
+        request = api_factory.post('/api/analysis/image/', {'image': valid_image_file})
+        force_authenticate(request, user=anonymous_user)
+
+        response = analyse_image(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert analysed['content'] == make_image_bytes()
+        assert analysed['path'].endswith('.jpg')
+        assert not os.path.exists(analysed['path'])
+
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=0)
+    @patch('app.views.analysis_views.tempfile.NamedTemporaryFile')
+    @patch('app.views.analysis_views.AiImageAnalyser')
+    @patch('app.views.analysis_views.AiImageModel')
+    def test_analyse_image_reuses_uploaded_temporary_file(
+        self, mock_model_class, mock_analyser_class, mock_temp_file, api_factory, anonymous_user, valid_image_file,
+        mock_image_analysis_result
+    ):
+        """Test an upload Django already wrote to disk is analysed in place without another copy."""
+        analysed = {}
+
+        def analyse(path, **kwargs):
+            with open(path, 'rb') as f:
+                analysed['content'] = f.read()
+            return mock_image_analysis_result
+
+        mock_analyser_class.return_value.analyse.side_effect = analyse
+
+        request = api_factory.post('/api/analysis/image/', {'image': valid_image_file})
+        force_authenticate(request, user=anonymous_user)
+
+        response = analyse_image(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert analysed['content'] == make_image_bytes()
+        mock_temp_file.assert_not_called()
+
+    @patch('app.views.analysis_views.ClaudeService')
+    @patch('app.views.analysis_views.ImageSubmission')
+    @patch('app.views.analysis_views.AiImageAnalyser')
+    @patch('app.views.analysis_views.AiImageModel')
+    def test_analyse_image_names_submission_in_background(
+        self, mock_model_class, mock_analyser_class, mock_submission_class, mock_claude_service_class,
+        api_factory, authenticated_user, valid_image_file, mock_image_analysis_result, mock_image_submission
+    ):
+        """Test the image is handed to the background naming task, which renames the submission and removes it."""
+        named = {}
+
+        def create_image_submission_name(path, max_length):
+            with open(path, 'rb') as f:
+                named['content'] = f.read()
+            named['path'] = path
+            return "AI-Generated Image Title"
+
+        mock_analyser_class.return_value.analyse.return_value = mock_image_analysis_result
+        mock_claude_service_class.return_value.create_image_submission_name.side_effect = create_image_submission_name
+        mock_submission_class.return_value = mock_image_submission
+
+        request = api_factory.post('/api/analysis/image/', {'image': valid_image_file})
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_image(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_submission_class.call_args.kwargs['name'] == 'Image Analysis - image'
+        assert named['content'] == make_image_bytes()
+        assert not os.path.exists(named['path'])
+        mock_submission_class.objects.filter.assert_called_once_with(id=mock_image_submission.id)
+        mock_submission_class.objects.filter.return_value.update.assert_called_once_with(name="AI-Generated Image Title")
+
     def test_analyse_image_missing_image_field(self, api_factory, authenticated_user):
         """Test validation error when image field is missing."""
         request = api_factory.post('/api/analysis/image/', {'name': 'Test'})
@@ -392,6 +666,57 @@ class TestAnalysisViews:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'Unsupported file format' in response.data['error']
 
+    @pytest.mark.parametrize("file_name, content", [
+        ('corrupt.jpg', b"not an image"),
+        ('mislabelled.jpg', make_image_bytes('PNG')),
+        ('mislabelled.png', make_image_bytes('JPEG')),
+    ])
+    @patch('app.views.analysis_views.tempfile.NamedTemporaryFile')
+    def test_analyse_image_invalid_content(self, mock_temp_file, api_factory, authenticated_user, file_name, content):
+        """Test images whose header is unreadable or does not match the extension are rejected before analysis."""
+        invalid_file = SimpleUploadedFile(file_name, content, content_type="image/jpeg")
+
+        request = api_factory.post('/api/analysis/image/', {'image': invalid_file})
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_image(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == 'Invalid image file. Please upload a valid JPG, JPEG, or PNG image.'
+        mock_temp_file.assert_not_called()
+
+    @patch('app.views.analysis_views.AiImageAnalyser')
+    @patch('app.views.analysis_views.AiImageModel')
+    def test_analyse_image_accepts_multi_picture_jpeg(
+        self, mock_model_class, mock_analyser_class, api_factory, anonymous_user, mock_image_analysis_result
+    ):
+        """Test a JPEG carrying multi-picture data, which Pillow reports as MPO, is accepted as a .jpg upload."""
+        mock_analyser_class.return_value.analyse.return_value = mock_image_analysis_result
+        photo = SimpleUploadedFile("photo.jpg", make_image_bytes('MPO'), content_type="image/jpeg")
+
+        request = api_factory.post('/api/analysis/image/', {'image': photo})
+        force_authenticate(request, user=anonymous_user)
+
+        response = analyse_image(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_analyser_class.return_value.analyse.assert_called_once()
+
+    @patch('app.views.analysis_views.MAX_IMAGE_PIXELS', 100)
+    @patch('app.views.analysis_views.tempfile.NamedTemporaryFile')
+    def test_analyse_image_too_many_pixels(self, mock_temp_file, api_factory, authenticated_user):
+        """Test images with more pixels than allowed are rejected before analysis."""
+        large_image = SimpleUploadedFile("large.png", make_image_bytes('PNG', size=(20, 10)), content_type="image/png")
+
+        request = api_factory.post('/api/analysis/image/', {'image': large_image})
+        force_authenticate(request, user=authenticated_user)
+
+        response = analyse_image(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == 'Image dimensions too large. Maximum is 40 megapixels.'
+        mock_temp_file.assert_not_called()
+
     @patch('app.views.analysis_views.AiImageModel')
     def test_analyse_image_model_initialization_failure(
         self, mock_model_class, api_factory, authenticated_user, valid_image_file
@@ -162,7 +162,7 @@ class TestFeedbackViews:
         assert response.data['success'] is True
         assert response.data['message'] == 'Feedback submitted successfully'
         assert response.data['data'] == mock_feedback_data
-        assert response.data['error'] is None
+        assert 'error' not in response.data
         
         mock_service.assert_called_once_with(
             analysis_id=mock_analysis_id,
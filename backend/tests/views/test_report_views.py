@@ -2,6 +2,7 @@
 from unittest.mock import Mock, patch
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, force_authenticate
+from django.core.cache import cache
 from django.http import HttpResponse
 from datetime import datetime
 from app.views.report_views import (
@@ -23,6 +24,11 @@ class TestReportViews:
     :version: 28/09/2025
     """
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty cache, so cached analysis types do not leak between tests."""
+        cache.clear()
+
     @pytest.fixture
     def mock_user(self):
         """Create a mock authenticated user."""
@@ -59,6 +65,7 @@ class TestReportViews:
         """Create a mock submission with user ownership."""
         submission = Mock()
         submission.user = mock_user
+        submission.user_id = mock_user.id
         submission.id = uuid.uuid4()
         return submission
     
@@ -129,7 +136,9 @@ class TestReportViews:
         mock_image_get.side_effect = ImageAnalysisResult.DoesNotExist()
         
         mock_service_instance = Mock()
-        mock_service_instance.generate_analysis_report.return_value = mock_pdf_buffer
+        mock_service_instance.generate_analysis_report_to.side_effect = (
+            lambda stream, analysis, email: stream.write(mock_pdf_buffer.getvalue())
+        )
         mock_report_service.return_value = mock_service_instance
         
         request = api_factory.get(f'/api/reports/analysis/{mock_analysis_id}/download/')
@@ -142,6 +151,9 @@ class TestReportViews:
         assert 'attachment; filename=' in response['Content-Disposition']
         assert f'{mock_analysis_id}.pdf' in response['Content-Disposition']
         assert response.content == b'%PDF-1.4 mock pdf content'
+        mock_service_instance.generate_analysis_report_to.assert_called_once_with(
+            response, mock_text_analysis_result, mock_user.email
+        )
 
     @patch('app.views.report_views.ReportService')
     @patch('app.views.report_views.ImageAnalysisResult.objects.get')
@@ -155,7 +167,9 @@ class TestReportViews:
         mock_image_get.return_value = mock_image_analysis_result
         
         mock_service_instance = Mock()
-        mock_service_instance.generate_analysis_report.return_value = mock_pdf_buffer
+        mock_service_instance.generate_analysis_report_to.side_effect = (
+            lambda stream, analysis, email: stream.write(mock_pdf_buffer.getvalue())
+        )
         mock_report_service.return_value = mock_service_instance
         
         request = api_factory.get(f'/api/reports/analysis/{mock_analysis_id}/download/')
@@ -185,6 +199,33 @@ class TestReportViews:
         assert response.data['success'] is False
         assert 'not found' in response.data['error'].lower() or 'error' in response.data['error'].lower()
 
+    @patch('app.views.report_views.EmailService')
+    @patch('app.views.report_views.ReportService')
+    @patch('app.views.report_views.ImageAnalysisResult.objects.get')
+    @patch('app.views.report_views.TextAnalysisResult.objects.get')
+    def test_image_analysis_type_cached_between_requests(self, mock_text_get, mock_image_get, mock_report_service,
+                                                         mock_email_service, api_factory, mock_user,
+                                                         mock_analysis_id, mock_image_analysis_result):
+        """Test an image analysis is looked up in its own table only once its type is known."""
+        mock_text_get.side_effect = TextAnalysisResult.DoesNotExist()
+        mock_image_get.return_value = mock_image_analysis_result
+        mock_email_service.return_value.send_analysis_report.return_value = {
+            'success': True, 'recipient': mock_user.email
+        }
+
+        request = api_factory.get(f'/api/reports/analysis/{mock_analysis_id}/download/')
+        force_authenticate(request, user=mock_user)
+        download_report(request, mock_analysis_id)
+
+        request = api_factory.post(f'/api/reports/analysis/{mock_analysis_id}/email/')
+        force_authenticate(request, user=mock_user)
+        response = email_report(request, mock_analysis_id)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['message'] == 'Image analysis report sent successfully to your email'
+        mock_text_get.assert_called_once_with(id=mock_analysis_id)
+        assert mock_image_get.call_count == 2
+
     # ...existing ownership and exception tests...
 
     # Email Report Tests
@@ -259,6 +300,22 @@ class TestReportViews:
         # Be flexible with error message
         assert 'not found' in response.data['error'].lower() or 'error' in response.data['error'].lower()
 
+    @patch('app.views.report_views.ReportService')
+    @patch('app.views.report_views.TextAnalysisResult.objects.get')
+    def test_download_report_other_users_analysis(self, mock_text_get, mock_report_service, api_factory,
+                                                  mock_other_user, mock_analysis_id, mock_text_analysis_result):
+        """Test a report cannot be downloaded for another user's analysis."""
+        mock_text_get.return_value = mock_text_analysis_result
+
+        request = api_factory.get(f'/api/reports/analysis/{mock_analysis_id}/download/')
+        force_authenticate(request, user=mock_other_user)
+
+        response = download_report(request, mock_analysis_id)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        mock_text_analysis_result.load_submission_for_report.assert_called_once_with()
+        mock_report_service.assert_not_called()
+
     # Authentication and Edge Cases
     def test_report_views_require_authentication(self, api_factory, mock_analysis_id):
         """Test that report views require authentication."""
@@ -284,6 +341,7 @@ class TestReportViews:
         mock_user_no_name.is_authenticated = True
         
         mock_text_analysis_result.submission.user = mock_user_no_name
+        mock_text_analysis_result.submission.user_id = mock_user_no_name.id
         
         mock_text_get.return_value = mock_text_analysis_result
         mock_image_get.side_effect = ImageAnalysisResult.DoesNotExist()
@@ -7,9 +7,11 @@ from app.views.submission_history_views import (
     get_user_submissions,
     get_submission_detail,
     delete_submission,
+    delete_submissions,
     get_submission_statistics,
     create_json_response
 )
+from app.services.submission_history_service import SubmissionHistoryService
 import pytest
 import uuid
 
@@ -317,6 +319,93 @@ class TestSubmissionHistoryViews:
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert response.data['error'] == 'Database connection failed'
 
+    @pytest.mark.parametrize("body", [
+        {},
+        {'submission_ids': 'not-a-list'},
+        {'submission_ids': []},
+    ])
+    @patch('app.views.submission_history_views.SubmissionHistoryService.delete_submissions')
+    def test_delete_submissions_invalid_ids(self, mock_service, body, api_factory, mock_user):
+        """Test a missing, non-list or empty submission_ids is rejected before any deletion."""
+        request = api_factory.post('/api/submissions/delete/', body, format='json')
+        force_authenticate(request, user=mock_user)
+
+        response = delete_submissions(request)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['error'] == 'submission_ids must be a non-empty list'
+        mock_service.assert_not_called()
+
+    @patch('app.views.submission_history_views.SubmissionHistoryService.delete_submissions')
+    def test_delete_submissions_success(self, mock_service, api_factory, mock_user):
+        """Test successful deletion of several submissions."""
+        submission_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        mock_service.return_value = {
+            'success': True,
+            'deleted_count': 2,
+            'message': '2 submission(s) deleted successfully'
+        }
+
+        request = api_factory.post('/api/submissions/delete/', {'submission_ids': submission_ids}, format='json')
+        force_authenticate(request, user=mock_user)
+
+        response = delete_submissions(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['message'] == '2 submission(s) deleted successfully'
+        assert response.data['data'] == {'deleted_count': 2}
+        mock_service.assert_called_once_with(submission_ids=submission_ids, user=mock_user)
+
+    @patch('app.views.submission_history_views.SubmissionHistoryService.delete_submissions')
+    def test_delete_submissions_not_found(self, mock_service, api_factory, mock_user):
+        """Test deleting submissions that do not exist or belong to another user."""
+        mock_service.return_value = {
+            'success': False,
+            'error': 'No submissions found or you do not have permission to delete them'
+        }
+
+        request = api_factory.post('/api/submissions/delete/', {'submission_ids': [str(uuid.uuid4())]}, format='json')
+        force_authenticate(request, user=mock_user)
+
+        response = delete_submissions(request)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data['success'] is False
+
+    @patch('app.services.submission_history_service.ImageSubmission')
+    @patch('app.services.submission_history_service.transaction')
+    def test_delete_submissions_removes_images_on_commit(self, mock_transaction, mock_image_submission_class,
+                                                         api_factory, mock_user):
+        """Test the deleted submissions' images are removed in one storage call once the deletion commits."""
+        text_model, image_model = Mock(), Mock()
+        text_model._meta.label = 'app.TextSubmission'
+        image_model._meta.label = 'app.ImageSubmission'
+        text_model.objects.filter.return_value.delete.return_value = (1, {'app.TextSubmission': 1})
+        image_submissions = image_model.objects.filter.return_value
+        image_submissions.values_list.return_value = ['submissions/images/a.jpg', 'submissions/images/b.png']
+        image_submissions.delete.return_value = (2, {'app.ImageSubmission': 2})
+        storage = mock_image_submission_class._meta.get_field.return_value.storage
+        submission_ids = [str(uuid.uuid4()) for _ in range(3)]
+
+        request = api_factory.post('/api/submissions/delete/', {'submission_ids': submission_ids}, format='json')
+        force_authenticate(request, user=mock_user)
+
+        deletable_models = ((text_model, 'text', ()), (image_model, 'image', ('image',)))
+        with patch.object(SubmissionHistoryService, 'DELETABLE_MODELS', deletable_models):
+            response = delete_submissions(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['data'] == {'deleted_count': 3}
+        image_model.objects.filter.assert_called_once_with(id__in=submission_ids, user=mock_user)
+
+        # Nothing is removed from storage until the registered callback runs on commit.
+        mock_transaction.on_commit.assert_called_once()
+        storage.delete_many.assert_not_called()
+        on_commit_callback = mock_transaction.on_commit.call_args.args[0]
+        on_commit_callback()
+
+        storage.delete_many.assert_called_once_with(['submissions/images/a.jpg', 'submissions/images/b.png'])
+
     @patch('app.views.submission_history_views.SubmissionHistoryService.get_submission_statistics')
     def test_get_submission_statistics_success(self, mock_service, api_factory, mock_user, mock_statistics_data):
         """Test successful statistics retrieval."""